@@ -1,7 +1,8 @@
 import os
 import sys
+import tempfile
 from pathlib import Path
-from typing import Final
+from typing import Final, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -13,6 +14,7 @@ from rich.text import Text
 
 _MAX_THREAD_SUGGESTED: Final[int] = os.cpu_count() * 2 - 1 or 1
 _MAX_THREAD_SAFE: Final[int] = min(_MAX_THREAD_SUGGESTED * 4, 256)
+DEFAULT_SOCKET_PATH: Final[str] = os.path.join(tempfile.gettempdir(), "lawscript.sock")
 
 
 def get_working_directory() -> Path:
@@ -36,6 +38,7 @@ WORKING_DIR = get_working_directory()
 
 class Settings(BaseSettings):
     debug: bool = Field(default=False)
+    log_level: str = Field(default="TRACE")
     max_recursion_depth: int = Field(default=10_000)
     raw_postfix: str = Field(default="raw")
     compiled_postfix: str = Field(default="law")
@@ -55,6 +58,17 @@ class Settings(BaseSettings):
     step_task_size_to_sleep: int = Field(default=10)
     time_to_join_thread: float = Field(default=0)
     force_overwrite_module: bool = Field(default=False)
+    compile_workers: int = Field(default=1, ge=0)
+    check_workers: int = Field(default=1, ge=0)
+    module_cache: bool = Field(default=True)
+    batch_check_size: int = Field(default=10_000, ge=1)
+    procedure_criteria_cache_size: int = Field(default=1024, ge=0)
+    check_report_format: str = Field(default="rich")
+    check_report_path: Optional[str] = Field(default=None)
+    result_cache_path: Optional[str] = Field(default=None)
+    result_cache_max_entries: int = Field(default=100_000, ge=1)
+    serve_socket_path: str = Field(default=DEFAULT_SOCKET_PATH)
+    print_collection_limit: int = Field(default=0, ge=0)
     repl_title: str = Field(
         default="Язык написания контрактов: LawScript!\n\n"
                 "LawScript объединяет юридическую точность с вычислительной мощностью, "
@@ -68,6 +82,24 @@ class Settings(BaseSettings):
             raise ValueError("std_name не может быть пустой строкой")
         return value
 
+    @field_validator("log_level")
+    def validate_log_level(cls, value: str) -> str:
+        value = value.upper()
+
+        if value not in {"TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR"}:
+            raise ValueError("log_level должен быть одним из: TRACE, DEBUG, INFO, SUCCESS, WARNING, ERROR")
+
+        return value
+
+    @field_validator("check_report_format")
+    def validate_check_report_format(cls, value: str) -> str:
+        value = value.lower()
+
+        if value not in {"rich", "jsonl", "csv"}:
+            raise ValueError("check_report_format должен быть одним из: rich, jsonl, csv")
+
+        return value
+
     @field_validator("standard_lib_path_postfix")
     def validate_standard_lib_path_postfix(cls, value: str) -> str:
         if not value.strip():
@@ -120,7 +120,7 @@ class SyntaxHighlighter:
                     Tokens.only, Tokens.not_, Tokens.may, Tokens.be,
                     Tokens.and_, Tokens.or_, Tokens.bool_equal, Tokens.bool_not_equal,
                     Tokens.less, Tokens.greater, Tokens.between, Tokens.data,
-                    Tokens.procedure, Tokens.a_procedure,
+                    Tokens.procedure, Tokens.a_procedure, Tokens.pure,
                     Tokens.assign, Tokens.when, Tokens.then,
                     Tokens.else_, Tokens.loop, Tokens.from_, Tokens.to,
                     Tokens.while_, Tokens.return_, Tokens.true, Tokens.false,
@@ -1,4 +1,11 @@
 import sys
+
+if __name__ == '__main__' and sys.argv[1:2] == ['--client']:
+    # Клиент не должен платить за импорт ядра языка
+    from src.util.build_tools.daemon_client import main
+
+    sys.exit(main(sys.argv))
+
 import time
 from pathlib import Path
 
@@ -11,8 +18,11 @@ from src.core.types.execute_block import ExecuteBlock
 from src.core.util import kill_process, success_process, yellow_print
 from src.util.build_tools.build import build, generate_docs
 from src.util.build_tools.compile import Compiled
+from src.util.build_tools.daemon import is_daemon_supported, serve
 from src.util.console_worker import printer
-from src.util.build_tools.starter import run_file, compile_string, run_compiled_code
+from src.util.build_tools.starter import (
+    run_file, compile_string, run_compiled_code, run_batch_check, run_convert_facts
+)
 
 printer.debug = settings.debug
 
@@ -24,6 +34,9 @@ def create_absolute_path_to_file(filename: str) -> Path:
 
 class Law:
     def run(self):
+        if len(sys.argv) > 1 and sys.argv[1] == '--serve':
+            self.run_serve()
+
         start = time.perf_counter()
 
         try:
@@ -31,7 +44,10 @@ class Law:
                 self.run_interactive()
 
             if len(sys.argv) < 3:
-                kill_process("Используйте --build <название файла> или --run <название файла>")
+                kill_process(
+                    "Используйте --build <название файла> или --run <название файла>, "
+                    "--serve для запуска сервера или --client <команда> для запуска через сервер"
+                )
 
             command = sys.argv[1]
             filename = sys.argv[2]
@@ -51,8 +67,32 @@ class Law:
 
             elif command == '--run':
                 run_file(str(absolute_file_path))
+            elif command == '--check':
+                if len(sys.argv) < 5:
+                    kill_process(
+                        "Используйте --check <файл программы> <имя документа> "
+                        "<файл с фактами (.jsonl/.csv) или хранилище фактов> "
+                        "[файл результата]"
+                    )
+
+                output_path = None
+
+                if len(sys.argv) > 5:
+                    output_path = str(create_absolute_path_to_file(sys.argv[5]))
+
+                run_batch_check(
+                    str(absolute_file_path),
+                    sys.argv[3],
+                    str(create_absolute_path_to_file(sys.argv[4])),
+                    output_path
+                )
+            elif command == '--convert-facts':
+                if len(sys.argv) < 4:
+                    kill_process("Используйте --convert-facts <файл с фактами (.csv)> <папка хранилища фактов>")
+
+                run_convert_facts(str(absolute_file_path), str(create_absolute_path_to_file(sys.argv[3])))
             else:
-                kill_process("Неизвестная команда. Используйте --build или --run.")
+                kill_process("Неизвестная команда. Используйте --build, --run, --check или --convert-facts.")
 
         except BaseError as e:
             if settings.debug:
@@ -85,6 +125,15 @@ class Law:
             working_time = time.perf_counter() - start
             yellow_print(f"Затрачено времени: {working_time:.5f}s")
 
+    def run_serve(self):
+        if not is_daemon_supported():
+            kill_process("Режим сервера доступен только в системах с поддержкой fork и Unix-сокетов.")
+
+        try:
+            serve(settings.serve_socket_path, self.run)
+        except KeyboardInterrupt:
+            success_process("Сервер остановлен.")
+
     @staticmethod
     def run_interactive():
         printer.print_info(settings.repl_title)
@@ -0,0 +1,76 @@
+import time
+from statistics import mean
+
+from src.util.build_tools.starter import compile_string
+from src.util.console_worker import printer
+
+# Конфигурация тестирования
+TEST_RUNS = 5  # Количество запусков каждого режима
+PROCEDURES_COUNT = 300  # Количество процедур в сгенерированном исходнике
+
+
+def generate_code(count: int) -> str:
+    procedures = []
+
+    for i in range(count):
+        procedures.append(
+            f"""
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ проц_{i}(а, б) (
+        ЗАДАТЬ x = (а + б) * {i} - (а - б) / 2;
+        ЗАДАТЬ y = x ^ 2 + а И НЕ (x РАВНО 0) ИЛИ б БОЛЬШЕ а;
+        ЗАДАТЬ s = "строка номер {i}";
+        ЕСЛИ x МЕНЬШЕ 10 ТО (
+            ВЕРНУТЬ y;
+        )
+        ЦИКЛ i ОТ 0 ДО x (
+            y = y + i * 2;
+        )
+        ВЕРНУТЬ x + y;
+    )
+    """
+        )
+
+    return "\n".join(procedures)
+
+
+def eager_logging(message: str, *args, level: str = "INFO"):
+    """Эмуляция прежнего поведения: сообщение строится всегда, даже если отладка выключена."""
+    if args:
+        message = message % args
+
+    lazy_logging(message, level=level)
+
+
+lazy_logging = printer.logging
+raw_code = generate_code(PROCEDURES_COUNT)
+modes = {
+    "Ленивое логирование": lazy_logging,
+    "Форматирование до проверки": eager_logging,
+}
+results: dict[str, list[float]] = {name: [] for name in modes.keys()}
+
+printer.debug = False
+
+print(f"Компиляция {PROCEDURES_COUNT} процедур (каждый режим будет выполнен {TEST_RUNS} раз)...")
+
+for run in range(1, TEST_RUNS + 1):
+    print(f"\nЗапуск #{run}")
+
+    for name, logging_func in modes.items():
+        printer.logging = logging_func
+
+        st0 = time.perf_counter()
+        compile_string(raw_code)
+        execution_time = time.perf_counter() - st0
+
+        results[name].append(execution_time)
+        print(f"  {name}: {execution_time:.6f} сек")
+
+printer.logging = lazy_logging
+
+print("\nРезультаты тестирования:")
+print(f"{'Режим':<40} {'Среднее время':<15} {'Минимальное время':<15} {'Максимальное время':<15}")
+print("-" * 90)
+
+for name, times in results.items():
+    print(f"{name:<40} {mean(times):.6f} сек   {min(times):.6f} сек   {max(times):.6f} сек")
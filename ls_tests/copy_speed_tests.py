@@ -0,0 +1,78 @@
+import time
+from copy import deepcopy
+from statistics import mean
+
+from src.core.executors.procedure import ProcedureExecutor
+from src.core.types.variable import ScopeStack
+from src.util.build_tools.starter import compile_string
+
+# Конфигурация тестирования
+TEST_RUNS = 5  # Количество запусков каждого режима
+ITEMS_COUNT = 1_000  # Количество экземпляров в копируемом массиве
+
+code = """
+ВКЛЮЧИТЬ стандартная_библиотека.*
+
+
+ОПРЕДЕЛИТЬ КЛАСС Нарушение (
+    ОПРЕДЕЛИТЬ КОНСТРУКТОР (ссылка)(номер) (
+        ссылка:номер = номер;
+        ссылка:статьи = массив(1, 2, 3);
+        ссылка:детали = таблица(массив("описание"), массив("нарушение"));
+    )
+
+    ОПРЕДЕЛИТЬ МЕТОД (ссылка) описание() (
+        ЕСЛИ ссылка:номер БОЛЬШЕ 100 ТО (
+            ВЕРНУТЬ извлечь_из_таблицы(ссылка:детали, "описание");
+        )
+
+        ВЕРНУТЬ "";
+    )
+)
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ нарушения() (
+    ЗАДАТЬ результат = массив();
+
+    ЦИКЛ ОТ 1 ДО {count} (
+        добавить_в_массив(результат, Нарушение(1));
+    )
+
+    ВЕРНУТЬ результат;
+)
+""".format(count=ITEMS_COUNT)
+
+compiled = compile_string(code)
+procedure = compiled.compiled_code.get("нарушения")
+procedure.tree_variables = ScopeStack()
+records = ProcedureExecutor(procedure, compiled).execute()
+# Просто copy.deepcopy копирует вместе с экземплярами определение класса с телами методов
+# и падает на блокировках внутри него, поэтому для сравнения определение класса передаётся в memo
+class_definition = records[0].metadata
+
+modes = {
+    "copy.deepcopy": lambda: deepcopy(records, {id(class_definition): class_definition}),
+    "deepcopy_value": lambda: records.deepcopy_value({}),
+}
+
+results: dict[str, list[float]] = {name: [] for name in modes.keys()}
+
+print(f"Глубокое копирование {ITEMS_COUNT} экземпляров (каждый режим будет выполнен {TEST_RUNS} раз)...")
+
+for run in range(1, TEST_RUNS + 1):
+    print(f"\nЗапуск #{run}")
+
+    for name, operation in modes.items():
+        st0 = time.perf_counter()
+        operation()
+        execution_time = time.perf_counter() - st0
+
+        results[name].append(execution_time)
+        print(f"  {name}: {execution_time:.6f} сек")
+
+print("\nРезультаты тестирования:")
+print(f"{'Режим':<40} {'Среднее время':<15} {'Минимальное время':<15} {'Максимальное время':<15}")
+print("-" * 90)
+
+for name, times in results.items():
+    print(f"{name:<40} {mean(times):.6f} сек   {min(times):.6f} сек   {max(times):.6f} сек")
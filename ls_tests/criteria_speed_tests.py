@@ -0,0 +1,107 @@
+import random
+import time
+from statistics import mean
+
+from src.core.types import fact_columns
+from src.core.types.atomic import Number
+from src.core.types.fact_columns import FactColumns
+from src.util.build_tools.starter import compile_string
+
+# Конфигурация тестирования
+TEST_RUNS = 5  # Количество запусков каждого режима
+RECORDS_COUNT = 100_000  # Количество записей фактических данных
+
+code = """
+ОПРЕДЕЛИТЬ УСЛОВИЕ условие (
+    ОПИСАНИЕ Условие проверки,
+    КРИТЕРИИ (
+        ДОПУСТИМОЕ_ЗНАЧЕНИЕ МЕНЬШЕ 0.5,
+        МИНИМАЛЬНОЕ_ЗНАЧЕНИЕ БОЛЬШЕ 0.3,
+        СРЕДНЕЕ_ЗНАЧЕНИЕ МЕЖДУ 1 И 2,
+        КОД НЕ МОЖЕТ БЫТЬ 7,
+        КЛАСС ТОЛЬКО 3,
+    )
+)
+"""
+
+compiled = compile_string(code)
+condition = compiled.compiled_code.get("условие")
+numpy_module = fact_columns.np
+
+random.seed(0)
+records = [
+    {
+        "ДОПУСТИМОЕ_ЗНАЧЕНИЕ": Number(random.random()),
+        "МИНИМАЛЬНОЕ_ЗНАЧЕНИЕ": Number(random.random()),
+        "СРЕДНЕЕ_ЗНАЧЕНИЕ": Number(random.uniform(0, 3)),
+        "КОД": Number(random.randint(0, 10)),
+        "КЛАСС": Number(random.randint(0, 5)),
+    }
+    for _ in range(RECORDS_COUNT)
+]
+
+
+def scalar_check(_: FactColumns):
+    for record in records:
+        condition.execute(record, compiled)
+
+
+def all_criteria_check(_: FactColumns):
+    for record in records:
+        all(result.result for result in condition.execute(record, compiled).values())
+
+
+def predicate_check(_: FactColumns):
+    for record in records:
+        condition.is_satisfied(record, compiled)
+
+
+def python_columns_check(columns: FactColumns):
+    fact_columns.np = None
+
+    try:
+        condition.execute(columns, compiled)
+    finally:
+        fact_columns.np = numpy_module
+
+
+def numpy_columns_check(columns: FactColumns):
+    condition.execute(columns, compiled)
+
+
+modes = {
+    "Поштучная проверка": scalar_check,
+    "Поштучно, только итог через execute": all_criteria_check,
+    "Поштучно, сгенерированный предикат": predicate_check,
+    "Колонки, чистый Python": python_columns_check,
+}
+
+if numpy_module is not None:
+    modes["Колонки, NumPy"] = numpy_columns_check
+else:
+    print("NumPy не установлен, колоночная проверка через NumPy пропущена")
+
+results: dict[str, list[float]] = {name: [] for name in modes.keys()}
+
+print(f"Проверка {RECORDS_COUNT} записей (каждый режим будет выполнен {TEST_RUNS} раз)...")
+
+for run in range(1, TEST_RUNS + 1):
+    print(f"\nЗапуск #{run}")
+
+    for name, check in modes.items():
+        # Колонки собираются вне замера: здесь сравнивается только проверка критериев
+        columns = FactColumns.from_records(records)
+
+        st0 = time.perf_counter()
+        check(columns)
+        execution_time = time.perf_counter() - st0
+
+        results[name].append(execution_time)
+        print(f"  {name}: {execution_time:.6f} сек")
+
+print("\nРезультаты тестирования:")
+print(f"{'Режим':<40} {'Среднее время':<15} {'Минимальное время':<15} {'Максимальное время':<15}")
+print("-" * 90)
+
+for name, times in results.items():
+    print(f"{name:<40} {mean(times):.6f} сек   {min(times):.6f} сек   {max(times):.6f} сек")
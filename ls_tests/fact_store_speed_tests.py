@@ -0,0 +1,108 @@
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from src.core.executors.batch_checker import BatchChecker
+from src.util.build_tools.starter import compile_string
+from src.util.fact_sources import read_facts
+from src.util.fact_store import FactStore, convert_csv_to_store
+
+# Конфигурация тестирования
+RECORDS_COUNT = 200_000  # Количество записей фактических данных
+BATCH_SIZE = 10_000
+
+code = """
+ОПРЕДЕЛИТЬ САНКЦИЮ штраф (
+    СТАТЬЯ Статья 8.4 КоАП,
+)
+ОПРЕДЕЛИТЬ ПРАВО право (
+    ОПИСАНИЕ Описание права,
+)
+ОПРЕДЕЛИТЬ ОБЯЗАННОСТЬ обязанность (
+    ОПИСАНИЕ Описание обязанности,
+)
+ОПРЕДЕЛИТЬ ПРАВИЛО правило (
+    ОПИСАНИЕ Описание правила,
+)
+ОПРЕДЕЛИТЬ СУБЪЕКТ субъект (
+    ИМЯ Предприятие,
+)
+ОПРЕДЕЛИТЬ ОБЪЕКТ объект (
+    ИМЯ Водоём,
+)
+ОПРЕДЕЛИТЬ УСЛОВИЕ условие (
+    ОПИСАНИЕ Условие проверки,
+    КРИТЕРИИ (
+        ДОПУСТИМОЕ_ЗНАЧЕНИЕ МЕНЬШЕ 0.5,
+        СРЕДНЕЕ_ЗНАЧЕНИЕ МЕЖДУ 1 И 2,
+        КОД НЕ МОЖЕТ БЫТЬ 7,
+    )
+)
+СОЗДАТЬ ДОКУМЕНТ документ (
+    ДИСПОЗИЦИЯ (
+        ПРАВО право,
+        ОБЯЗАННОСТЬ обязанность,
+        ПРАВИЛО правило,
+    )
+    САНКЦИЯ (
+        ТИПЫ [штраф],
+        СТЕПЕНЬ СТРОГОСТИ ВЫСОКАЯ,
+        ПРОЦЕССУАЛЬНЫЙ АСПЕКТ Экспертиза,
+    )
+    ГИПОТЕЗА (
+        СУБЪЕКТ субъект,
+        ОБЪЕКТ объект,
+        УСЛОВИЕ условие,
+    )
+)
+"""
+
+compiled = compile_string(code)
+checker = BatchChecker(compiled.compiled_code.get("документ"), compiled, batch_size=BATCH_SIZE)
+
+
+def csv_check(path: str):
+    for _ in checker.check(read_facts(os.path.join(path, "facts.csv"))):
+        pass
+
+
+def store_check(path: str):
+    with FactStore(os.path.join(path, "store")) as store:
+        for _ in checker.check_store(store):
+            pass
+
+
+modes = {
+    "CSV построчно": csv_check,
+    "Хранилище фактов (mmap)": store_check,
+}
+
+with tempfile.TemporaryDirectory() as directory:
+    random.seed(0)
+
+    with open(os.path.join(directory, "facts.csv"), "w", encoding="utf-8") as file:
+        file.write("ДОПУСТИМОЕ_ЗНАЧЕНИЕ,СРЕДНЕЕ_ЗНАЧЕНИЕ,КОД,ЕДИНИЦА\n")
+
+        for _ in range(RECORDS_COUNT):
+            file.write(f"{random.random()},{random.uniform(0, 3)},{random.randint(0, 10)},мг/л\n")
+
+    st0 = time.perf_counter()
+    convert_csv_to_store(os.path.join(directory, "facts.csv"), os.path.join(directory, "store"))
+    print(f"Перевод {RECORDS_COUNT} записей в хранилище фактов: {time.perf_counter() - st0:.6f} сек")
+
+    print(f"\n{'Режим':<30} {'Время':<15} {'Пик памяти':<15}")
+    print("-" * 60)
+
+    for name, check in modes.items():
+        tracemalloc.start()
+
+        st0 = time.perf_counter()
+        check(directory)
+        execution_time = time.perf_counter() - st0
+
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{name:<30} {execution_time:.6f} сек   {peak / 2 ** 20:.1f} МБ")
@@ -0,0 +1,57 @@
+import time
+from statistics import mean
+
+from src.core.extend.standard_lib.lib_structs.lib import ArrayMap
+from src.core.types.atomic import Array, Number
+from src.util.build_tools.starter import compile_string
+
+# Конфигурация тестирования
+TEST_RUNS = 5  # Количество запусков каждого режима
+ARRAY_SIZE = 20_000  # Количество элементов массива
+
+code = """
+ВКЛЮЧИТЬ стандартная_библиотека.*
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ удвоить(х) (
+    ВЕРНУТЬ х * 2;
+)
+"""
+
+compiled = compile_string(code)
+procedure = compiled.compiled_code.get("удвоить")
+ArrayMap.namespace = compiled
+arr = Array([Number(i) for i in range(ARRAY_SIZE)])
+
+
+def run_procedure_per_item():
+    # Прежний способ: новый кадр вызова и связывание глобальных имён на каждый элемент
+    return Array([ArrayMap.run_procedure(procedure, [item]) for item in arr.value])
+
+
+modes = {
+    "run_procedure на каждый элемент": run_procedure_per_item,
+    "отобразить (общий кадр вызова)": lambda: ArrayMap.call([arr, procedure]),
+}
+
+results: dict[str, list[float]] = {name: [] for name in modes.keys()}
+
+print(f"Обход массива из {ARRAY_SIZE} элементов (каждый режим будет выполнен {TEST_RUNS} раз)...")
+
+for run in range(1, TEST_RUNS + 1):
+    print(f"\nЗапуск #{run}")
+
+    for name, operation in modes.items():
+        st0 = time.perf_counter()
+        operation()
+        execution_time = time.perf_counter() - st0
+
+        results[name].append(execution_time)
+        print(f"  {name}: {execution_time:.6f} сек")
+
+print("\nРезультаты тестирования:")
+print(f"{'Режим':<40} {'Среднее время':<15} {'Минимальное время':<15} {'Максимальное время':<15}")
+print("-" * 90)
+
+for name, times in results.items():
+    print(f"{name:<40} {mean(times):.6f} сек   {min(times):.6f} сек   {max(times):.6f} сек")
@@ -0,0 +1,73 @@
+import time
+import tracemalloc
+
+from src.core.extend.standard_lib.lib_structs.lib import ArrayFilter, ArrayInit, ArrayMap, ArrayReduce, Range
+from src.core.types.atomic import Number
+from src.util.build_tools.starter import compile_string
+
+# Конфигурация тестирования
+ITEMS_COUNT = 20_000  # Количество элементов в конвейере
+
+code = """
+ВКЛЮЧИТЬ стандартная_библиотека.*
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ удвоить(х) (
+    ВЕРНУТЬ х * 2;
+)
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ больше_ста(х) (
+    ВЕРНУТЬ х БОЛЬШЕ 100;
+)
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ сложить(а, б) (
+    ВЕРНУТЬ а + б;
+)
+"""
+
+compiled = compile_string(code)
+double, more_than_hundred, add = (compiled.compiled_code.get(name) for name in ("удвоить", "больше_ста", "сложить"))
+
+for procedure in (ArrayMap, ArrayFilter, ArrayReduce):
+    procedure.namespace = compiled
+
+
+def pipeline(items):
+    mapped = ArrayMap.call([items, double])
+    filtered = ArrayFilter.call([mapped, more_than_hundred])
+
+    return ArrayReduce.call([filtered, add, Number(0)])
+
+
+def array_pipeline():
+    # Каждый шаг конвейера строит новый массив целиком
+    return pipeline(ArrayInit.call([Number(i) for i in range(1, ITEMS_COUNT + 1)]))
+
+
+def lazy_pipeline():
+    # Элементы проходят конвейер по одному
+    return pipeline(Range.call([Number(1), Number(ITEMS_COUNT)]))
+
+
+modes = {
+    "Массивы": array_pipeline,
+    "Ленивая последовательность": lazy_pipeline,
+}
+
+print(f"Конвейер отобразить -> отфильтровать -> свернуть над {ITEMS_COUNT} элементами...")
+print(f"\n{'Режим':<30} {'Время':<15} {'Пик памяти':<15} {'Результат':<15}")
+print("-" * 75)
+
+for name, operation in modes.items():
+    tracemalloc.start()
+
+    st0 = time.perf_counter()
+    result = operation()
+    execution_time = time.perf_counter() - st0
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<30} {execution_time:.6f} сек   {peak / 2 ** 20:.1f} МБ   {result}")
@@ -0,0 +1,70 @@
+import operator
+import random
+import time
+import tracemalloc
+from statistics import mean
+
+from src.core.extend.standard_lib.lib_structs.lib import ArraySort, ArraySum
+from src.core.types.atomic import Array, Number, NumericArray
+
+# Конфигурация тестирования
+TEST_RUNS = 5  # Количество запусков каждого режима
+ARRAY_SIZE = 1_000_000  # Количество элементов массива
+
+random.seed(0)
+values = [random.random() for _ in range(ARRAY_SIZE)]
+
+
+def build_array():
+    return Array([Number(value) for value in values])
+
+
+def build_numeric_array():
+    return NumericArray(values)
+
+
+def measure_memory(build) -> float:
+    tracemalloc.start()
+    arr = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del arr
+
+    return peak / 2 ** 20
+
+
+boxed = build_array()
+numeric = build_numeric_array()
+
+modes = {
+    "Сумма, Массив": lambda: ArraySum.call([boxed]),
+    "Сумма, Числовой массив": lambda: ArraySum.call([numeric]),
+    "Сортировка, Массив": lambda: ArraySort.call([Array(list(boxed.value))]),
+    "Сортировка, Числовой массив": lambda: ArraySort.call([NumericArray(numeric.buffer[:])]),
+    "Умножение на число, Массив": lambda: Array([Number(item.value * 2) for item in boxed.value]),
+    "Умножение на число, Числовой массив": lambda: numeric.elementwise(operator.mul, Number(2)),
+}
+
+results: dict[str, list[float]] = {name: [] for name in modes.keys()}
+
+print(f"Память на {ARRAY_SIZE} элементов: Массив {measure_memory(build_array):.1f} МБ, "
+      f"Числовой массив {measure_memory(build_numeric_array):.1f} МБ")
+print(f"Операции над {ARRAY_SIZE} элементами (каждый режим будет выполнен {TEST_RUNS} раз)...")
+
+for run in range(1, TEST_RUNS + 1):
+    print(f"\nЗапуск #{run}")
+
+    for name, operation in modes.items():
+        st0 = time.perf_counter()
+        operation()
+        execution_time = time.perf_counter() - st0
+
+        results[name].append(execution_time)
+        print(f"  {name}: {execution_time:.6f} сек")
+
+print("\nРезультаты тестирования:")
+print(f"{'Режим':<40} {'Среднее время':<15} {'Минимальное время':<15} {'Максимальное время':<15}")
+print("-" * 90)
+
+for name, times in results.items():
+    print(f"{name:<40} {mean(times):.6f} сек   {min(times):.6f} сек   {max(times):.6f} сек")
@@ -0,0 +1,47 @@
+import time
+from statistics import mean
+
+from src.core.types.atomic import Array, Boolean, Number, String, Table, render
+
+# Конфигурация тестирования
+TEST_RUNS = 5  # Количество запусков каждого режима
+RECORDS_COUNT = 100_000  # Количество записей в таблице результатов
+PRINT_LIMIT = 20  # Ограничение вывода элементов коллекции
+
+results_table = Table({
+    String(f"документ_{i}"): Array([Number(i), String("нарушение"), Boolean(i % 2 == 0)])
+    for i in range(RECORDS_COUNT)
+})
+
+deep = Array([])
+
+for _ in range(RECORDS_COUNT):
+    deep = Array([deep, Number(1)])
+
+modes = {
+    "Таблица результатов целиком": lambda: render(results_table),
+    f"Таблица результатов, первые {PRINT_LIMIT}": lambda: render(results_table, PRINT_LIMIT),
+    f"Вложенность {RECORDS_COUNT} уровней": lambda: render(deep),
+}
+
+results: dict[str, list[float]] = {name: [] for name in modes.keys()}
+
+print(f"Вывод коллекций из {RECORDS_COUNT} элементов (каждый режим будет выполнен {TEST_RUNS} раз)...")
+
+for run in range(1, TEST_RUNS + 1):
+    print(f"\nЗапуск #{run}")
+
+    for name, operation in modes.items():
+        st0 = time.perf_counter()
+        operation()
+        execution_time = time.perf_counter() - st0
+
+        results[name].append(execution_time)
+        print(f"  {name}: {execution_time:.6f} сек")
+
+print("\nРезультаты тестирования:")
+print(f"{'Режим':<45} {'Среднее время':<15} {'Минимальное время':<15} {'Максимальное время':<15}")
+print("-" * 95)
+
+for name, times in results.items():
+    print(f"{name:<45} {mean(times):.6f} сек   {min(times):.6f} сек   {max(times):.6f} сек")
@@ -0,0 +1,68 @@
+import time
+from statistics import mean
+
+from src.core.extend.standard_lib.lib_structs.lib import IsKeyTableExist, SetInit, TableAppend
+from src.core.types.atomic import Array, Boolean, String, Table
+
+# Конфигурация тестирования
+TEST_RUNS = 5  # Количество запусков каждого режима
+ITEMS_COUNT = 5_000  # Количество записей, среди которых есть повторы
+
+records = [String(f"нарушение_{i % (ITEMS_COUNT // 2)}") for i in range(ITEMS_COUNT)]
+
+
+def array_scan():
+    # Проверка повтора линейным поиском по массиву
+    unique = Array([])
+
+    for record in records:
+        if record not in unique.value:
+            unique.value.append(record)
+
+    return len(unique)
+
+
+def table_with_dummy_values():
+    # Таблица, в которой значения не нужны, а важны только ключи
+    unique = Table()
+
+    for record in records:
+        if not IsKeyTableExist.call([unique, record]).value:
+            TableAppend.call([unique, record, Boolean(True)])
+
+    return len(unique)
+
+
+def native_set():
+    unique = SetInit.call([Array(records)])
+
+    return unique.get_attribute("длина").call().value
+
+
+modes = {
+    "Массив и линейный поиск": array_scan,
+    "Таблица с пустыми значениями": table_with_dummy_values,
+    "Множество": native_set,
+}
+
+results: dict[str, list[float]] = {name: [] for name in modes.keys()}
+
+print(f"Удаление повторов из {ITEMS_COUNT} записей (каждый режим будет выполнен {TEST_RUNS} раз)...")
+
+for run in range(1, TEST_RUNS + 1):
+    print(f"\nЗапуск #{run}")
+
+    for name, operation in modes.items():
+        st0 = time.perf_counter()
+        operation()
+        execution_time = time.perf_counter() - st0
+
+        results[name].append(execution_time)
+        print(f"  {name}: {execution_time:.6f} сек")
+
+print("\nРезультаты тестирования:")
+print(f"{'Режим':<40} {'Среднее время':<15} {'Минимальное время':<15} {'Максимальное время':<15}")
+print("-" * 90)
+
+for name, times in results.items():
+    print(f"{name:<40} {mean(times):.6f} сек   {min(times):.6f} сек   {max(times):.6f} сек")
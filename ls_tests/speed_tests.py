@@ -37,6 +37,25 @@ cases = {
         НАПЕЧАТАТЬ результат;
     )
 
+    ВЫПОЛНИТЬ (
+        сум();
+    )
+    """,
+    "Поиск суммы, ДЛЯ КАЖДОГО":
+        f"""
+    ВКЛЮЧИТЬ {PATH_TO_LIB}
+
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ сум() (
+        ЗАДАТЬ результат = 0;
+        ЗАДАТЬ массив_чисел = массив({", ".join(ARR)});
+
+        ДЛЯ КАЖДОГО число ИЗ массив_чисел (
+            результат = (результат + число) * 2 + 100;
+        )
+
+        НАПЕЧАТАТЬ результат;
+    )
+
     ВЫПОЛНИТЬ (
         сум();
     )
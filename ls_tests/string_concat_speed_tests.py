@@ -0,0 +1,69 @@
+import time
+from statistics import mean
+
+from src.core.extend.standard_lib.lib_str.structures import NativeStringBuilder
+from src.core.types.atomic import String
+
+# Конфигурация тестирования
+TEST_RUNS = 3  # Количество запусков каждого режима
+PARTS_COUNT = 20_000  # Количество склеиваемых частей
+
+parts = [String(f"строка отчёта номер {i}\n") for i in range(PARTS_COUNT)]
+
+
+def copy_concat():
+    # Прежний способ: каждая склейка копирует всю строку
+    report = String("")
+
+    for part in parts:
+        report = String(report.value + part.value)
+
+    return report.value
+
+
+def rope_concat():
+    report = String("")
+
+    for part in parts:
+        report = String(report.add(part))
+
+    return report.value
+
+
+def string_builder():
+    builder = NativeStringBuilder.create([])
+    append = builder.get_attribute("добавить")
+
+    for part in parts:
+        append.call([part])
+
+    return builder.get_attribute("в_строку").call().value
+
+
+modes = {
+    "Склейка с копированием": copy_concat,
+    "Склейка через буфер частей": rope_concat,
+    "СтроковыйБуфер": string_builder,
+}
+
+results: dict[str, list[float]] = {name: [] for name in modes.keys()}
+
+print(f"Сборка строки из {PARTS_COUNT} частей (каждый режим будет выполнен {TEST_RUNS} раз)...")
+
+for run in range(1, TEST_RUNS + 1):
+    print(f"\nЗапуск #{run}")
+
+    for name, operation in modes.items():
+        st0 = time.perf_counter()
+        operation()
+        execution_time = time.perf_counter() - st0
+
+        results[name].append(execution_time)
+        print(f"  {name}: {execution_time:.6f} сек")
+
+print("\nРезультаты тестирования:")
+print(f"{'Режим':<40} {'Среднее время':<15} {'Минимальное время':<15} {'Максимальное время':<15}")
+print("-" * 90)
+
+for name, times in results.items():
+    print(f"{name:<40} {mean(times):.6f} сек   {min(times):.6f} сек   {max(times):.6f} сек")
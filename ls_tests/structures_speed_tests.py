@@ -0,0 +1,125 @@
+import time
+from statistics import mean
+
+from src.core.executors.procedure import ProcedureExecutor
+from src.core.types.variable import ScopeStack
+from src.util.build_tools.starter import compile_string
+
+# Конфигурация тестирования
+TEST_RUNS = 5  # Количество запусков каждого режима
+ITEMS_COUNT = 10_000  # Количество операций над структурой
+
+# Прежняя реализация Списка и Очереди на LawScript, для сравнения
+code = """
+ВКЛЮЧИТЬ стандартная_библиотека.*
+
+
+ОПРЕДЕЛИТЬ КЛАСС СтарыйСписок (
+    ОПРЕДЕЛИТЬ КОНСТРУКТОР (ссылка)(мас=массив()) (
+        ссылка:_массив = мас;
+    )
+
+    ОПРЕДЕЛИТЬ МЕТОД (ссылка) длина() (
+        ВЕРНУТЬ длина_массива(ссылка:_массив);
+    )
+
+    ОПРЕДЕЛИТЬ МЕТОД (ссылка) добавить(элемент) (
+        ВЕРНУТЬ добавить_в_массив(ссылка:_массив, элемент);
+    )
+)
+
+ОПРЕДЕЛИТЬ КЛАСС СтараяОчередь (
+    ОПРЕДЕЛИТЬ КОНСТРУКТОР (ссылка)(размер) (
+        ссылка:_максимум = размер;
+        ссылка:_массив = массив();
+    )
+
+    ОПРЕДЕЛИТЬ МЕТОД (ссылка) переполнена() (
+        БЛОКИРОВАТЬ (
+            ВЕРНУТЬ длина_массива(ссылка:_массив) БОЛЬШЕ ссылка:_максимум - 1;
+        )
+    )
+
+    ОПРЕДЕЛИТЬ МЕТОД (ссылка) положить(элемент) (
+        БЛОКИРОВАТЬ (
+            ЕСЛИ ссылка:переполнена() ТО (
+                ОШИБКА ОшибкаОчереди;
+            )
+
+            добавить_в_массив(ссылка:_массив, элемент);
+        )
+    )
+)
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ старый_список() (
+    ЗАДАТЬ с = СтарыйСписок();
+
+    ЦИКЛ ОТ 1 ДО {count} (
+        с:добавить(1);
+    )
+)
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ список() (
+    ЗАДАТЬ с = Список();
+
+    ЦИКЛ ОТ 1 ДО {count} (
+        с:добавить(1);
+    )
+)
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ старая_очередь() (
+    ЗАДАТЬ о = СтараяОчередь({count});
+
+    ЦИКЛ ОТ 1 ДО {count} (
+        о:положить(1);
+    )
+)
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ очередь() (
+    ЗАДАТЬ о = Очередь({count});
+
+    ЦИКЛ ОТ 1 ДО {count} (
+        о:положить(1);
+    )
+)
+""".format(count=ITEMS_COUNT)
+
+compiled = compile_string(code)
+
+
+def run(name: str):
+    procedure = compiled.compiled_code.get(name)
+    procedure.tree_variables = ScopeStack()
+
+    ProcedureExecutor(procedure, compiled).execute()
+
+
+modes = {
+    "Список, класс LawScript": "старый_список",
+    "Список, встроенный": "список",
+    "Очередь, класс LawScript": "старая_очередь",
+    "Очередь, встроенная": "очередь",
+}
+
+results: dict[str, list[float]] = {name: [] for name in modes.keys()}
+
+print(f"{ITEMS_COUNT} добавлений в структуру (каждый режим будет выполнен {TEST_RUNS} раз)...")
+
+for run_num in range(1, TEST_RUNS + 1):
+    print(f"\nЗапуск #{run_num}")
+
+    for name, procedure_name in modes.items():
+        st0 = time.perf_counter()
+        run(procedure_name)
+        execution_time = time.perf_counter() - st0
+
+        results[name].append(execution_time)
+        print(f"  {name}: {execution_time:.6f} сек")
+
+print("\nРезультаты тестирования:")
+print(f"{'Режим':<40} {'Среднее время':<15} {'Минимальное время':<15} {'Максимальное время':<15}")
+print("-" * 90)
+
+for name, times in results.items():
+    print(f"{name:<40} {mean(times):.6f} сек   {min(times):.6f} сек   {max(times):.6f} сек")
@@ -0,0 +1,77 @@
+import time
+from statistics import mean
+
+from src.core.extend.standard_lib.lib_structs.lib import TableAppend, TableGetValue, IsKeyTableExist
+from src.core.types.atomic import Number, String, Table
+
+# Конфигурация тестирования
+TEST_RUNS = 5  # Количество запусков каждого режима
+KEYS_COUNT = 100_000  # Количество ключей в таблице
+
+keys = [String(f"ключ_{i}") for i in range(KEYS_COUNT)]
+values = [Number(i) for i in range(KEYS_COUNT)]
+
+
+def wrapped_keys():
+    # Прежний способ: ключи таблицы - обёртки String, поиск идёт через String.__hash__ и String.__eq__
+    table = {}
+
+    for key, value in zip(keys, values):
+        table[key] = value
+
+    for key in keys:
+        if key in table:
+            table[key]
+
+
+def raw_keys():
+    table = Table()
+
+    for key, value in zip(keys, values):
+        table.value[key.value] = value
+
+    for key in keys:
+        try:
+            table.value[key.value]
+        except KeyError:
+            pass
+
+
+def library_calls():
+    table = Table()
+
+    for key, value in zip(keys, values):
+        TableAppend.call([table, key, value])
+
+    for key in keys:
+        if IsKeyTableExist.call([table, key]).value:
+            TableGetValue.call([table, key])
+
+
+modes = {
+    "Ключи-обёртки String": wrapped_keys,
+    "Ключи без обёрток": raw_keys,
+    "Функции библиотеки": library_calls,
+}
+
+results: dict[str, list[float]] = {name: [] for name in modes.keys()}
+
+print(f"Добавление и поиск {KEYS_COUNT} ключей (каждый режим будет выполнен {TEST_RUNS} раз)...")
+
+for run in range(1, TEST_RUNS + 1):
+    print(f"\nЗапуск #{run}")
+
+    for name, operation in modes.items():
+        st0 = time.perf_counter()
+        operation()
+        execution_time = time.perf_counter() - st0
+
+        results[name].append(execution_time)
+        print(f"  {name}: {execution_time:.6f} сек")
+
+print("\nРезультаты тестирования:")
+print(f"{'Режим':<40} {'Среднее время':<15} {'Минимальное время':<15} {'Максимальное время':<15}")
+print("-" * 90)
+
+for name, times in results.items():
+    print(f"{name:<40} {mean(times):.6f} сек   {min(times):.6f} сек   {max(times):.6f} сек")
@@ -32,7 +32,7 @@ class ThreadWorker:
     def start(self):
         self.thread = Thread(target=self._work, daemon=True)
         self.thread.start()
-        printer.logging(f"{self.thread=} Запущен")
+        printer.logging("self.thread=%r Запущен", self.thread)
 
     def stop(self):
         self._stop_event.set()
@@ -49,7 +49,7 @@ class ThreadWorker:
         if self.thread:
             self.thread.join(timeout=settings.time_to_join_thread)
 
-        printer.logging(f"{self.thread=} Остановлен")
+        printer.logging("self.thread=%r Остановлен", self.thread)
 
     def is_active(self):
         return self._is_active
@@ -58,7 +58,7 @@ class ThreadWorker:
         with _GLOBAL_TASKS_LOCK:
             task.done = True
             self.tasks.remove(task)
-            printer.logging(f"{self.thread=} Завершил задачу {task.name=} {task.id=}")
+            printer.logging("self.thread=%r Завершил задачу task.name=%r task.id=%r", self.thread, task.name, task.id)
 
     def _work(self):
         while not self._stop_event.is_set():
@@ -66,11 +66,14 @@ class ThreadWorker:
             elapsed = current_time - self._start_time
 
             if not self.tasks:
-                printer.logging(f"{self.thread=} Голоден. Попытка получить задачу...")
+                printer.logging("self.thread=%r Голоден. Попытка получить задачу...", self.thread)
                 task = self._scheduler.get_free_task()
 
                 if task is not None:
-                    printer.logging(f"{self.thread=} Забрал задачу {task.name=} {task.id=}")
+                    printer.logging(
+                        "self.thread=%r Забрал задачу task.name=%r task.id=%r",
+                        self.thread, task.name, task.id
+                    )
                     self.add_task(task)
                 else:
                     time.sleep(settings.ttl_check_free_tasks)
@@ -80,7 +83,7 @@ class ThreadWorker:
                     self._is_active = False
                 self._stop_event.set()
                 printer.logging(
-                    f"{self.thread=} Нет задач, работа завершена по таймауту: {settings.ttl_thread}"
+                    "self.thread=%r Нет задач, работа завершена по таймауту: %s", self.thread, settings.ttl_thread
                 )
                 break
 
@@ -148,7 +151,10 @@ class TaskScheduler:
                         if task.is_active:
                             continue
 
-                        printer.logging(f"{worker.thread=} Отдал задачу {task.name=} {task.id=}")
+                        printer.logging(
+                            "worker.thread=%r Отдал задачу task.name=%r task.id=%r",
+                            worker.thread, task.name, task.id
+                        )
                         return worker.tasks.pop(idx)
 
         return None
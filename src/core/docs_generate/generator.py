@@ -9,7 +9,7 @@ from src.core.types.documents import Document, FactSituation
 from src.core.types.laws import Law
 from src.core.types.objects import Object
 from src.core.types.obligations import Obligation
-from src.core.types.procedure import Procedure, CodeBlock, Body, When, Else, ElseWhen, Loop, While
+from src.core.types.procedure import Procedure, CodeBlock, Body, When, Else, ElseWhen, Loop, While, ForEach
 from src.core.types.rules import Rule
 from src.core.types.sanction_types import SanctionType
 from src.core.types.subjects import Subject
@@ -134,7 +134,8 @@ class DocsGenerator:
             ElseWhen: "Иначе если",
             Else: "Иначе",
             Loop: "Цикл со счетчиком",
-            While: "Цикл с условием"
+            While: "Цикл с условием",
+            ForEach: "Цикл по элементам"
         }
         blocks = [
             {
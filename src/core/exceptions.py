@@ -525,6 +525,42 @@ class FileError(BaseError):
         super().__init__(msg, info=info)
 
 
+@_add_ex
+class QueueError(BaseError):
+    exc_name = "ОшибкаОчереди"
+
+    def __init__(self, msg: Optional[str] = None, info: Optional[Info] = None):
+        if msg is None:
+            msg = "Ошибка очереди"
+
+        super().__init__(msg, info=info)
+
+
+@_add_ex
+class QueueFullError(QueueError):
+    exc_name = "ОчередьПолна"
+
+    def __init__(self, size: Optional[int] = None, msg: Optional[str] = None, info: Optional[Info] = None):
+        if msg is None:
+            msg = "Очередь переполнена!"
+
+            if size is not None:
+                msg = f"{msg} Максимальный размер очереди: {size}"
+
+        super().__init__(msg, info=info)
+
+
+@_add_ex
+class QueueEmptyError(QueueError):
+    exc_name = "ОчередьПуста"
+
+    def __init__(self, msg: Optional[str] = None, info: Optional[Info] = None):
+        if msg is None:
+            msg = "Очередь пуста!"
+
+        super().__init__(msg, info=info)
+
+
 @_add_ex
 class OperationError(BaseError):
     exc_name = "ОшибкаОперации"
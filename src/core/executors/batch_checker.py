@@ -0,0 +1,115 @@
+from itertools import islice
+from typing import Iterable, Iterator, NamedTuple, Optional, TYPE_CHECKING
+
+from config import settings
+from src.core.types.basetype import BaseAtomicType
+from src.core.types.conditions import Modify
+from src.core.types.documents import Document
+from src.core.types.fact_columns import FactColumns, MISSING
+from src.util.result_cache import check_key, criteria_fingerprint, get_result_cache
+
+if TYPE_CHECKING:
+    from src.util.build_tools.compile import Compiled
+    from src.util.fact_store import FactStore
+
+
+class BatchRecordResult(NamedTuple):
+    index: int
+    facts: dict[str, BaseAtomicType]
+    # None - значение есть, но его тип не сравним с критерием
+    criteria: dict[str, Optional[bool]]
+    # Критерии с процедурой в том виде, в каком они вычислены для этой записи
+    modify: Optional[dict[str, Modify]] = None
+
+    @property
+    def passed(self) -> bool:
+        return all(result is True for result in self.criteria.values())
+
+
+# Результаты критериев записи и вычисленные для неё критерии с процедурой
+CheckedRecord = tuple[dict[str, Optional[bool]], dict[str, Modify]]
+
+
+class BatchChecker:
+    """Проверяет поток записей фактических данных по критериям одного документа, пачками по колонкам."""
+    def __init__(self, document: Document, compiled: "Compiled", batch_size: Optional[int] = None):
+        self.document = document
+        self.condition = document.hypothesis.condition
+        self.compiled = compiled
+        self.batch_size = batch_size or settings.batch_check_size
+        self.fingerprint, self.uncached = criteria_fingerprint(self.condition)
+
+    def _check_records(self, records: list[dict[str, BaseAtomicType]]) -> list[CheckedRecord]:
+        if not records:
+            return []
+
+        return self._check_columns(FactColumns.from_records(records))
+
+    def _check_columns(self, columns: FactColumns) -> list[CheckedRecord]:
+        resolved_modify: dict[str, list[Optional[Modify]]] = {}
+        column_results = self.condition.execute_columns(columns, self.compiled, resolved_modify)
+        results = []
+
+        for index in range(len(columns)):
+            criteria = {}
+
+            for name_criteria, column_result in column_results.items():
+                if columns.column(name_criteria)[index] is MISSING:
+                    continue
+
+                criteria[name_criteria] = column_result[index]
+
+            modify = {
+                name_criteria: resolved_column[index]
+                for name_criteria, resolved_column in resolved_modify.items()
+                if resolved_column[index] is not None
+            }
+
+            results.append((criteria, modify))
+
+        return results
+
+    def check_batch(self, records: list[dict[str, BaseAtomicType]], offset: int = 0) -> list[BatchRecordResult]:
+        result_cache = get_result_cache()
+
+        if result_cache is None:
+            return [
+                BatchRecordResult(offset + index, record, criteria, modify)
+                for index, (record, (criteria, modify)) in enumerate(zip(records, self._check_records(records)))
+            ]
+
+        keys = [check_key(self.fingerprint, self.uncached, self.condition, record) for record in records]
+        cached = result_cache.get_many(key for key in keys if key is not None)
+        # Проверяются только записи, которых нет в кэше, одной пачкой колонок
+        missed = [index for index, key in enumerate(keys) if key not in cached]
+        checked = dict(zip(missed, self._check_records([records[index] for index in missed])))
+
+        result_cache.put_many(
+            (keys[index], criteria) for index, (criteria, _) in checked.items() if keys[index] is not None
+        )
+
+        # Записи с фактами по процедурам не кэшируются, поэтому у найденных в кэше вычисленных критериев нет
+        return [
+            BatchRecordResult(offset + index, record, *checked[index])
+            if index in checked else BatchRecordResult(offset + index, record, cached[keys[index]])
+            for index, record in enumerate(records)
+        ]
+
+    def check(self, records: Iterable[dict[str, BaseAtomicType]]) -> Iterator[BatchRecordResult]:
+        records = iter(records)
+        offset = 0
+
+        while batch := list(islice(records, self.batch_size)):
+            yield from self.check_batch(batch, offset)
+            offset += len(batch)
+
+    def check_store(self, store: "FactStore") -> Iterator[BatchRecordResult]:
+        """Проверяет колоночное хранилище фактов: критерии читают колонки прямо из файлов."""
+        for offset, columns in store.batches(self.batch_size):
+            if get_result_cache() is not None:
+                # Ключам кэша нужны значения записей целиком
+                yield from self.check_batch([columns.record(index) for index in range(len(columns))], offset)
+                continue
+
+            for index, (criteria, modify) in enumerate(self._check_columns(columns)):
+                yield BatchRecordResult(offset + index, columns.record(index), criteria, modify)
@@ -1,5 +1,6 @@
-from typing import TYPE_CHECKING, Union, Generator, Final
+from typing import TYPE_CHECKING, Union, Generator, Final, NamedTuple
 
+from config import settings
 from src.core.exceptions import (
     ErrorType,
     NameNotDefine,
@@ -11,7 +12,7 @@ from src.core.exceptions import (
 )
 from src.core.executors.expression import ExpressionExecutor
 from src.core.tokens import Tokens
-from src.core.types.atomic import Number, YIELD
+from src.core.types.atomic import Array, LazySequence, Number, Table, VOID, YIELD, render
 from src.core.types.base_declarative_type import BaseDeclarativeType
 from src.core.types.basetype import BaseAtomicType
 from src.core.types.classes import ClassDefinition, ClassField, ClassExceptionDefinition, ClassInstance
@@ -31,7 +32,9 @@ from src.core.types.procedure import (
     Context,
     BlockSync,
     ErrorThrow,
-    Defer
+    Defer,
+    ForEach,
+    YieldValue,
 )
 from src.core.executors.base import Executor
 from src.core.types.variable import Variable, ScopeStack, VariableContextCreator, traverse_scope
@@ -48,12 +51,20 @@ class Stop: ...
 STOP: Final[Stop] = Stop()
 
 
+class Produced(NamedTuple):
+    """Значение, отданное генераторной процедурой через ОТДАТЬ."""
+    value: BaseAtomicType
+
+
 class BodyExecutor(Executor):
-    def __init__(self, body: Body, tree_variables: ScopeStack, compiled: "Compiled"):
+    def __init__(self, body: Body, tree_variables: ScopeStack, compiled: "Compiled", bind_globals: bool = True):
         self.body = body
         self.tree_variables = tree_variables
         self.compiled = compiled
-        self.catch_comprehensive_procedures()
+
+        if bind_globals:
+            self.catch_comprehensive_procedures()
+
         self.async_mode = False
         self.defers: list[Defer] = []
 
@@ -91,7 +102,7 @@ class BodyExecutor(Executor):
         self.async_mode = True
 
         try:
-            return self._execute()
+            return (yield from self._execute())
         finally:
             for defer in reversed(self.defers):
                 executor = ExpressionExecutor(defer.expression, self.tree_variables, self.compiled)
@@ -173,7 +184,7 @@ class BodyExecutor(Executor):
                 else:
                     executed = executor.execute_with_atomic_type()
 
-                printer.raw_print(executed)
+                printer.raw_print(render(executed, settings.print_collection_limit or None))
 
             elif isinstance(command, When):
                 executor = ExpressionExecutor(command.expression, self.tree_variables, self.compiled)
@@ -305,6 +316,56 @@ class BodyExecutor(Executor):
                         elif not isinstance(executed, Stop):
                             return executed
 
+            elif isinstance(command, ForEach):
+                executor = ExpressionExecutor(command.expression, self.tree_variables, self.compiled)
+
+                if self.async_mode:
+                    iterable = yield from executor.async_execute(as_atomic=True)
+                else:
+                    iterable = executor.execute_with_atomic_type()
+
+                if isinstance(iterable, Array):
+                    items = list(iterable.value)
+                elif isinstance(iterable, Table):
+                    items = iterable.keys()
+                elif isinstance(iterable, LazySequence):
+                    # Элементы вычисляются по одному, последовательность в список не собирается
+                    items = iter(iterable)
+                else:
+                    raise ErrorType(
+                        f"В цикле '{Tokens.for_} {Tokens.each}' можно обходить только массив, таблицу "
+                        f"или последовательность!",
+                        info=command.meta_info
+                    )
+
+                with VariableContextCreator(self.tree_variables):
+                    body_executor = BodyExecutor(command.body, self.tree_variables, self.compiled)
+                    # Переменная цикла создаётся один раз, на каждом шаге меняется только её значение
+                    loop_var = Variable(command.name_loop_var, VOID)
+                    self.tree_variables.set(loop_var)
+
+                    for item in items:
+                        if self.async_mode:
+                            yield YIELD
+
+                        loop_var.value = item
+
+                        # Локальные переменные тела живут один шаг цикла
+                        with VariableContextCreator(self.tree_variables):
+                            if self.async_mode:
+                                executed = yield from body_executor.async_execute()
+                            else:
+                                executed = body_executor.execute()
+
+                        if isinstance(executed, Continue):
+                            continue
+
+                        elif isinstance(executed, Break):
+                            break
+
+                        elif not isinstance(executed, Stop):
+                            return executed
+
             elif isinstance(command, Continue):
                 if self.async_mode:
                     yield YIELD
@@ -396,6 +457,18 @@ class BodyExecutor(Executor):
 
                 return executed
 
+            elif isinstance(command, YieldValue):
+                if not self.async_mode:
+                    raise ErrorType(
+                        f"Оператор '{Tokens.yield_}' можно использовать только в теле процедуры!",
+                        info=command.meta_info
+                    )
+
+                executor = ExpressionExecutor(command.expression, self.tree_variables, self.compiled)
+                executed = yield from executor.async_execute(as_atomic=True)
+
+                yield Produced(executed)
+
             elif isinstance(command, BlockSync):
                 body_executor = BodyExecutor(command.body, self.tree_variables, self.compiled)
 
@@ -1,42 +1,112 @@
+from typing import Iterator, NamedTuple, Optional
+
 from src.core.types.checkers import CheckerSituation
-from src.core.types.conditions import ResultCondition
+from src.core.types.conditions import ResultCondition, procedure_criteria_cache
 from src.core.util import kill_process
 from src.util.build_tools.compile import Compiled
-from src.util.console_worker import printer
+from src.util.report_writer import ReportRow, ReportWriter, RichReportWriter
+from src.util.result_cache import check_key, criteria_fingerprint, get_result_cache
 from src.core.executors.base import Executor
 
 
+class CheckOutcome(NamedTuple):
+    result: dict[str, ResultCondition]
+    # Статистика кэша чистых процедур за время этой проверки
+    cache_hits: int
+    cache_misses: int
+    # Взят ли результат из кэша результатов. None - кэш для этой проверки не использовался
+    result_cache_hit: Optional[bool] = None
+
+
 class CheckerSituationExecutor(Executor):
-    def __init__(self, obj: CheckerSituation, compiled: Compiled):
+    def __init__(self, obj: CheckerSituation, compiled: Compiled, writer: Optional[ReportWriter] = None):
         self.checker = obj
         self.compiled = compiled
+        self.writer = writer or RichReportWriter()
+        self.result_cache_hit: Optional[bool] = None
 
-    def execute(self):
-        try:
-            check_result: dict[str, ResultCondition] = self.checker.check(self.compiled)
-        except TypeError as e:
-            kill_process(f"{e}Имя проверки: {self.checker.name}")
+    def _iter_results(self) -> Iterator[ResultCondition]:
+        result_cache = get_result_cache()
+        condition = self.checker.document.hypothesis.condition
+        facts = self.checker.fact_situation.data
+        key = None
+
+        if result_cache is not None:
+            key = check_key(*criteria_fingerprint(condition), condition, facts)
+
+        if key is None:
+            yield from self.checker.iter_check(self.compiled)
             return
 
-        printer.print_info(
-            f"Отчет проверки: {self.checker.name} об анализе соответствия ситуации: '{self.checker.fact_situation.name}' "
-            f"документу '{self.checker.document.name}' "
-            f"по следующим критериям:\n"
-        )
+        cached = result_cache.get(key)
+        self.result_cache_hit = cached is not None
+
+        if cached is not None:
+            for name_criteria, result in cached.items():
+                yield ResultCondition(name_criteria, facts[name_criteria], result, condition.criteria.modify[name_criteria])
+
+            return
+
+        results = {}
+
+        for result_condition in self.checker.iter_check(self.compiled):
+            results[result_condition.name_criteria] = result_condition.result
+            yield result_condition
 
-        table_data = {
-            "Название критерия": [],
-            "Фактические данные": [],
-            "Результат": [],
-            "Тип проверки": [],
+        result_cache.put(key, results)
+
+    def check(self) -> CheckOutcome:
+        hits, misses = procedure_criteria_cache.stats()
+        check_result = {
+            result_condition.name_criteria: result_condition for result_condition in self._iter_results()
         }
+        new_hits, new_misses = procedure_criteria_cache.stats()
+
+        return CheckOutcome(check_result, new_hits - hits, new_misses - misses, self.result_cache_hit)
+
+    def _begin_report(self):
+        self.writer.begin(
+            title=f"Результаты анализа проверкой: '{self.checker.name}'",
+            description=f"Отчет проверки: {self.checker.name} об анализе соответствия ситуации: "
+                        f"'{self.checker.fact_situation.name}' "
+                        f"документу '{self.checker.document.name}' "
+                        f"по следующим критериям:\n"
+        )
+
+    def _write_result(self, result_condition: ResultCondition):
+        self.writer.write(ReportRow(
+            check=self.checker.name,
+            criteria=result_condition.name_criteria,
+            fact_value=result_condition.value_fact_data,
+            modify=repr(result_condition.modify),
+            result=result_condition.result,
+        ))
+
+    def _end_report(self, cache_hits: int, cache_misses: int):
+        self.writer.end()
+
+        if cache_hits + cache_misses:
+            self.writer.note(f"Кэш чистых процедур: попаданий {cache_hits}, вычислений {cache_misses}")
+
+    def report(self, outcome: CheckOutcome):
+        self.result_cache_hit = outcome.result_cache_hit
+        self._begin_report()
 
-        for criteria, result_condition in check_result.items():
-            result = self.checker.check_result_map[result_condition.result]
+        for result_condition in outcome.result.values():
+            self._write_result(result_condition)
 
-            table_data["Название критерия"].append(criteria)
-            table_data["Фактические данные"].append(result_condition.value_fact_data)
-            table_data["Результат"].append(result)
-            table_data["Тип проверки"].append(result_condition.modify)
+        self._end_report(outcome.cache_hits, outcome.cache_misses)
+
+    def execute(self):
+        hits, misses = procedure_criteria_cache.stats()
+        self._begin_report()
+
+        try:
+            for result_condition in self._iter_results():
+                self._write_result(result_condition)
+        except TypeError as e:
+            kill_process(f"{e}Имя проверки: {self.checker.name}")
+            return
 
-        printer.print_table(table_data, title=f"Результаты анализа проверкой: '{self.checker.name}'")
+        new_hits, new_misses = procedure_criteria_cache.stats()
+        self._end_report(new_hits - hits, new_misses - misses)
@@ -393,6 +393,10 @@ class ExpressionExecutor(Executor):
                     res.this = left.value
                     operation = ProcedureContextName(Operator(res.name))
                     operation.func = res
+                elif isinstance(res, PyExtendWrapper):
+                    # Метод встроенной структуры уже привязан к экземпляру
+                    operation = ProcedureContextName(Operator(res.name))
+                    operation.func = res
                 else:
                     evaluate_stack.append(res)
                     continue
@@ -0,0 +1,89 @@
+from typing import Callable, Optional, TYPE_CHECKING
+
+from src.core.types.basetype import BaseAtomicType
+from src.core.types.checkers import CheckerSituation
+from src.core.types.conditions import ResultCondition
+from src.core.types.documents import Document, FactSituation
+
+if TYPE_CHECKING:
+    from src.util.build_tools.compile import Compiled
+
+
+class LiveCheck:
+    """
+    Держит проверку ситуации по документу актуальной.
+    При изменении факта пересчитывается только его критерий, итог обновляется за O(1).
+    """
+    def __init__(
+            self, document: Document, fact_situation: FactSituation, compiled: "Compiled",
+            on_verdict_change: Optional[Callable[["LiveCheck"], None]] = None
+    ):
+        self.document = document
+        self.fact_situation = fact_situation
+        self.condition = document.hypothesis.condition
+        self.compiled = compiled
+        self.on_verdict_change = on_verdict_change
+        # None - значение факта не сравнимо с критерием
+        self.results: dict[str, Optional[ResultCondition]] = {}
+        self.violations = 0
+        self.type_errors = 0
+
+        for name, value in fact_situation.data.items():
+            self._add(name, value)
+
+        fact_situation.subscribe(self.on_fact_changed)
+
+    @classmethod
+    def from_checker(
+            cls, checker: CheckerSituation, compiled: "Compiled",
+            on_verdict_change: Optional[Callable[["LiveCheck"], None]] = None
+    ) -> "LiveCheck":
+        return cls(checker.document, checker.fact_situation, compiled, on_verdict_change)
+
+    @property
+    def passed(self) -> bool:
+        return self.violations == 0 and self.type_errors == 0
+
+    def _add(self, name: str, value: BaseAtomicType):
+        if name not in self.condition.criteria.modify:
+            return
+
+        try:
+            result_condition = self.condition.execute_criteria(name, value, self.compiled)
+        except TypeError:
+            result_condition = None
+
+        self.results[name] = result_condition
+
+        if result_condition is None:
+            self.type_errors += 1
+        elif not result_condition.result:
+            self.violations += 1
+
+    def _discard(self, name: str):
+        if name not in self.results:
+            return
+
+        result_condition = self.results.pop(name)
+
+        if result_condition is None:
+            self.type_errors -= 1
+        elif not result_condition.result:
+            self.violations -= 1
+
+    def on_fact_changed(self, name: str, value: Optional[BaseAtomicType]):
+        if name not in self.condition.criteria.modify:
+            return
+
+        passed = self.passed
+
+        self._discard(name)
+
+        if value is not None:
+            self._add(name, value)
+
+        if self.on_verdict_change is not None and passed != self.passed:
+            self.on_verdict_change(self)
+
+    def close(self):
+        self.fact_situation.unsubscribe(self.on_fact_changed)
@@ -1,14 +1,33 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
-from src.core.executors.body import BodyExecutor
+from src.core.exceptions import ArgumentError, ErrorType
+from src.core.executors.body import BodyExecutor, Produced, STOP
+from src.core.types.atomic import LazySequence, VOID
 from src.core.types.basetype import BaseAtomicType
 from src.core.types.procedure import Procedure
 from src.core.executors.base import Executor
+from src.core.types.variable import ScopeStack, Variable
 
 if TYPE_CHECKING:
     from src.util.build_tools.compile import Compiled
 
 
+def produced_values(body: BodyExecutor) -> Iterator[BaseAtomicType]:
+    """Выполняет тело генераторной процедуры до очередного ОТДАТЬ и возвращает отданное значение."""
+    for item in body.async_execute():
+        if isinstance(item, Produced):
+            yield item.value
+
+
+def lazy_call(body: BodyExecutor) -> LazySequence:
+    return LazySequence(lambda: produced_values(body), reusable=False)
+
+
+def _returned(result: BaseAtomicType):
+    return result
+    yield
+
+
 class ProcedureExecutor(Executor):
     def __init__(self, procedure: Procedure, compiled: "Compiled"):
         self.procedure = procedure
@@ -22,4 +41,62 @@ class ProcedureExecutor(Executor):
 
     def _execute(self, is_async=False):
         body = BodyExecutor(self.procedure.body, self.procedure.tree_variables, self.compiled)
+
+        if self.procedure.generator:
+            # Тело начнёт выполняться только при обходе последовательности
+            sequence = lazy_call(body)
+            return _returned(sequence) if is_async else sequence
+
         return body.async_execute() if is_async else body.execute()
+
+
+class ProcedureFrame:
+    """
+    Кадр вызова процедуры для многократного вызова из процедур расширения (отобразить, свернуть и т.п.).
+    Глобальные имена связываются один раз, а на каждый вызов заново присваиваются только аргументы
+    и создаётся пустая область для локальных переменных.
+    """
+    def __init__(self, procedure: Procedure, compiled: "Compiled", caller_name: str):
+        self.procedure = procedure
+        self.compiled = compiled
+        self.caller_name = caller_name
+        self.arguments = [Variable(name, VOID) for name in procedure.arguments_names]
+        self.tree_variables = ScopeStack()
+
+        for variable in self.arguments:
+            self.tree_variables.set(variable)
+
+        BodyExecutor(procedure.body, self.tree_variables, compiled).catch_comprehensive_procedures()
+        self.tree_variables.push()
+
+    def call(self, arguments: list[BaseAtomicType]) -> BaseAtomicType:
+        if len(arguments) != len(self.arguments):
+            raise ArgumentError(
+                f"Процедура '{self.caller_name}' при попытке вызова '{self.procedure.name}' "
+                f"передала некорректное количество аргументов! Ожидалось {len(self.arguments)}, "
+                f"но передано: {len(arguments)}"
+            )
+
+        for variable, value in zip(self.arguments, arguments):
+            if not isinstance(value, BaseAtomicType):
+                raise ErrorType(f"Некорректный тип аргумента у '{variable.name}'")
+
+            variable.value = value
+
+        if self.procedure.generator:
+            # Последовательность живёт дольше вызова, поэтому ей нужен собственный кадр
+            tree_variables = ScopeStack()
+
+            for variable in self.arguments:
+                tree_variables.set(Variable(variable.name, variable.value))
+
+            return lazy_call(BodyExecutor(self.procedure.body, tree_variables, self.compiled))
+
+        # Локальные переменные прошлого вызова не должны быть видны в следующем
+        if self.tree_variables.scopes[-1].variables:
+            self.tree_variables.pop()
+            self.tree_variables.push()
+
+        res = BodyExecutor(self.procedure.body, self.tree_variables, self.compiled, bind_globals=False).execute()
+
+        return VOID if res is STOP else res
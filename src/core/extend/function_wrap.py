@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from functools import wraps
-from typing import Optional, Type, TYPE_CHECKING, Union
+from typing import Callable, Optional, Type, TYPE_CHECKING, Union
 
 import dill
 
@@ -55,6 +55,32 @@ class PyExtendWrapper(BaseType, ABC):
 
         return VOID if res is STOP else res
 
+    def bind_procedure(self, procedure) -> Callable[[list[BaseAtomicType]], BaseAtomicType]:
+        """
+        Связывает процедуру-аргумент один раз для вызова на каждом элементе:
+        кадр вызова процедуры LawScript переиспользуется между вызовами.
+        """
+        from src.core.executors.procedure import ProcedureFrame
+        from src.core.types.procedure import LinkedProcedure, Procedure
+
+        if isinstance(procedure, LinkedProcedure):
+            procedure = procedure.func
+
+        if isinstance(procedure, Procedure):
+            return ProcedureFrame(procedure, self.namespace, self.func_name).call
+
+        if not isinstance(procedure, PyExtendWrapper):
+            raise ErrorType(f"'{procedure}' не является процедурой!")
+
+        procedure.namespace = self.namespace
+
+        def call(arguments: list[BaseAtomicType]) -> BaseAtomicType:
+            procedure.check_args(arguments)
+
+            return procedure.call(arguments)
+
+        return call
+
     def check_args(self, args: Optional[list[BaseAtomicType]] = None):
         if not self.empty_args and args is None:
             raise ArgumentError(f"Необходимо передать аргументы в процедуру '{self.func_name}'")
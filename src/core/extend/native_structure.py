@@ -0,0 +1,134 @@
+from typing import Callable, Optional, Type, TYPE_CHECKING
+
+from src.core.exceptions import ArgumentError
+from src.core.extend.function_wrap import CallableWrapper, PyExtendWrapper
+from src.core.types.basetype import BaseAtomicType, CopyItem
+from src.core.types.classes import copy_fields
+
+if TYPE_CHECKING:
+    from src.util.build_tools.compile import Compiled
+
+NativeFunction = Callable[["NativeStructure", list[BaseAtomicType]], BaseAtomicType]
+
+
+def native_method(name: str, count_args: int = 0, required_args: Optional[int] = None):
+    """Объявляет метод встроенной структуры, доступный из LawScript как 'экземпляр:имя(...)'."""
+    def decorator(function: NativeFunction) -> NativeFunction:
+        function.native_method = (name, count_args, count_args if required_args is None else required_args)
+        return function
+
+    return decorator
+
+
+class NativeMethod(PyExtendWrapper):
+    """Метод встроенной структуры, привязанный к экземпляру."""
+    def __init__(self, func_name: str, this: "NativeStructure", function: NativeFunction, count_args: int,
+                 required_args: int):
+        super().__init__(func_name)
+        self.this = this
+        self.function = function
+        self.count_args = count_args
+        self.required_args = required_args
+        self.empty_args = required_args == 0
+
+    def check_args(self, args: Optional[list[BaseAtomicType]] = None):
+        count = 0 if args is None else len(args)
+
+        if not self.required_args <= count <= self.count_args:
+            expected = (
+                self.count_args if self.required_args == self.count_args
+                else f"от {self.required_args} до {self.count_args}"
+            )
+
+            raise ArgumentError(
+                f"Неверное количество аргументов метода '{self.this.class_name}:{self.func_name}'. "
+                f"Ожидалось: {expected}, но передано: {count}"
+            )
+
+    def call(self, args: Optional[list[BaseAtomicType]] = None) -> BaseAtomicType:
+        # Пространство имён программы нужно методам, которые вызывают процедуры LawScript
+        self.this.namespace = self.namespace
+
+        return self.function(self.this, args or [])
+
+    def __repr__(self):
+        return f"Метод('{self.this.class_name}:{self.func_name}') кол-во аргументов: {self.count_args}"
+
+
+class NativeStructure(BaseAtomicType):
+    """
+    Экземпляр встроенной структуры: ведёт себя как экземпляр класса LawScript,
+    но методы выполняются в Python без интерпретации тела метода.
+    """
+    class_name = ""
+    methods: dict[str, tuple[NativeFunction, int, int]] = {}
+    namespace: Optional["Compiled"] = None
+
+    def __init__(self):
+        super().__init__(None)
+        self.value = self
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.methods = dict(cls.methods)
+        callable_wrapper = CallableWrapper()
+        callable_wrapper.mod_name = cls.__module__
+
+        for function in cls.__dict__.values():
+            spec = getattr(function, "native_method", None)
+
+            if spec is not None:
+                name, count_args, required_args = spec
+                function = callable_wrapper.callable_py_wrap(function, f"{cls.class_name}:{name}")
+                cls.methods[name] = (function, count_args, required_args)
+
+    def empty_copy(self) -> "NativeStructure":
+        return type(self)()
+
+    def copy_into(self, copied: "NativeStructure", copy_item: CopyItem):
+        """Наследники с собственным состоянием дополняют этот метод."""
+        copied.namespace = self.namespace
+        copied.fields = copy_fields(self.fields, copy_item)
+
+    def bound_methods(self) -> dict[str, NativeMethod]:
+        return {name: self.get_attribute(name) for name in self.methods}
+
+    def get_attribute(self, name: str):
+        method = self.methods.get(name)
+
+        if method is None:
+            return super().get_attribute(name)
+
+        function, count_args, required_args = method
+
+        method = NativeMethod(name, self, function, count_args, required_args)
+        method.namespace = self.namespace
+
+        return method
+
+    @classmethod
+    def type_name(cls):
+        return cls.class_name
+
+    def __str__(self):
+        return f"Экземпляр('{self.class_name}')"
+
+    def __repr__(self):
+        return str(self)
+
+
+class NativeStructureClass(PyExtendWrapper):
+    """Конструктор встроенной структуры: вызывается как класс, 'Список(...)'."""
+    structure: Type[NativeStructure] = NativeStructure
+
+    def __init__(self, func_name: str):
+        super().__init__(func_name)
+        self.empty_args = True
+        self.count_args = -1
+
+    def call(self, args: Optional[list[BaseAtomicType]] = None):
+        return self.structure.create(args or [])
+
+    def __repr__(self):
+        return f"Класс('{self.func_name}')"
+
@@ -109,7 +109,7 @@ class KeyTable(PyExtendWrapper):
     def call(self, args: Optional[list[BaseAtomicType]] = None):
         import pygame
 
-        from src.core.types.atomic import Table, String, Number
+        from src.core.types.atomic import Table, Number
 
         key_table = Table()
 
@@ -132,7 +132,7 @@ class KeyTable(PyExtendWrapper):
         }
 
         for key_name, key_code in keys.items():
-            key_table.value[String(key_name)] = Number(key_code)
+            key_table[key_name] = Number(key_code)
 
         return key_table
 
@@ -148,15 +148,15 @@ class EventTable(PyExtendWrapper):
         import pygame
 
         from src.core.extend.standard_lib.lib_game.util import GameEventType
-        from src.core.types.atomic import Table, String
+        from src.core.types.atomic import Table
 
         return Table({
-            String("Выход"): GameEventType(pygame.QUIT),
-            String("НажатиеКлавиши"): GameEventType(pygame.KEYDOWN),
-            String("ОтпусканиеКлавиши"): GameEventType(pygame.KEYUP),
-            String("НажатиеМыши"): GameEventType(pygame.MOUSEBUTTONDOWN),
-            String("ОтпусканиеМыши"): GameEventType(pygame.MOUSEBUTTONUP),
-            String("ДвижениеМыши"): GameEventType(pygame.MOUSEMOTION),
+            "Выход": GameEventType(pygame.QUIT),
+            "НажатиеКлавиши": GameEventType(pygame.KEYDOWN),
+            "ОтпусканиеКлавиши": GameEventType(pygame.KEYUP),
+            "НажатиеМыши": GameEventType(pygame.MOUSEBUTTONDOWN),
+            "ОтпусканиеМыши": GameEventType(pygame.MOUSEBUTTONUP),
+            "ДвижениеМыши": GameEventType(pygame.MOUSEMOTION),
         })
 
 
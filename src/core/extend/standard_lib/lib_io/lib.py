@@ -32,7 +32,8 @@ class Print(PyExtendWrapper):
         }
 
     def call(self, args: Optional[list[BaseAtomicType]] = None):
-        from src.core.types.atomic import VOID
+        from config import settings
+        from src.core.types.atomic import VOID, render
 
         parsed_args = self.parse_args(args)
         sep, end = " ", "\n"
@@ -47,7 +48,7 @@ class Print(PyExtendWrapper):
             sep = sep.replace(old, new)
             end = end.replace(old, new)
 
-        print(args[0], sep=sep, end=end)
+        print(render(args[0], settings.print_collection_limit or None), sep=sep, end=end)
 
         return VOID
 
@@ -110,6 +111,44 @@ class ReadFile(PyExtendWrapper):
         return Array(lines)
 
 
+@builder.collect(func_name='строки_файла')
+class FileLines(PyExtendWrapper):
+    def __init__(self, func_name: str):
+        super().__init__(func_name)
+        self.empty_args = False
+        self.count_args = 1
+
+    def call(self, args: Optional[list[BaseAtomicType]] = None):
+        import os
+
+        from src.core.extend.standard_lib.util import path_normpath
+        from src.core.types.atomic import String, LazySequence
+        from src.core.exceptions import ErrorValue, FileError
+
+        path = args[0]
+
+        if not isinstance(path, String):
+            raise ErrorValue("Аргумент должен быть строкой.")
+
+        path = self.parse_args(args)[0]
+        full_path = path_normpath(path)
+
+        # Пробуем также исходный путь (на случай абсолютных путей)
+        if not os.path.isfile(full_path):
+            full_path = path
+
+        if not os.path.isfile(full_path):
+            raise FileError(path)
+
+        def lines():
+            # Файл читается по строке за раз и закрывается после обхода
+            with open(full_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    yield String(line.rstrip('\n\r'))
+
+        return LazySequence(lines)
+
+
 def build_module():
     builder.build_python_extend(f"{standard_lib_path}{MOD_NAME}")
 
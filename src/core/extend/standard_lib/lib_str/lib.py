@@ -2,6 +2,8 @@ from pathlib import Path
 from typing import Optional
 
 from src.core.extend.function_wrap import PyExtendWrapper, PyExtendBuilder
+from src.core.extend.native_structure import NativeStructureClass
+from src.core.extend.standard_lib.lib_str.structures import NativeStringBuilder
 from src.core.types.basetype import BaseAtomicType
 
 builder = PyExtendBuilder()
@@ -329,6 +331,11 @@ class RegexMatch(PyExtendWrapper):
             raise ErrorValue("Некорректное регулярное выражение")
 
 
+@builder.collect(func_name='СтроковыйБуфер')
+class StringBuilderInit(NativeStructureClass):
+    structure = NativeStringBuilder
+
+
 def build_module():
     builder.build_python_extend(f"{standard_lib_path}{MOD_NAME}")
 
@@ -0,0 +1,67 @@
+from src.core.exceptions import ArgumentError, ErrorType
+from src.core.extend.native_structure import NativeStructure, native_method
+from src.core.types.atomic import Number, String, VOID
+from src.core.types.basetype import BaseAtomicType, CopyItem
+
+
+class NativeStringBuilder(NativeStructure):
+    """Изменяемый буфер для сборки длинной строки по частям: части копируются один раз, в 'в_строку'."""
+    class_name = "СтроковыйБуфер"
+
+    def __init__(self):
+        super().__init__()
+        self.parts: list[str] = []
+        self.length = 0
+
+    @classmethod
+    def create(cls, args: list[BaseAtomicType]) -> "NativeStringBuilder":
+        if len(args) > 1:
+            raise ArgumentError(
+                f"Неверное количество аргументов конструктора '{cls.class_name}'. Ожидалось максимум: 1, "
+                f"но передано: {len(args)}"
+            )
+
+        inst = cls()
+
+        if args:
+            if not isinstance(args[0], String):
+                raise ErrorType("Аргумент должен быть строкой!")
+
+            inst.write(args[0].value)
+
+        return inst
+
+    def copy_into(self, copied: "NativeStringBuilder", copy_item: CopyItem):
+        super().copy_into(copied, copy_item)
+        copied.parts = list(self.parts)
+        copied.length = self.length
+
+    def write(self, text: str):
+        self.parts.append(text)
+        self.length += len(text)
+
+    @native_method("добавить", count_args=1)
+    def append(self, args: list[BaseAtomicType]):
+        value = args[0]
+        self.write(value.value if isinstance(value, String) else str(value))
+
+        return VOID
+
+    @native_method("длина")
+    def len_(self, _: list[BaseAtomicType]):
+        return Number(self.length)
+
+    @native_method("в_строку")
+    def to_string(self, _: list[BaseAtomicType]):
+        text = "".join(self.parts)
+        # Повторный вызов не склеивает части заново
+        self.parts = [text]
+
+        return String(text)
+
+    @native_method("очистить")
+    def clear(self, _: list[BaseAtomicType]):
+        self.parts = []
+        self.length = 0
+
+        return VOID
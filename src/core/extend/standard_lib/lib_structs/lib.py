@@ -1,8 +1,12 @@
+import operator
+from abc import abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Union
 
 from src.core.extend.function_wrap import PyExtendWrapper, PyExtendBuilder
-from src.core.types.atomic import Array
+from src.core.extend.native_structure import NativeStructureClass
+from src.core.extend.standard_lib.lib_structs.structures import NativeDict, NativeList, NativeQueue, NativeSet
+from src.core.types.atomic import Array, LazySequence, NumericArray
 from src.core.types.basetype import BaseAtomicType
 
 builder = PyExtendBuilder()
@@ -163,6 +167,9 @@ class ArraySum(PyExtendWrapper):
         if not isinstance(arr, Array):
             raise ErrorValue("Аргумент должен быть массивом.")
 
+        if isinstance(arr, NumericArray):
+            return arr.sum()
+
         parsed_args = self.parse_args(args)
 
         return Number(sum(parsed_args[0]))
@@ -192,6 +199,10 @@ class ArraySort(PyExtendWrapper):
         if not isinstance(arr, Array):
             raise ErrorValue("Первый аргумент должен быть массивом.")
 
+        if isinstance(arr, NumericArray):
+            arr.sort(reverse=is_reverse)
+            return arr
+
         for item in arr.value:
             if isinstance(item, Array):
                 raise ErrorValue("Невозможно отсортировать массив в массиве.")
@@ -204,6 +215,250 @@ class ArraySort(PyExtendWrapper):
         return arr
 
 
+@builder.collect(func_name='числовой_массив')
+class NumericArrayInit(PyExtendWrapper):
+    def __init__(self, func_name: str):
+        super().__init__(func_name)
+        self.empty_args = True
+        self.count_args = -1
+
+    def call(self, args: Optional[list[BaseAtomicType]] = None):
+        from src.core.types.atomic import NumericArray, Array
+
+        if args and len(args) == 1 and isinstance(args[0], Array):
+            return NumericArray(args[0].value)
+
+        return NumericArray(args if args else [])
+
+
+class _ArrayAggregate(PyExtendWrapper):
+    def __init__(self, func_name: str):
+        super().__init__(func_name)
+        self.empty_args = False
+        self.count_args = 1
+
+    @abstractmethod
+    def aggregate(self, arr: NumericArray): ...
+
+    def call(self, args: Optional[list[Array]] = None):
+        from src.core.types.atomic import NumericArray, Array
+        from src.core.exceptions import ErrorValue
+
+        arr = args[0]
+
+        if not isinstance(arr, Array):
+            raise ErrorValue("Аргумент должен быть массивом.")
+
+        if not isinstance(arr, NumericArray):
+            arr = NumericArray(arr.value)
+
+        return self.aggregate(arr)
+
+
+@builder.collect(func_name='минимум_массива')
+class ArrayMin(_ArrayAggregate):
+    def aggregate(self, arr: NumericArray):
+        return arr.min()
+
+
+@builder.collect(func_name='максимум_массива')
+class ArrayMax(_ArrayAggregate):
+    def aggregate(self, arr: NumericArray):
+        return arr.max()
+
+
+@builder.collect(func_name='среднее_массива')
+class ArrayMean(_ArrayAggregate):
+    def aggregate(self, arr: NumericArray):
+        return arr.mean()
+
+
+class _ArrayElementwise(PyExtendWrapper):
+    operation = None
+
+    def __init__(self, func_name: str):
+        super().__init__(func_name)
+        self.empty_args = False
+        self.count_args = 2
+
+    def call(self, args: Optional[list[BaseAtomicType]] = None):
+        from src.core.types.atomic import NumericArray, Array, Number
+        from src.core.exceptions import ErrorValue
+
+        arr, other = args
+
+        if not isinstance(arr, Array):
+            raise ErrorValue("Первый аргумент должен быть массивом.")
+
+        if not isinstance(other, (Array, Number)):
+            raise ErrorValue("Второй аргумент должен быть массивом или числом.")
+
+        if not isinstance(arr, NumericArray):
+            arr = NumericArray(arr.value)
+
+        if isinstance(other, Array) and not isinstance(other, NumericArray):
+            other = NumericArray(other.value)
+
+        return arr.elementwise(type(self).operation, other)
+
+
+@builder.collect(func_name='сложить_массивы')
+class ArrayAdd(_ArrayElementwise):
+    operation = operator.add
+
+
+@builder.collect(func_name='вычесть_массивы')
+class ArraySub(_ArrayElementwise):
+    operation = operator.sub
+
+
+@builder.collect(func_name='умножить_массивы')
+class ArrayMul(_ArrayElementwise):
+    operation = operator.mul
+
+
+@builder.collect(func_name='разделить_массивы')
+class ArrayDiv(_ArrayElementwise):
+    operation = operator.truediv
+
+
+class _ArrayHigherOrder(PyExtendWrapper):
+    """
+    Обход массива или последовательности процедурой: процедура связывается один раз,
+    кадр её вызова общий для всех элементов. Последовательность обходится лениво.
+    """
+    def __init__(self, func_name: str):
+        super().__init__(func_name)
+        self.empty_args = False
+        self.count_args = 2
+
+    @abstractmethod
+    def apply(self, items: Union[list[BaseAtomicType], LazySequence], call, args: list[BaseAtomicType]): ...
+
+    def call(self, args: Optional[list[BaseAtomicType]] = None):
+        from src.core.exceptions import ErrorValue
+
+        items = args[0]
+
+        if isinstance(items, Array):
+            items = list(items.value)
+        elif not isinstance(items, LazySequence):
+            raise ErrorValue("Первый аргумент должен быть массивом или последовательностью.")
+
+        return self.apply(items, self.bind_procedure(args[1]), args[2:])
+
+
+@builder.collect(func_name='отобразить')
+class ArrayMap(_ArrayHigherOrder):
+    def apply(self, items: Union[list[BaseAtomicType], LazySequence], call, args: list[BaseAtomicType]):
+        if isinstance(items, LazySequence):
+            return LazySequence(lambda: (call([item]) for item in items))
+
+        return Array([call([item]) for item in items])
+
+
+@builder.collect(func_name='отфильтровать')
+class ArrayFilter(_ArrayHigherOrder):
+    def apply(self, items: Union[list[BaseAtomicType], LazySequence], call, args: list[BaseAtomicType]):
+        if isinstance(items, LazySequence):
+            return LazySequence(lambda: (item for item in items if call([item]).value))
+
+        return Array([item for item in items if call([item]).value])
+
+
+@builder.collect(func_name='свернуть')
+class ArrayReduce(_ArrayHigherOrder):
+    def __init__(self, func_name: str):
+        super().__init__(func_name)
+        self.count_args = 3
+
+    def apply(self, items: Iterable[BaseAtomicType], call, args: list[BaseAtomicType]):
+        result = args[0]
+
+        for item in items:
+            result = call([result, item])
+
+        return result
+
+
+@builder.collect(func_name='найти')
+class ArrayFind(_ArrayHigherOrder):
+    def apply(self, items: Iterable[BaseAtomicType], call, args: list[BaseAtomicType]):
+        from src.core.types.atomic import VOID
+
+        for item in items:
+            if call([item]).value:
+                return item
+
+        return VOID
+
+
+@builder.collect(func_name='любой')
+class ArrayAny(_ArrayHigherOrder):
+    def apply(self, items: Iterable[BaseAtomicType], call, args: list[BaseAtomicType]):
+        from src.core.types.atomic import Boolean
+
+        return Boolean(any(call([item]).value for item in items))
+
+
+@builder.collect(func_name='все')
+class ArrayAll(_ArrayHigherOrder):
+    def apply(self, items: Iterable[BaseAtomicType], call, args: list[BaseAtomicType]):
+        from src.core.types.atomic import Boolean
+
+        return Boolean(all(call([item]).value for item in items))
+
+
+@builder.collect(func_name='диапазон_чисел')
+class Range(PyExtendWrapper):
+    def __init__(self, func_name: str):
+        super().__init__(func_name)
+        self.empty_args = False
+        self.count_args = 3
+        self.offset_required_args = 2
+
+    def call(self, args: Optional[list[BaseAtomicType]] = None):
+        from src.core.types.atomic import Number
+        from src.core.exceptions import ErrorValue
+
+        bounds = [*args, Number(1)][:3]
+
+        for bound in bounds:
+            if not isinstance(bound, Number) or not float(bound.value).is_integer():
+                raise ErrorValue("Границы и шаг диапазона должны быть целыми числами.")
+
+        start, end, step = (int(bound.value) for bound in bounds)
+
+        if step == 0:
+            raise ErrorValue("Шаг диапазона не может быть равен нулю.")
+
+        # Конец включается в диапазон, как в цикле ЦИКЛ ОТ ... ДО
+        numbers = range(start, end + 1 if step > 0 else end - 1, step)
+
+        return LazySequence(lambda: map(Number, numbers))
+
+
+@builder.collect(func_name='в_массив')
+class SequenceToArray(PyExtendWrapper):
+    def __init__(self, func_name: str):
+        super().__init__(func_name)
+        self.empty_args = False
+        self.count_args = 1
+
+    def call(self, args: Optional[list[BaseAtomicType]] = None):
+        from src.core.exceptions import ErrorValue
+
+        sequence = args[0]
+
+        if isinstance(sequence, Array):
+            return Array(list(sequence.value))
+
+        if not isinstance(sequence, LazySequence):
+            raise ErrorValue("Аргумент должен быть последовательностью или массивом.")
+
+        return Array(list(sequence))
+
+
 @builder.collect(func_name='очистить_массив')
 class ArrayClear(PyExtendWrapper):
     def __init__(self, func_name: str):
@@ -310,7 +565,7 @@ class TableAppend(PyExtendWrapper):
         if not isinstance(table, Table):
             raise ErrorValue("Первый аргумент должен быть таблицей.")
 
-        table[key] = value
+        table.value[key.value] = value
 
         return VOID
 
@@ -334,11 +589,11 @@ class TableGetValue(PyExtendWrapper):
         if not isinstance(table, Table):
             raise ErrorValue("Первый аргумент должен быть таблицей.")
 
-        if key not in table:
+        try:
+            return table.value[key.value]
+        except KeyError:
             raise ErrorValue(f"Ключ '{key}' не найден.")
 
-        return table[key]
-
 
 @builder.collect(func_name='удалить_из_таблицы')
 class TableRemove(PyExtendWrapper):
@@ -359,8 +614,7 @@ class TableRemove(PyExtendWrapper):
         if not isinstance(table, Table):
             raise ErrorValue("Первый аргумент должен быть таблицей.")
 
-        if key in table:
-            table.del_(key)
+        table.value.pop(key.value, None)
 
         return VOID
 
@@ -403,9 +657,27 @@ class IsKeyTableExist(PyExtendWrapper):
         if not isinstance(key, String):
             raise ErrorValue("Второй аргумент должен быть строкой.")
 
-        table, key = self.parse_args(args)
+        return Boolean(key.value in table.value)
+
+
+@builder.collect(func_name='Список')
+class ListInit(NativeStructureClass):
+    structure = NativeList
+
+
+@builder.collect(func_name='Словарь')
+class DictInit(NativeStructureClass):
+    structure = NativeDict
+
+
+@builder.collect(func_name='Множество')
+class SetInit(NativeStructureClass):
+    structure = NativeSet
+
 
-        return Boolean(key in table.keys())
+@builder.collect(func_name='Очередь')
+class QueueInit(NativeStructureClass):
+    structure = NativeQueue
 
 
 def build_module():
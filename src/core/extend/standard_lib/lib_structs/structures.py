@@ -0,0 +1,313 @@
+from collections import deque
+from threading import Lock
+
+from src.core.exceptions import ArgumentError, ErrorType, ErrorValue, QueueEmptyError, QueueFullError
+from src.core.extend.native_structure import NativeStructure, native_method
+from src.core.types.atomic import (
+    Array, Boolean, LazySequence, Number, String, Table, TableKey, VOID, atomic_table_key, table_key
+)
+from src.core.types.basetype import BaseAtomicType, CopyItem
+from src.core.types.classes import ClassField
+
+
+def _check_count_args(name: str, args: list[BaseAtomicType], count_args: int):
+    if len(args) > count_args:
+        raise ArgumentError(
+            f"Неверное количество аргументов конструктора '{name}'. Ожидалось максимум: {count_args}, "
+            f"но передано: {len(args)}"
+        )
+
+
+class NativeList(NativeStructure):
+    class_name = "Список"
+
+    @classmethod
+    def create(cls, args: list[BaseAtomicType]) -> "NativeList":
+        _check_count_args(cls.class_name, args, 1)
+        array = args[0] if args else Array([])
+
+        if not isinstance(array, Array):
+            raise ErrorType("Аргумент должен быть массивом!")
+
+        inst = cls()
+        inst.fields["_массив"] = ClassField(array)
+
+        return inst
+
+    @property
+    def array(self) -> Array:
+        return self.fields["_массив"].value
+
+    @native_method("длина")
+    def len_(self, _: list[BaseAtomicType]):
+        from src.core.extend.standard_lib.lib_structs.lib import ArrayLen
+
+        return ArrayLen.call([self.array])
+
+    @native_method("сортировать", count_args=1, required_args=0)
+    def sort(self, args: list[BaseAtomicType]):
+        from src.core.extend.standard_lib.lib_structs.lib import ArraySort
+
+        return ArraySort.call([self.array, *args])
+
+    @native_method("достать", count_args=1, required_args=0)
+    def get(self, args: list[BaseAtomicType]):
+        from src.core.extend.standard_lib.lib_structs.lib import ArrayGetItem
+
+        return ArrayGetItem.call([self.array, args[0] if args else Number(0)])
+
+    @native_method("удалить", count_args=1)
+    def remove(self, args: list[BaseAtomicType]):
+        from src.core.extend.standard_lib.lib_structs.lib import ArrayRemove
+
+        return ArrayRemove.call([self.array, *args])
+
+    @native_method("добавить", count_args=1)
+    def append(self, args: list[BaseAtomicType]):
+        from src.core.extend.standard_lib.lib_structs.lib import ArrayAppend
+
+        return ArrayAppend.call([self.array, *args])
+
+    @native_method("в_массив", count_args=1, required_args=0)
+    def to_array(self, args: list[BaseAtomicType]):
+        if not args or args[0].value:
+            return self.array.copy_value()
+
+        return self.array
+
+    @native_method("для_каждого", count_args=1)
+    def for_each(self, args: list[BaseAtomicType]):
+        call = self.get_attribute("для_каждого").bind_procedure(args[0])
+        values = self.array.value
+
+        for index in range(len(values)):
+            values[index] = call([values[index]])
+
+        return VOID
+
+
+class NativeDict(NativeStructure):
+    class_name = "Словарь"
+
+    @classmethod
+    def create(cls, args: list[BaseAtomicType]) -> "NativeDict":
+        from src.core.extend.standard_lib.lib_structs.lib import TableInit
+
+        _check_count_args(cls.class_name, args, 2)
+
+        if len(args) == 1:
+            raise ErrorValue("Таблица должна быть инициализирована массивами ключей и значений.")
+
+        inst = cls()
+        inst.fields["_таблица"] = ClassField(TableInit.call(args))
+
+        return inst
+
+    @property
+    def table(self) -> Table:
+        return self.fields["_таблица"].value
+
+    @native_method("длина")
+    def len_(self, _: list[BaseAtomicType]):
+        from src.core.extend.standard_lib.lib_structs.lib import TableLen
+
+        return TableLen.call([self.table])
+
+    @native_method("добавить", count_args=2)
+    def append(self, args: list[BaseAtomicType]):
+        from src.core.extend.standard_lib.lib_structs.lib import TableAppend
+
+        return TableAppend.call([self.table, *args])
+
+    @native_method("достать", count_args=1)
+    def get(self, args: list[BaseAtomicType]):
+        from src.core.extend.standard_lib.lib_structs.lib import TableGetValue
+
+        return TableGetValue.call([self.table, *args])
+
+    @native_method("удалить", count_args=1)
+    def remove(self, args: list[BaseAtomicType]):
+        from src.core.extend.standard_lib.lib_structs.lib import TableRemove
+
+        return TableRemove.call([self.table, *args])
+
+    @native_method("содержит_ключ", count_args=1)
+    def contains(self, args: list[BaseAtomicType]):
+        from src.core.extend.standard_lib.lib_structs.lib import IsKeyTableExist
+
+        return IsKeyTableExist.call([self.table, *args])
+
+    @native_method("в_таблицу", count_args=1, required_args=0)
+    def to_table(self, args: list[BaseAtomicType]):
+        if not args or args[0].value:
+            return self.table.copy_value()
+
+        return self.table
+
+
+class NativeSet(NativeStructure):
+    """
+    Множество хранит строки и числа без обёрток, как ключи таблицы.
+    Элементы лежат в словаре, а не в set, чтобы в_массив отдавал их в порядке добавления.
+    """
+    class_name = "Множество"
+
+    def __init__(self):
+        super().__init__()
+        self.items: dict[TableKey, None] = {}
+
+    @staticmethod
+    def _key(value: BaseAtomicType) -> TableKey:
+        if not isinstance(value, (String, Number)):
+            raise ErrorType(
+                f"Элементами множества могут быть только '{String.type_name()}' и '{Number.type_name()}', "
+                f"но передано: '{value.type_name()}'"
+            )
+
+        return table_key(value)
+
+    @classmethod
+    def create(cls, args: list[BaseAtomicType]) -> "NativeSet":
+        _check_count_args(cls.class_name, args, 1)
+        inst = cls()
+
+        if args:
+            values = args[0]
+
+            if not isinstance(values, (Array, LazySequence)):
+                raise ErrorType("Аргумент должен быть массивом или последовательностью!")
+
+            inst.items = dict.fromkeys(map(cls._key, values))
+
+        return inst
+
+    def copy_into(self, copied: "NativeSet", copy_item: CopyItem):
+        super().copy_into(copied, copy_item)
+        copied.items = dict(self.items)
+
+    def _other(self, args: list[BaseAtomicType]) -> dict[TableKey, None]:
+        other = args[0]
+
+        if not isinstance(other, NativeSet):
+            raise ErrorType(f"Аргумент должен иметь тип '{self.class_name}'!")
+
+        return other.items
+
+    def _with_items(self, items: dict[TableKey, None]) -> "NativeSet":
+        inst = NativeSet()
+        inst.items = items
+
+        return inst
+
+    @native_method("длина")
+    def len_(self, _: list[BaseAtomicType]):
+        return Number(len(self.items))
+
+    @native_method("добавить", count_args=1)
+    def append(self, args: list[BaseAtomicType]):
+        self.items[self._key(args[0])] = None
+
+        return VOID
+
+    @native_method("удалить", count_args=1)
+    def remove(self, args: list[BaseAtomicType]):
+        self.items.pop(self._key(args[0]), None)
+
+        return VOID
+
+    @native_method("содержит", count_args=1)
+    def contains(self, args: list[BaseAtomicType]):
+        return Boolean(self._key(args[0]) in self.items)
+
+    @native_method("объединение", count_args=1)
+    def union(self, args: list[BaseAtomicType]):
+        return self._with_items(self.items | self._other(args))
+
+    @native_method("пересечение", count_args=1)
+    def intersection(self, args: list[BaseAtomicType]):
+        other = self._other(args)
+
+        return self._with_items({key: None for key in self.items if key in other})
+
+    @native_method("разность", count_args=1)
+    def difference(self, args: list[BaseAtomicType]):
+        other = self._other(args)
+
+        return self._with_items({key: None for key in self.items if key not in other})
+
+    @native_method("в_массив")
+    def to_array(self, _: list[BaseAtomicType]):
+        return Array([atomic_table_key(key) for key in self.items])
+
+
+class NativeQueue(NativeStructure):
+    class_name = "Очередь"
+
+    def __init__(self):
+        super().__init__()
+        self.items: deque[BaseAtomicType] = deque()
+        self.lock = Lock()
+
+    @classmethod
+    def create(cls, args: list[BaseAtomicType]) -> "NativeQueue":
+        if len(args) != 1:
+            raise ArgumentError(
+                f"Неверное количество аргументов конструктора '{cls.class_name}'. Ожидалось: 1, "
+                f"но передано: {len(args)}"
+            )
+
+        size = args[0]
+
+        if not isinstance(size, Number):
+            raise ErrorType("Размер очереди должен быть числом!")
+
+        inst = cls()
+        inst.fields["_максимум"] = ClassField(size)
+
+        return inst
+
+    def copy_into(self, copied: "NativeQueue", copy_item: CopyItem):
+        super().copy_into(copied, copy_item)
+
+        with self.lock:
+            copied.items = deque(map(copy_item, self.items))
+
+    @property
+    def max_size(self):
+        return self.fields["_максимум"].value.value
+
+    def _is_full(self) -> bool:
+        return len(self.items) > self.max_size - 1
+
+    @native_method("длина")
+    def len_(self, _: list[BaseAtomicType]):
+        with self.lock:
+            return Number(len(self.items))
+
+    @native_method("переполнена")
+    def is_full(self, _: list[BaseAtomicType]):
+        with self.lock:
+            return Boolean(self._is_full())
+
+    @native_method("пуста")
+    def is_empty(self, _: list[BaseAtomicType]):
+        with self.lock:
+            return Boolean(not self.items)
+
+    @native_method("взять")
+    def take(self, _: list[BaseAtomicType]):
+        with self.lock:
+            if not self.items:
+                raise QueueEmptyError()
+
+            return self.items.popleft()
+
+    @native_method("положить", count_args=1)
+    def put(self, args: list[BaseAtomicType]):
+        with self.lock:
+            if self._is_full():
+                raise QueueFullError(self.max_size)
+
+            self.items.append(args[0])
+
+        return VOID
@@ -19,6 +19,7 @@ class GetType(PyExtendWrapper):
     def call(self, args: Optional[list[BaseAtomicType]] = None):
         from src.core.types.atomic import String, BaseAtomicType
         from src.core.types.classes import ClassInstance, ClassDefinition
+        from src.core.extend.native_structure import NativeStructureClass
 
         from src.core.exceptions import ErrorType
 
@@ -30,6 +31,9 @@ class GetType(PyExtendWrapper):
         elif isinstance(arg, ClassDefinition):
             return String(arg.name)
 
+        elif isinstance(arg, NativeStructureClass):
+            return String(arg.func_name)
+
         elif isinstance(arg, BaseAtomicType):
             return String(arg.__class__.type_name())
 
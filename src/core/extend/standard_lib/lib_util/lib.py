@@ -19,9 +19,7 @@ class DeepCopy(PyExtendWrapper):
         self.count_args = 1
 
     def call(self, args: Optional[list[BaseAtomicType]] = None):
-        from copy import deepcopy
-
-        return deepcopy(args[0])
+        return args[0].deepcopy_value({})
 
 
 @builder.collect(func_name='_поверхностное_копирование')
@@ -32,9 +30,7 @@ class Copy(PyExtendWrapper):
         self.count_args = 1
 
     def call(self, args: Optional[list[BaseAtomicType]] = None):
-        from copy import copy
-
-        return copy(args[0])
+        return args[0].copy_value()
 
 
 @builder.collect(func_name='_словарь_в_таблицу')
@@ -89,18 +85,22 @@ class ViewObjectFields(PyExtendWrapper):
         self.count_args = 1
 
     def call(self, args: Optional[list[BaseAtomicType]] = None):
-        from src.core.types.atomic import Table, String
+        from src.core.types.atomic import Table
         from src.core.types.classes import ClassInstance
+        from src.core.extend.native_structure import NativeStructure
 
         obj = args[0]
 
         attrs = {}
 
         if hasattr(obj, "fields"):
-            attrs.update({String(k): v for k, v in obj.fields.items()})
+            attrs.update(obj.fields)
 
         if isinstance(obj, ClassInstance):
-            attrs.update({String(k): v for k, v in obj.metadata.methods.items()})
+            attrs.update(obj.metadata.methods)
+
+        elif isinstance(obj, NativeStructure):
+            attrs.update(obj.bound_methods())
 
         return Table(attrs)
 
@@ -115,10 +115,10 @@ class ViewNodesEntity(PyExtendWrapper):
     def _view(self, entity: CodeBlock, nodes: list) -> list:
         from src.core.types.code_block import CodeBlock
         from src.core.types.procedure import (
-            Loop, Print, When, While, ElseWhen,
+            Loop, Print, When, While, ElseWhen, ForEach,
             Else, Break, Continue, Context, Expression,
             AssignField, AssignOverrideVariable, ExceptionHandler, ErrorThrow,
-            Return, Defer,
+            Return, Defer, YieldValue,
         )
 
         if not isinstance(entity, CodeBlock):
@@ -130,12 +130,18 @@ class ViewNodesEntity(PyExtendWrapper):
             if isinstance(cmd, Loop):
                 value = ["Loop", "FROM_EXPR", cmd.expression_from.operations, "TO_EXPR", cmd.expression_to.operations]
 
+            elif isinstance(cmd, ForEach):
+                value = ["ForEach", "VAR", cmd.name_loop_var, "EXPR", cmd.expression.operations]
+
             elif isinstance(cmd, Print):
                 value = ["Print", "EXPR", cmd.expression.operations]
 
             elif isinstance(cmd, Return):
                 value = ["Return", "EXPR", cmd.expression.operations]
 
+            elif isinstance(cmd, YieldValue):
+                value = ["YieldValue", "EXPR", cmd.expression.operations]
+
             elif isinstance(cmd, Defer):
                 value = ["Defer", "EXPR", cmd.expression.operations]
 
@@ -85,12 +85,12 @@ class Request(PyExtendWrapper):
         text_data = resp.text
 
         result = Table({
-            String("статус_код"): Number(resp.status_code),
-            String("заголовки"): convert_py_type_to_atomic_type(resp.headers),
-            String("cookies"): convert_py_type_to_atomic_type(resp.cookies),
-            String("json"): convert_py_type_to_atomic_type(json_data),
-            String("текст"): String(text_data),
-            String("успешно"): Boolean(resp.status_code < 400),
+            "статус_код": Number(resp.status_code),
+            "заголовки": convert_py_type_to_atomic_type(resp.headers),
+            "cookies": convert_py_type_to_atomic_type(resp.cookies),
+            "json": convert_py_type_to_atomic_type(json_data),
+            "текст": String(text_data),
+            "успешно": Boolean(resp.status_code < 400),
         })
 
         return result
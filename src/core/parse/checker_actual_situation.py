@@ -17,13 +17,15 @@ class CheckerActualSituationMetaObject(MetaObject):
         self.fact_situation_name = fact_situation_name
         self.info = info
         printer.logging(
-            f"Создан объект CheckerActualSituationMetadata с stop_num={stop_num}, name='{name}', document_name='{document_name}', fact_situation_name='{fact_situation_name}'",
-            level="INFO")
+            "Создан объект CheckerActualSituationMetadata с stop_num=%s, name='%s', document_name='%s', fact_situation_name='%s'",
+            stop_num, name, document_name, fact_situation_name, level="INFO"
+        )
 
     def create_image(self) -> Image:
         printer.logging(
-            f"Создание образа с name='{self.name}', document_name='{self.document_name}', fact_situation_name='{self.fact_situation_name}'",
-            level="INFO")
+            "Создание образа с name='%s', document_name='%s', fact_situation_name='%s'",
+            self.name, self.document_name, self.fact_situation_name, level="INFO"
+        )
         return Image(
             name=self.name,
             obj=CheckerSituation,
@@ -43,7 +45,7 @@ class CheckerParser(Parser):
         printer.logging("Инициализация CheckerParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных с stop_num={stop_num}", level="INFO")
+        printer.logging("Создание метаданных с stop_num=%s", stop_num, level="INFO")
         return CheckerActualSituationMetaObject(
             stop_num,
             name=self.name,
@@ -54,14 +56,14 @@ class CheckerParser(Parser):
 
     def parse(self, body: list[Line], jump) -> int:
         self.jump = jump
-        printer.logging(f"Начало парсинга с jump={jump} {CheckerSituation.__name__}", level="INFO")
+        printer.logging("Начало парсинга с jump=%s %s", jump, CheckerSituation.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < self.jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
@@ -70,18 +72,18 @@ class CheckerParser(Parser):
             match line:
                 case [Tokens.check, name, Tokens.left_bracket]:
                     self.name = name
-                    printer.logging(f"Найдена секция 'check' с name='{name}'", level="INFO")
+                    printer.logging("Найдена секция 'check' с name='%s'", name, level="INFO")
                 case [Tokens.actual, Tokens.situation, situation_name, Tokens.comma]:
                     self.situation_name = situation_name
-                    printer.logging(f"Найдена актуальная ситуация с name='{situation_name}'", level="INFO")
+                    printer.logging("Найдена актуальная ситуация с name='%s'", situation_name, level="INFO")
                 case [Tokens.document, document_name, Tokens.comma]:
                     self.document_name = document_name
-                    printer.logging(f"Найден документ с name='{document_name}'", level="INFO")
+                    printer.logging("Найден документ с name='%s'", document_name, level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(info=self.info)
 
         printer.logging("Парсинг завершен с ошибкой: неверный синтаксис", level="ERROR")
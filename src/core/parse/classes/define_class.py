@@ -18,10 +18,10 @@ class DefineClassMetaObject(MetaObject):
             methods: Optional[dict[str, DefineMethodMetaObject]] = None,
             constructor: Optional[Constructor] = None
     ):
-        printer.logging(f"Создание метаобъекта класса {name}", level="DEBUG")
-        printer.logging(f"Родительский класс: {parent}", level="TRACE")
-        printer.logging(f"Количество методов: {len(methods) if methods else 0}", level="TRACE")
-        printer.logging(f"Конструктор: {'присутствует' if constructor else 'отсутствует'}", level="TRACE")
+        printer.logging("Создание метаобъекта класса %s", name, level="DEBUG")
+        printer.logging("Родительский класс: %s", parent, level="TRACE")
+        printer.logging("Количество методов: %s", len(methods) if methods else 0, level="TRACE")
+        printer.logging("Конструктор: %s", 'присутствует' if constructor else 'отсутствует', level="TRACE")
 
         super().__init__(stop_num)
         self.name = name
@@ -31,7 +31,7 @@ class DefineClassMetaObject(MetaObject):
         self.constructor = constructor
 
     def create_image(self) -> Image:
-        printer.logging(f"Создание образа класса {self.name}", level="DEBUG")
+        printer.logging("Создание образа класса %s", self.name, level="DEBUG")
         return Image(
             name=self.name,
             obj=ClassDefinition,
@@ -51,7 +51,7 @@ class DefineClassParser(Parser):
         printer.logging("Инициализация парсера класса", level="TRACE")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных класса {self.name}", level="DEBUG")
+        printer.logging("Создание метаданных класса %s", self.name, level="DEBUG")
         return DefineClassMetaObject(
             stop_num,
             name=self.name,
@@ -62,7 +62,7 @@ class DefineClassParser(Parser):
         )
 
     def parse(self, body: list[Line], jump: int) -> int:
-        printer.logging(f"Начало парсинга класса (строки {jump}-{len(body)})", level="INFO")
+        printer.logging("Начало парсинга класса (строки %s-%s)", jump, len(body), level="INFO")
         self.jump = jump
 
         for num, line in enumerate(body):
@@ -70,35 +70,35 @@ class DefineClassParser(Parser):
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку {num}: {line}", level="TRACE")
+                printer.logging("Игнорируем строку %s: %s", num, line, level="TRACE")
                 continue
 
             self.info = line.get_file_info()
             line = self.separate_line_to_token(line)
-            printer.logging(f"Обработка строки {num}: {line}", level="DEBUG")
+            printer.logging("Обработка строки %s: %s", num, line, level="DEBUG")
 
             match line:
                 case [Tokens.define, Tokens.class_, name, Tokens.left_bracket]:
-                    printer.logging(f"Объявление класса: {name}", level="INFO")
+                    printer.logging("Объявление класса: %s", name, level="INFO")
                     self.name = name
 
                 case [Tokens.define, Tokens.class_, name, Tokens.extend, Tokens.from_, parent, Tokens.left_bracket]:
-                    printer.logging(f"Объявление класса {name} с родителем {parent}", level="INFO")
+                    printer.logging("Объявление класса %s с родителем %s", name, parent, level="INFO")
                     self.name = name
                     self.parent = parent
 
                 case [
                     Tokens.define, Tokens.method, Tokens.left_bracket, _, Tokens.right_bracket, name, *_
                 ]:
-                    printer.logging(f"Обнаружен метод {name} в классе {self.name}", level="DEBUG")
+                    printer.logging("Обнаружен метод %s в классе %s", name, self.name, level="DEBUG")
                     if name in self.methods.keys():
-                        printer.logging(f"Ошибка: метод {name} уже существует", level="ERROR")
+                        printer.logging("Ошибка: метод %s уже существует", name, level="ERROR")
                         raise NameAlreadyExist(name, info=self.info)
 
-                    printer.logging(f"Запуск парсера для метода {name}", level="TRACE")
+                    printer.logging("Запуск парсера для метода %s", name, level="TRACE")
                     method = self.execute_parse(DefineMethodParser, body, num)
                     self.methods[name] = method
-                    printer.logging(f"Метод {name} успешно обработан", level="DEBUG")
+                    printer.logging("Метод %s успешно обработан", name, level="DEBUG")
 
                 case [Tokens.define, Tokens.constructor, Tokens.left_bracket, _, Tokens.right_bracket, *_]:
                     printer.logging("Обнаружен конструктор класса", level="DEBUG")
@@ -115,16 +115,16 @@ class DefineClassParser(Parser):
                     printer.logging("Конструктор успешно обработан", level="DEBUG")
 
                 case [Tokens.right_bracket]:
-                    printer.logging(f"Завершение парсинга класса {self.name}", level="INFO")
-                    printer.logging(f"Итоговые данные класса:", level="DEBUG")
-                    printer.logging(f"- Родитель: {self.parent}", level="DEBUG")
-                    printer.logging(f"- Методы: {list(self.methods.keys())}", level="DEBUG")
-                    printer.logging(f"- Конструктор: {'присутствует' if self.constructor else 'отсутствует'}",
+                    printer.logging("Завершение парсинга класса %s", self.name, level="INFO")
+                    printer.logging("Итоговые данные класса:", level="DEBUG")
+                    printer.logging("- Родитель: %s", self.parent, level="DEBUG")
+                    printer.logging("- Методы: %s", list(self.methods.keys()), level="DEBUG")
+                    printer.logging("- Конструктор: %s", 'присутствует' if self.constructor else 'отсутствует',
                                     level="DEBUG")
                     return num
 
                 case _:
-                    printer.logging(f"Неверный синтаксис в строке: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис в строке: %s", line, level="ERROR")
                     raise InvalidSyntaxError(info=self.info)
 
         printer.logging("Ошибка: не найдена закрывающая скобка класса", level="ERROR")
@@ -16,11 +16,11 @@ class DefineConstructorMetaObject(DefineMethodMetaObject):
             self, stop_num: int, body: Optional[MetaObject], arguments_name: list[Optional[str]],
             info: Info, default_arguments: Optional[dict[str, Expression]], this: str
     ):
-        printer.logging(f"Создание метаобъекта конструктора (стоп-номер: {stop_num})", level="DEBUG")
-        printer.logging(f"Аргументы: {arguments_name}", level="TRACE")
-        printer.logging(f"Аргументы по умолчанию: {default_arguments.keys() if default_arguments else 'нет'}",
+        printer.logging("Создание метаобъекта конструктора (стоп-номер: %s)", stop_num, level="DEBUG")
+        printer.logging("Аргументы: %s", arguments_name, level="TRACE")
+        printer.logging("Аргументы по умолчанию: %s", default_arguments.keys() if default_arguments else 'нет',
                         level="TRACE")
-        printer.logging(f"Ключевое слово 'this': {this}", level="TRACE")
+        printer.logging("Ключевое слово 'this': %s", this, level="TRACE")
 
         super().__init__(stop_num, "", body, arguments_name, info, default_arguments, this)
 
@@ -45,8 +45,8 @@ class DefineConstructorParser(DefineMethodParser):
         printer.logging("Инициализация парсера конструктора", level="TRACE")
 
     def create_metadata(self, stop_num: int) -> DefineConstructorMetaObject:
-        printer.logging(f"Создание метаданных конструктора (стоп-номер: {stop_num})", level="DEBUG")
-        printer.logging(f"Количество аргументов: {len(self.arguments_name)}", level="TRACE")
+        printer.logging("Создание метаданных конструктора (стоп-номер: %s)", stop_num, level="DEBUG")
+        printer.logging("Количество аргументов: %s", len(self.arguments_name), level="TRACE")
         return DefineConstructorMetaObject(
             stop_num,
             body=self.body,
@@ -57,7 +57,7 @@ class DefineConstructorParser(DefineMethodParser):
         )
 
     def parse(self, body: list[Line], jump) -> int:
-        printer.logging(f"Начало парсинга конструктора (строки {jump}-{len(body)})", level="INFO")
+        printer.logging("Начало парсинга конструктора (строки %s-%s)", jump, len(body), level="INFO")
         self.jump = jump
 
         for num, line in enumerate(body):
@@ -65,16 +65,16 @@ class DefineConstructorParser(DefineMethodParser):
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку {num}: {line}", level="TRACE")
+                printer.logging("Игнорируем строку %s: %s", num, line, level="TRACE")
                 continue
 
             if self.info is None:
                 self.info = line.get_file_info()
-                printer.logging(f"Установка информации о файле: {self.info}", level="TRACE")
+                printer.logging("Установка информации о файле: %s", self.info, level="TRACE")
 
             info_line = line.get_file_info()
             line = self.separate_line_to_token(line)
-            printer.logging(f"Обработка строки {num}: {line}", level="DEBUG")
+            printer.logging("Обработка строки %s: %s", num, line, level="DEBUG")
 
             match line:
                 case [
@@ -82,8 +82,8 @@ class DefineConstructorParser(DefineMethodParser):
                     Tokens.left_bracket, *arguments, Tokens.right_bracket, Tokens.left_bracket
                 ]:
                     printer.logging("Обнаружено объявление конструктора", level="INFO")
-                    printer.logging(f"Ключевое слово для this: {this}", level="DEBUG")
-                    printer.logging(f"Аргументы конструктора: {arguments}", level="DEBUG")
+                    printer.logging("Ключевое слово для this: %s", this, level="DEBUG")
+                    printer.logging("Аргументы конструктора: %s", arguments, level="DEBUG")
 
                     self.parse_define_procedure(body, "_", arguments, num, info_line)
                     self.this = this
@@ -95,7 +95,7 @@ class DefineConstructorParser(DefineMethodParser):
                     return num
 
                 case _:
-                    printer.logging(f"Неверный синтаксис в строке {num}: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис в строке %s: %s", num, line, level="ERROR")
                     raise InvalidSyntaxError(info=info_line)
 
         printer.logging("Ошибка: не найдена закрывающая скобка конструктора", level="ERROR")
@@ -57,7 +57,7 @@ class DefineMethodParser(DefineProcedureParser):
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             if self.info is None:
@@ -76,7 +76,7 @@ class DefineMethodParser(DefineProcedureParser):
                 case [Tokens.right_bracket]:
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(info=info_line)
 
         raise InvalidSyntaxError
@@ -23,11 +23,11 @@ class ActualSituationMetaObject(MetaObject):
         self.args = args
         self.info = info
         printer.logging(
-            f"Создан объект ActualSituationMetadata с stop_num={stop_num}, fact_name='{fact_name}', args={args}",
+            "Создан объект ActualSituationMetadata с stop_num=%s, fact_name='%s', args=%s", stop_num, fact_name, args,
             level="INFO")
 
     def create_image(self):
-        printer.logging(f"Создание образа факта с name='{self.fact_name}', args={self.args}", level="INFO")
+        printer.logging("Создание образа факта с name='%s', args=%s", self.fact_name, self.args, level="INFO")
         return Image(
             name=self.fact_name,
             obj=FactSituation,
@@ -49,8 +49,9 @@ class CreateActualSituationParser(Parser):
 
     def create_metadata(self, stop_num: int) -> MetaObject:
         printer.logging(
-            f"Создание метаданных с stop_num={stop_num}, fact_name='{self.fact_name}', name_object='{self.name_object}', name_subject='{self.name_subject}'",
-            level="INFO")
+            "Создание метаданных с stop_num=%s, fact_name='%s', name_object='%s', name_subject='%s'",
+            stop_num, self.fact_name, self.name_object, self.name_subject, level="INFO"
+        )
         return ActualSituationMetaObject(
             stop_num,
             self.fact_name,
@@ -62,14 +63,14 @@ class CreateActualSituationParser(Parser):
 
     def parse(self, body: list[Line], jump) -> int:
         self.jump = jump
-        printer.logging(f"Начало парсинга с jump={jump}, {FactSituation.__name__}", level="INFO")
+        printer.logging("Начало парсинга с jump=%s, %s", jump, FactSituation.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < self.jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
@@ -78,22 +79,25 @@ class CreateActualSituationParser(Parser):
             match line:
                 case [Tokens.create, Tokens.the_actual, Tokens.the_situation, fact_name, Tokens.left_bracket]:
                     self.fact_name = fact_name
-                    printer.logging(f"Найдена секция 'create actual situation' с fact_name='{fact_name}'", level="INFO")
+                    printer.logging(
+                        "Найдена секция 'create actual situation' с fact_name='%s'",
+                        fact_name, level="INFO"
+                    )
                 case [Tokens.object, name_object, Tokens.comma]:
                     self.name_object = name_object
-                    printer.logging(f"Найден объект с name_object='{name_object}'", level="INFO")
+                    printer.logging("Найден объект с name_object='%s'", name_object, level="INFO")
                 case [Tokens.subject, name_subject, Tokens.comma]:
                     self.name_subject = name_subject
-                    printer.logging(f"Найден субъект с name_subject='{name_subject}'", level="INFO")
+                    printer.logging("Найден субъект с name_subject='%s'", name_subject, level="INFO")
                 case [Tokens.data, *_]:
                     meta = self.execute_parse(DataParser, body, num)
                     self.data = meta.data
-                    printer.logging(f"Данные успешно парсены: {self.data}", level="INFO")
+                    printer.logging("Данные успешно парсены: %s", self.data, level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(info=self.info)
 
         printer.logging("Парсинг завершен с ошибкой: неверный синтаксис", level="ERROR")
@@ -110,7 +114,7 @@ class CollectionData(MetaObject):
         super().__init__(stop_num)
         self.data = data
         self.args = args
-        printer.logging(f"Создан объект CollectionData с stop_num={stop_num}, data={data}", level="INFO")
+        printer.logging("Создан объект CollectionData с stop_num=%s, data=%s", stop_num, data, level="INFO")
 
     def create_image(self): ...
 
@@ -124,7 +128,7 @@ class DataParser(Parser):
 
     def create_metadata(self, stop_num: int) -> CollectionData:
         printer.logging(
-            f"Создание метаданных CollectionData с stop_num={stop_num}, collection_data={self.collection_data}",
+            "Создание метаданных CollectionData с stop_num=%s, collection_data=%s", stop_num, self.collection_data,
             level="INFO")
         return CollectionData(
             stop_num,
@@ -133,14 +137,14 @@ class DataParser(Parser):
 
     def parse(self, body: list[Line], jump) -> int:
         self.jump = jump
-        printer.logging(f"Начало парсинга данных с jump={jump}", level="INFO")
+        printer.logging("Начало парсинга данных с jump=%s", jump, level="INFO")
 
         for num, line in enumerate(body):
             if num < self.jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             info = line.get_file_info()
@@ -162,12 +166,12 @@ class DataParser(Parser):
                     value.set_info(info)
 
                     self.collection_data[name_data] = value
-                    printer.logging(f"Добавлено data: {name_data} = {value}", level="INFO")
+                    printer.logging("Добавлено data: %s = %s", name_data, value, level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг данных завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис в DataParser: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис в DataParser: %s", line, level="ERROR")
                     raise InvalidSyntaxError(info=info)
 
         printer.logging("Парсинг данных завершен с ошибкой: неверный синтаксис", level="ERROR")
@@ -18,10 +18,13 @@ class DocumentMetaObject(MetaObject):
         self.name = name
         self.args = args
         self.info = info
-        printer.logging(f"Создан объект DocumentMetadata с stop_num={stop_num}, name='{name}', args={args}", level="INFO")
+        printer.logging(
+            "Создан объект DocumentMetadata с stop_num=%s, name='%s', args=%s",
+            stop_num, name, args, level="INFO"
+        )
 
     def create_image(self):
-        printer.logging(f"Создание образа документа с name='{self.name}', args={self.args}", level="INFO")
+        printer.logging("Создание образа документа с name='%s', args=%s", self.name, self.args, level="INFO")
         return Image(
             name=self.name,
             obj=Document,
@@ -42,7 +45,10 @@ class CreateDocumentParser(Parser):
         printer.logging("Инициализация CreateDocumentParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных документа с stop_num={stop_num}, document_name='{self.document_name}', hypothesis='{self.hypothesis}', disposition='{self.disposition}', sanction='{self.sanction}'", level="INFO")
+        printer.logging(
+            "Создание метаданных документа с stop_num=%s, document_name='%s', hypothesis='%s', disposition='%s', sanction='%s'",
+            stop_num, self.document_name, self.hypothesis, self.disposition, self.sanction, level="INFO"
+        )
         return DocumentMetaObject(
             stop_num,
             self.document_name,
@@ -54,14 +60,14 @@ class CreateDocumentParser(Parser):
 
     def parse(self, body: list[Line], jump) -> int:
         self.jump = jump
-        printer.logging(f"Начало парсинга документа с jump={jump} {Document.__name__}", level="INFO")
+        printer.logging("Начало парсинга документа с jump=%s %s", jump, Document.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < self.jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
@@ -70,7 +76,10 @@ class CreateDocumentParser(Parser):
             match line:
                 case [Tokens.create, Tokens.document, document_name, Tokens.left_bracket]:
                     self.document_name = document_name
-                    printer.logging(f"Найдена секция 'create document' с document_name='{document_name}'", level="INFO")
+                    printer.logging(
+                        "Найдена секция 'create document' с document_name='%s'",
+                        document_name, level="INFO"
+                    )
                 case [Tokens.disposition, Tokens.left_bracket]:
                     printer.logging("Начало секции 'disposition'", level="INFO")
                     meta = self.execute_parse(DefineDispositionParser, body, num)
@@ -90,7 +99,7 @@ class CreateDocumentParser(Parser):
                     printer.logging("Парсинг документа завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=self.info)
 
         printer.logging("Парсинг документа завершен с ошибкой: неверный синтаксис", level="ERROR")
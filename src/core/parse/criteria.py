@@ -16,10 +16,10 @@ class DefineCriteriaMetaObject(MetaObject):
         super().__init__(stop_num)
         self.criteria = criteria
         self.info = info
-        printer.logging(f"Создано DefineCriteriaMetadata с stop_num={stop_num} и criteria={criteria}", level="INFO")
+        printer.logging("Создано DefineCriteriaMetadata с stop_num=%s и criteria=%s", stop_num, criteria, level="INFO")
 
     def create_image(self) -> Image:
-        printer.logging(f"Создание образа DefineCriteriaMetadata с criteria={self.criteria}", level="INFO")
+        printer.logging("Создание образа DefineCriteriaMetadata с criteria=%s", self.criteria, level="INFO")
         return Image(
             name=str(id(self)),
             obj=Criteria,
@@ -36,7 +36,7 @@ class DefineCriteriaParser(Parser):
         printer.logging("Инициализация DefineCriteriaParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных DefineCriteria с stop_num={stop_num} и criteria={self.criteria}",
+        printer.logging("Создание метаданных DefineCriteria с stop_num=%s и criteria=%s", stop_num, self.criteria,
                         level="INFO")
         return DefineCriteriaMetaObject(
             stop_num,
@@ -67,14 +67,14 @@ class DefineCriteriaParser(Parser):
             return String(self.parse_sequence_words_to_str([value]))
 
     def parse(self, body: list[Line], jump) -> int:
-        printer.logging(f"Начало парсинга DefineCriteria с jump={jump} {Criteria.__name__}", level="INFO")
+        printer.logging("Начало парсинга DefineCriteria с jump=%s %s", jump, Criteria.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
@@ -87,17 +87,20 @@ class DefineCriteriaParser(Parser):
                     self.criteria[name_criteria] = Only(
                         self.parse_single_value(self.parse_sequence_words_to_str(value), line)
                     )
-                    printer.logging(f"Добавлено условие 'Only' для {name_criteria} с значениями {value}", level="INFO")
+                    printer.logging(
+                        "Добавлено условие 'Only' для %s с значениями %s",
+                        name_criteria, value, level="INFO"
+                    )
                 case [name_criteria, Tokens.not_, Tokens.may, Tokens.be, *value, Tokens.comma]:
                     processed_value = self.process_not_may_be_case(name_criteria, value, line)
                     self.criteria[name_criteria] = NotEqual(processed_value)
                     printer.logging(
-                        f"Добавлено условие 'NotEqual' для {name_criteria} с значениями {value}", level="INFO"
+                        "Добавлено условие 'NotEqual' для %s с значениями %s", name_criteria, value, level="INFO"
                     )
                 case [name_criteria, Tokens.less, value, Tokens.comma]:
                     value = self.parse_to_num(value, line)
                     self.criteria[name_criteria] = LessThan(value)
-                    printer.logging(f"Добавлено условие 'LessThan' для {name_criteria} с значением {value}",
+                    printer.logging("Добавлено условие 'LessThan' для %s с значением %s", name_criteria, value,
                                     level="INFO")
                 case [name_criteria, Tokens.procedure, procedure_name, *modify_type, Tokens.comma]:
                     modify_type = self.parse_sequence_words_to_str(modify_type)
@@ -115,12 +118,14 @@ class DefineCriteriaParser(Parser):
                     modify = modify_map[modify_type]
 
                     self.criteria[name_criteria] = ProcedureModifyWrapper(modify(procedure_name))
-                    printer.logging(f"Добавлено условие '{modify_type}' для {name_criteria} с значением {procedure_name}",
-                                    level="INFO")
+                    printer.logging(
+                        "Добавлено условие '%s' для %s с значением %s",
+                        modify_type, name_criteria, procedure_name, level="INFO"
+                    )
                 case [name_criteria, Tokens.greater, value, Tokens.comma]:
                     value = self.parse_to_num(value, line)
                     self.criteria[name_criteria] = GreaterThan(value)
-                    printer.logging(f"Добавлено условие 'GreaterThan' для {name_criteria} с значением {value}",
+                    printer.logging("Добавлено условие 'GreaterThan' для %s с значением %s", name_criteria, value,
                                     level="INFO")
                 case [name_criteria, Tokens.between, value1, Tokens.and_, value2, Tokens.comma]:
                     values = []
@@ -129,13 +134,13 @@ class DefineCriteriaParser(Parser):
                         values.append(self.parse_to_num(value, line))
 
                     self.criteria[name_criteria] = Between(*values)
-                    printer.logging(f"Добавлено условие 'Between' для {name_criteria} с значениями {values}",
+                    printer.logging("Добавлено условие 'Between' для %s с значениями %s", name_criteria, values,
                                     level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг criteria завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=self.info)
 
         printer.logging("Парсинг criteria завершен с ошибкой: неверный синтаксис", level="ERROR")
@@ -17,10 +17,16 @@ class DefineConditionMetaObject(MetaObject):
         self.name = name
         self.description = description
         self.criteria = criteria
-        printer.logging(f"Создано DefineConditionMetadata с stop_num={stop_num}, name={name}, description={description}", level="INFO")
+        printer.logging(
+            "Создано DefineConditionMetadata с stop_num=%s, name=%s, description=%s",
+            stop_num, name, description, level="INFO"
+        )
 
     def create_image(self) -> Image:
-        printer.logging(f"Создание образа DefineCondition с name={self.name}, description={self.description}, criteria={self.criteria}", level="INFO")
+        printer.logging(
+            "Создание образа DefineCondition с name=%s, description=%s, criteria=%s",
+            self.name, self.description, self.criteria, level="INFO"
+        )
         return Image(
             name=self.name,
             obj=Condition,
@@ -40,7 +46,10 @@ class DefineConditionParser(Parser):
         printer.logging("Инициализация DefineConditionParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных DefineCondition с stop_num={stop_num}, name={self.name_condition}, description={self.description}, criteria={self.criteria}", level="INFO")
+        printer.logging(
+            "Создание метаданных DefineCondition с stop_num=%s, name=%s, description=%s, criteria=%s",
+            stop_num, self.name_condition, self.description, self.criteria, level="INFO"
+        )
         return DefineConditionMetaObject(
             stop_num,
             name=self.name_condition,
@@ -51,14 +60,14 @@ class DefineConditionParser(Parser):
 
     def parse(self, body: list[Line], jump) -> int:
         self.jump = jump
-        printer.logging(f"Начало парсинга DefineCondition с jump={jump} {Condition.__name__}", level="INFO")
+        printer.logging("Начало парсинга DefineCondition с jump=%s %s", jump, Condition.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < self.jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
@@ -67,19 +76,19 @@ class DefineConditionParser(Parser):
             match line:
                 case [Tokens.define, Tokens.condition, name_condition, Tokens.left_bracket]:
                     self.name_condition = name_condition
-                    printer.logging(f"Обнаружено определение условия: {name_condition}", level="INFO")
+                    printer.logging("Обнаружено определение условия: %s", name_condition, level="INFO")
                 case [Tokens.description, *description, Tokens.comma]:
                     self.description = self.parse_sequence_words_to_str(description)
-                    printer.logging(f"Добавлено описание условия: {self.description}", level="INFO")
+                    printer.logging("Добавлено описание условия: %s", self.description, level="INFO")
                 case [Tokens.criteria, *_]:
                     meta = self.execute_parse(DefineCriteriaParser, body, num)
                     self.criteria = meta
-                    printer.logging(f"Обработаны критерии для условия: {self.criteria}", level="INFO")
+                    printer.logging("Обработаны критерии для условия: %s", self.criteria, level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг условия завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(info=self.info)
 
         printer.logging("Парсинг условия завершен с ошибкой: неверный синтаксис", level="ERROR")
@@ -16,10 +16,16 @@ class DispositionMetaObject(MetaObject):
         self.duty = duty
         self.rule = rule
         self.info = info
-        printer.logging(f"Создано DispositionMetadata с stop_num={stop_num}, right={right}, duty={duty}, rule={rule}", level="INFO")
+        printer.logging(
+            "Создано DispositionMetadata с stop_num=%s, right=%s, duty=%s, rule=%s",
+            stop_num, right, duty, rule, level="INFO"
+        )
 
     def create_image(self) -> Image:
-        printer.logging(f"Создание образа Disposition с right={self.right}, duty={self.duty}, rule={self.rule}", level="INFO")
+        printer.logging(
+            "Создание образа Disposition с right=%s, duty=%s, rule=%s",
+            self.right, self.duty, self.rule, level="INFO"
+        )
         return Image(
             name=self.right,
             obj=Disposition,
@@ -38,7 +44,10 @@ class DefineDispositionParser(Parser):
         printer.logging("Инициализация DefineDispositionParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных Disposition с stop_num={stop_num}, right={self.right}, duty={self.duty}, rule={self.rule}", level="INFO")
+        printer.logging(
+            "Создание метаданных Disposition с stop_num=%s, right=%s, duty=%s, rule=%s",
+            stop_num, self.right, self.duty, self.rule, level="INFO"
+        )
         return DispositionMetaObject(
             stop_num,
             right=self.right,
@@ -48,14 +57,14 @@ class DefineDispositionParser(Parser):
         )
 
     def parse(self, body: list[Line], jump: int) -> int:
-        printer.logging(f"Начало парсинга DefineDisposition с jump={jump} {Disposition.__name__}", level="INFO")
+        printer.logging("Начало парсинга DefineDisposition с jump=%s %s", jump, Disposition.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
@@ -67,18 +76,18 @@ class DefineDispositionParser(Parser):
                     ...
                 case [Tokens.law, right, Tokens.comma]:
                     self.right = right
-                    printer.logging(f"Добавлено право: {self.right}", level="INFO")
+                    printer.logging("Добавлено право: %s", self.right, level="INFO")
                 case [Tokens.duty, duty, Tokens.comma]:
                     self.duty = duty
-                    printer.logging(f"Добавлено обязанность: {self.duty}", level="INFO")
+                    printer.logging("Добавлено обязанность: %s", self.duty, level="INFO")
                 case [Tokens.rule, rule, Tokens.comma]:
                     self.rule = rule
-                    printer.logging(f"Добавлено правило: {self.rule}", level="INFO")
+                    printer.logging("Добавлено правило: %s", self.rule, level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг disposition завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=self.info)
 
         printer.logging("Парсинг disposition завершен с ошибкой: неверный синтаксис", level="ERROR")
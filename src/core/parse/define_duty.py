@@ -15,10 +15,16 @@ class DefineDutyMetaObject(MetaObject):
         self.name = name
         self.description = description
         self.info = info
-        printer.logging(f"Создано DefineDutyMetadata с stop_num={stop_num}, name={name}, description={description}", level="INFO")
+        printer.logging(
+            "Создано DefineDutyMetadata с stop_num=%s, name=%s, description=%s",
+            stop_num, name, description, level="INFO"
+        )
 
     def create_image(self) -> Image:
-        printer.logging(f"Создание образа Obligation с name={self.name}, description={self.description}", level="INFO")
+        printer.logging(
+            "Создание образа Obligation с name=%s, description=%s",
+            self.name, self.description, level="INFO"
+        )
         return Image(
             name=self.name,
             obj=Obligation,
@@ -36,7 +42,10 @@ class DefineDutyParser(Parser):
         printer.logging("Инициализация DefineDutyParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных DefineDuty с stop_num={stop_num}, name={self.name_obligation}, description={self.description}", level="INFO")
+        printer.logging(
+            "Создание метаданных DefineDuty с stop_num=%s, name=%s, description=%s",
+            stop_num, self.name_obligation, self.description, level="INFO"
+        )
         return DefineDutyMetaObject(
             stop_num,
             name=self.name_obligation,
@@ -45,14 +54,14 @@ class DefineDutyParser(Parser):
         )
 
     def parse(self, body: list[Line], jump: int) -> int:
-        printer.logging(f"Начало парсинга DefineDuty с jump={jump} {Obligation.__name__}", level="INFO")
+        printer.logging("Начало парсинга DefineDuty с jump=%s %s", jump, Obligation.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
@@ -61,15 +70,15 @@ class DefineDutyParser(Parser):
             match line:
                 case [Tokens.define, Tokens.duty, name_obligation, Tokens.left_bracket]:
                     self.name_obligation = name_obligation
-                    printer.logging(f"Обнаружено определение обязанности: {self.name_obligation}", level="INFO")
+                    printer.logging("Обнаружено определение обязанности: %s", self.name_obligation, level="INFO")
                 case [Tokens.description, *description, Tokens.comma]:
                     self.description = " ".join(description)
-                    printer.logging(f"Добавлено описание обязанности: {self.description}", level="INFO")
+                    printer.logging("Добавлено описание обязанности: %s", self.description, level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг обязанности завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=self.info)
 
         printer.logging("Парсинг обязанности завершен с ошибкой: неверный синтаксис", level="ERROR")
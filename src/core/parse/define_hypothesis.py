@@ -14,10 +14,10 @@ class HypothesisMetaObject(MetaObject):
         super().__init__(stop_num)
         self.info = info
         self.args = args
-        printer.logging(f"Создано HypothesisMetadata с stop_num={stop_num}, args={args}", level="INFO")
+        printer.logging("Создано HypothesisMetadata с stop_num=%s, args=%s", stop_num, args, level="INFO")
 
     def create_image(self):
-        printer.logging(f"Создание образа Hypothesis с args={self.args}", level="INFO")
+        printer.logging("Создание образа Hypothesis с args=%s", self.args, level="INFO")
         return Image(
             name=str(id(self)),
             obj=Hypothesis,
@@ -36,7 +36,10 @@ class DefineHypothesisParser(Parser):
         printer.logging("Инициализация DefineHypothesisParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных Hypothesis с stop_num={stop_num}, subject={self.subject}, object={self.object}, condition={self.condition}", level="INFO")
+        printer.logging(
+            "Создание метаданных Hypothesis с stop_num=%s, subject=%s, object=%s, condition=%s",
+            stop_num, self.subject, self.object, self.condition, level="INFO"
+        )
         return HypothesisMetaObject(
             stop_num,
             self.info,
@@ -46,14 +49,14 @@ class DefineHypothesisParser(Parser):
         )
 
     def parse(self, body: list[Line], jump: int) -> int:
-        printer.logging(f"Начало парсинга DefineHypothesis с jump={jump} {Hypothesis.__name__}", level="INFO")
+        printer.logging("Начало парсинга DefineHypothesis с jump=%s %s", jump, Hypothesis.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
@@ -64,18 +67,18 @@ class DefineHypothesisParser(Parser):
                     printer.logging("Обнаружено начало гипотезы", level="INFO")
                 case [Tokens.subject, subject, Tokens.comma]:
                     self.subject = subject
-                    printer.logging(f"Добавлен субъект гипотезы: {self.subject}", level="INFO")
+                    printer.logging("Добавлен субъект гипотезы: %s", self.subject, level="INFO")
                 case [Tokens.object, object, Tokens.comma]:
                     self.object = object
-                    printer.logging(f"Добавлен объект гипотезы: {self.object}", level="INFO")
+                    printer.logging("Добавлен объект гипотезы: %s", self.object, level="INFO")
                 case [Tokens.condition, condition, Tokens.comma]:
                     self.condition = condition
-                    printer.logging(f"Добавлено условие гипотезы: {self.condition}", level="INFO")
+                    printer.logging("Добавлено условие гипотезы: %s", self.condition, level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг гипотезы завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=self.info)
 
         printer.logging("Парсинг гипотезы завершен с ошибкой: неверный синтаксис", level="ERROR")
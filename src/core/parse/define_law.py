@@ -16,10 +16,13 @@ class DefineLawMetaObject(MetaObject):
         self.name_law = name_law
         self.description = description
         self.info = info
-        printer.logging(f"Создано DefineLawMetadata с stop_num={stop_num}, name={name}, name_law={name_law}, description={description}", level="INFO")
+        printer.logging(
+            "Создано DefineLawMetadata с stop_num=%s, name=%s, name_law=%s, description=%s",
+            stop_num, name, name_law, description, level="INFO"
+        )
 
     def create_image(self) -> Image:
-        printer.logging(f"Создание образа Law с name={self.name}, description={self.description}", level="INFO")
+        printer.logging("Создание образа Law с name=%s, description=%s", self.name, self.description, level="INFO")
         return Image(
             name=self.name,
             obj=Law,
@@ -38,7 +41,10 @@ class DefineLawParser(Parser):
         printer.logging("Инициализация DefineLawParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных Law с stop_num={stop_num}, name={self.name}, name_law={self.name_law}, description={self.description}", level="INFO")
+        printer.logging(
+            "Создание метаданных Law с stop_num=%s, name=%s, name_law=%s, description=%s",
+            stop_num, self.name, self.name_law, self.description, level="INFO"
+        )
         return DefineLawMetaObject(
             stop_num,
             name=self.name,
@@ -48,14 +54,14 @@ class DefineLawParser(Parser):
         )
 
     def parse(self, body: list[Line], jump: int) -> int:
-        printer.logging(f"Начало парсинга DefineLaw с jump={jump} {Law.__name__}", level="INFO")
+        printer.logging("Начало парсинга DefineLaw с jump=%s %s", jump, Law.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
@@ -65,15 +71,15 @@ class DefineLawParser(Parser):
                 case [Tokens.define, Tokens.law, name_law, Tokens.left_bracket]:
                     self.name_law = name_law
                     self.name = name_law
-                    printer.logging(f"Обнаружено определение закона: {self.name_law}", level="INFO")
+                    printer.logging("Обнаружено определение закона: %s", self.name_law, level="INFO")
                 case [Tokens.description, *description, Tokens.comma]:
                     self.description = " ".join(description)
-                    printer.logging(f"Добавлено описание закона: {self.description}", level="INFO")
+                    printer.logging("Добавлено описание закона: %s", self.description, level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг закона завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=self.info)
 
         printer.logging("Парсинг закона завершен с ошибкой: неверный синтаксис", level="ERROR")
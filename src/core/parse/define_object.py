@@ -15,10 +15,13 @@ class DefineObjectMetaObject(MetaObject):
         self.name = name
         self.name_object = name_object
         self.info = info
-        printer.logging(f"Создано DefineObjectMetadata с stop_num={stop_num}, name={name}, name_object={name_object}", level="INFO")
+        printer.logging(
+            "Создано DefineObjectMetadata с stop_num=%s, name=%s, name_object=%s",
+            stop_num, name, name_object, level="INFO"
+        )
 
     def create_image(self) -> Image:
-        printer.logging(f"Создание образа Object с name={self.name}, name_object={self.name_object}", level="INFO")
+        printer.logging("Создание образа Object с name=%s, name_object=%s", self.name, self.name_object, level="INFO")
         return Image(
             name=self.name,
             obj=Object,
@@ -36,7 +39,10 @@ class DefineObjectParser(Parser):
         printer.logging("Инициализация DefineObjectParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных Object с stop_num={stop_num}, name_object_define={self.name_object_define}, name_object={self.name_object}", level="INFO")
+        printer.logging(
+            "Создание метаданных Object с stop_num=%s, name_object_define=%s, name_object=%s",
+            stop_num, self.name_object_define, self.name_object, level="INFO"
+        )
         return DefineObjectMetaObject(
             stop_num,
             name=self.name_object_define,
@@ -45,14 +51,14 @@ class DefineObjectParser(Parser):
         )
 
     def parse(self, body: list[Line], jump: int) -> int:
-        printer.logging(f"Начало парсинга DefineObject с jump={jump} {Object.__name__}", level="INFO")
+        printer.logging("Начало парсинга DefineObject с jump=%s %s", jump, Object.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
@@ -61,15 +67,15 @@ class DefineObjectParser(Parser):
             match line:
                 case [Tokens.define, Tokens.object, name_object, Tokens.left_bracket]:
                     self.name_object_define = name_object
-                    printer.logging(f"Обнаружено определение объекта: {self.name_object_define}", level="INFO")
+                    printer.logging("Обнаружено определение объекта: %s", self.name_object_define, level="INFO")
                 case [Tokens.name, *name_object, Tokens.comma]:
                     self.name_object = " ".join(name_object)
-                    printer.logging(f"Добавлено имя объекта: {self.name_object}", level="INFO")
+                    printer.logging("Добавлено имя объекта: %s", self.name_object, level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг объекта завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=self.info)
 
         printer.logging("Парсинг объекта завершен с ошибкой: неверный синтаксис", level="ERROR")
@@ -15,11 +15,13 @@ class DefineRuleMetaObject(MetaObject):
         self.name = name
         self.description = description
         self.info = info
-        printer.logging(f"Создано DefineRuleMetadata с stop_num={stop_num}, name={name}, description={description}",
-                        level="INFO")
+        printer.logging(
+            "Создано DefineRuleMetadata с stop_num=%s, name=%s, description=%s",
+            stop_num, name, description, level="INFO"
+        )
 
     def create_image(self) -> Image:
-        printer.logging(f"Создание образа Rule с name={self.name}, description={self.description}", level="INFO")
+        printer.logging("Создание образа Rule с name=%s, description=%s", self.name, self.description, level="INFO")
         return Image(
             name=self.name,
             obj=Rule,
@@ -38,8 +40,8 @@ class DefineRuleParser(Parser):
 
     def create_metadata(self, stop_num: int) -> MetaObject:
         printer.logging(
-            f"Создание метаданных Rule с stop_num={stop_num}, "
-            f"name_rule={self.name_rule}, description={self.description}", level="INFO"
+            "Создание метаданных Rule с stop_num=%s, name_rule=%s, description=%s",
+            stop_num, self.name_rule, self.description, level="INFO"
         )
         return DefineRuleMetaObject(
             stop_num,
@@ -49,14 +51,14 @@ class DefineRuleParser(Parser):
         )
 
     def parse(self, body: list[Line], jump: int) -> int:
-        printer.logging(f"Начало парсинга DefineRule с jump={jump} {Rule.__name__}", level="INFO")
+        printer.logging("Начало парсинга DefineRule с jump=%s %s", jump, Rule.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
@@ -65,15 +67,15 @@ class DefineRuleParser(Parser):
             match line:
                 case [Tokens.define, Tokens.rule, name_rule, Tokens.left_bracket]:
                     self.name_rule = name_rule
-                    printer.logging(f"Обнаружено определение правила: {self.name_rule}", level="INFO")
+                    printer.logging("Обнаружено определение правила: %s", self.name_rule, level="INFO")
                 case [Tokens.description, *description, Tokens.comma]:
                     self.description = self.parse_sequence_words_to_str(description)
-                    printer.logging(f"Добавлено описание правила: {self.description}", level="INFO")
+                    printer.logging("Добавлено описание правила: %s", self.description, level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг правила завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=self.info)
 
         printer.logging("Парсинг правила завершен с ошибкой: неверный синтаксис", level="ERROR")
@@ -22,12 +22,16 @@ class SanctionMetaObject(MetaObject):
         self.severity = severity
         self.procedural_aspects = procedural_aspects
         self.info = info
-        printer.logging(f"Создано SanctionMetadata с stop_num={stop_num}, types={types}, severity={severity}, "
-                        f"procedural_aspects={procedural_aspects}", level="INFO")
+        printer.logging(
+            "Создано SanctionMetadata с stop_num=%s, types=%s, severity=%s, procedural_aspects=%s",
+            stop_num, types, severity, procedural_aspects, level="INFO"
+        )
 
     def create_image(self) -> Image:
-        printer.logging(f"Создание образа Sanction с types={self.types}, severity={self.severity}, "
-                        f"procedural_aspects={self.procedural_aspects}", level="INFO")
+        printer.logging(
+            "Создание образа Sanction с types=%s, severity=%s, procedural_aspects=%s",
+            self.types, self.severity, self.procedural_aspects, level="INFO"
+        )
         return Image(
             name=str(id(self)),
             obj=Sanction,
@@ -46,8 +50,10 @@ class DefineSanctionParser(Parser):
         printer.logging("Инициализация DefineSanctionParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных Sanction с stop_num={stop_num}, types={self.types}, "
-                        f"severity={self.severity}, procedural_aspects={self.procedural_aspects}", level="INFO")
+        printer.logging(
+            "Создание метаданных Sanction с stop_num=%s, types=%s, severity=%s, procedural_aspects=%s",
+            stop_num, self.types, self.severity, self.procedural_aspects, level="INFO"
+        )
         return SanctionMetaObject(
             stop_num,
             types=self.types,
@@ -57,14 +63,14 @@ class DefineSanctionParser(Parser):
         )
 
     def parse(self, body: list[Line], jump: int) -> int:
-        printer.logging(f"Начало парсинга санкции с jump={jump} {Sanction.__name__}", level="INFO")
+        printer.logging("Начало парсинга санкции с jump=%s %s", jump, Sanction.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
@@ -78,22 +84,22 @@ class DefineSanctionParser(Parser):
                     stop_num = sequence.parse(types, num)
                     self.types = sequence.create_metadata().seq
                     jump = self.next_num_line(stop_num)
-                    printer.logging(f"Определены типы санкции: {self.types}", level="INFO")
+                    printer.logging("Определены типы санкции: %s", self.types, level="INFO")
                 case [Tokens.degree, Tokens.of_rigor, degree, Tokens.comma]:
                     if degree not in Levels:
-                        printer.logging(f"Некорректный уровень строгости: {degree}", level="ERROR")
+                        printer.logging("Некорректный уровень строгости: %s", degree, level="ERROR")
                         raise InvalidLevelDegree(degree)
 
                     self.severity = degree
-                    printer.logging(f"Уровень строгости установлен: {self.severity}", level="INFO")
+                    printer.logging("Уровень строгости установлен: %s", self.severity, level="INFO")
                 case [Tokens.procedural, Tokens.aspect, *procedural_aspect, Tokens.comma]:
                     self.procedural_aspects = self.parse_sequence_words_to_str(procedural_aspect)
-                    printer.logging(f"{self.procedural_aspects}", level="INFO")
+                    printer.logging("%s", self.procedural_aspects, level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг санкции завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=self.info)
 
         printer.logging("Парсинг санкции завершен с ошибкой: неверный синтаксис", level="ERROR")
@@ -22,12 +22,12 @@ class DefineSequenceParser(Parser):
             printer.logging("Попытка создания метаданных без инициализированной последовательности", level="ERROR")
             raise Exception("Sequence is not initialized")
 
-        printer.logging(f"Создание метаданных с последовательностью: {self.sequence}", level="INFO")
+        printer.logging("Создание метаданных с последовательностью: %s", self.sequence, level="INFO")
         return SequenceMetadata(self.sequence)
 
     def parse(self, body: list[Line], jump: int) -> int:
         result = []
-        printer.logging(f"Начало парсинга тела с jump={jump}", level="INFO")
+        printer.logging("Начало парсинга тела с jump=%s", jump, level="INFO")
 
         for word in body:
             word = (
@@ -44,6 +44,6 @@ class DefineSequenceParser(Parser):
             result.append(word)
 
         self.sequence = result
-        printer.logging(f"Парсинг завершен. Обнаруженные слова: {self.sequence}", level="INFO")
+        printer.logging("Парсинг завершен. Обнаруженные слова: %s", self.sequence, level="INFO")
 
         return jump
@@ -16,12 +16,15 @@ class DefineSubjectMetaObject(MetaObject):
         self.name_subject = name_subject
         self.info = info
         printer.logging(
-            f"Создано DefineSubjectMetadata с stop_num={stop_num}, name={name}, name_subject={name_subject}",
+            "Создано DefineSubjectMetadata с stop_num=%s, name=%s, name_subject=%s", stop_num, name, name_subject,
             level="INFO"
         )
 
     def create_image(self) -> Image:
-        printer.logging(f"Создание образа Subject с name={self.name}, name_subject={self.name_subject}", level="INFO")
+        printer.logging(
+            "Создание образа Subject с name=%s, name_subject=%s",
+            self.name, self.name_subject, level="INFO"
+        )
         return Image(
             name=self.name,
             obj=Subject,
@@ -39,7 +42,10 @@ class DefineSubjectParser(Parser):
         printer.logging("Инициализация DefineSubjectParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных Subject с stop_num={stop_num}, name_subject_define={self.name_subject_define}, name_subject={self.name_subject}", level="INFO")
+        printer.logging(
+            "Создание метаданных Subject с stop_num=%s, name_subject_define=%s, name_subject=%s",
+            stop_num, self.name_subject_define, self.name_subject, level="INFO"
+        )
         return DefineSubjectMetaObject(
             stop_num,
             name=self.name_subject_define,
@@ -48,14 +54,14 @@ class DefineSubjectParser(Parser):
         )
 
     def parse(self, body: list[Line], jump: int) -> int:
-        printer.logging(f"Начало парсинга DefineSubject с jump={jump} {Subject.__name__}", level="INFO")
+        printer.logging("Начало парсинга DefineSubject с jump=%s %s", jump, Subject.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="DEBUG")
+                printer.logging("Игнорируем строку: %s", line, level="DEBUG")
                 continue
 
             self.info = line.get_file_info()
@@ -64,15 +70,15 @@ class DefineSubjectParser(Parser):
             match line:
                 case [Tokens.define, Tokens.subject, name_subject, Tokens.left_bracket]:
                     self.name_subject_define = name_subject
-                    printer.logging(f"Обнаружено определение субъекта: {self.name_subject_define}", level="INFO")
+                    printer.logging("Обнаружено определение субъекта: %s", self.name_subject_define, level="INFO")
                 case [Tokens.name, *name_subject, Tokens.comma]:
                     self.name_subject = self.parse_sequence_words_to_str(name_subject)
-                    printer.logging(f"Добавлено имя субъекта: {self.name_subject}", level="INFO")
+                    printer.logging("Добавлено имя субъекта: %s", self.name_subject, level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг субъекта завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=self.info)
 
         printer.logging("Парсинг субъекта завершен с ошибкой: неверный синтаксис", level="ERROR")
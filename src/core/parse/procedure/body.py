@@ -9,7 +9,8 @@ from src.core.types.basetype import BaseType
 from src.core.types.docs import Docs
 from src.core.types.line import Line, Info
 from src.core.types.procedure import Body, AssignField, Expression, When, Loop, Print, Else, Return, Continue, Break, \
-    AssignOverrideVariable, While, ElseWhen, Context, ExceptionHandler, BlockSync, ErrorThrow, Defer
+    AssignOverrideVariable, While, ElseWhen, Context, ExceptionHandler, BlockSync, ErrorThrow, Defer, ForEach, \
+    YieldValue
 from src.core.util import is_ignore_line
 from src.util.console_worker import printer
 
@@ -43,7 +44,7 @@ class BodyParser(Parser):
         printer.logging("Инициализация BodyParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных тела с stop_num={stop_num}, commands={self.commands}", level="INFO")
+        printer.logging("Создание метаданных тела с stop_num=%s, commands=%s", stop_num, self.commands, level="INFO")
         return DefineBodyMetaObject(
             stop_num,
             name=str(id(self)),
@@ -52,6 +53,21 @@ class BodyParser(Parser):
             info=self.info
         )
 
+    def check_loop_var_name(self, var_name: str, line: list[str]):
+        if not is_identifier(var_name):
+            raise InvalidSyntaxError(
+                f"Имя переменной должно состоять только из букв и цифр! Переменная: {var_name}",
+                line=line,
+                info=self.info
+            )
+
+        if var_name in NOT_ALLOWED_TOKENS:
+            raise InvalidSyntaxError(
+                f"Неверный синтаксис. "
+                f"Нельзя использовать зарезервированные слова в качестве имен переменных: '{var_name}'",
+                info=self.info
+            )
+
     def parse_loop(self, expr, line: list[str], body: list[Line], num: int) -> Loop:
         expr = list(expr)
 
@@ -118,7 +134,7 @@ class BodyParser(Parser):
             )
 
         self.commands.append(AssignField(name, Expression(str(), expr, self.info), self.info))
-        printer.logging(f"Добавлена команда AssignField с именем: {name} и выражением: {expr}",
+        printer.logging("Добавлена команда AssignField с именем: %s и выражением: %s", name, expr,
                         level="INFO")
 
     def parse_assign_override(self, expr: list[str], line, body, num):
@@ -177,31 +193,31 @@ class BodyParser(Parser):
 
     def parse(self, body: list[Line], jump) -> int:
         self.jump = jump
-        printer.logging(f"Начало парсинга тела с jump={self.jump} {Body.__name__}", level="INFO")
+        printer.logging("Начало парсинга тела с jump=%s %s", self.jump, Body.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < self.jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
             self.auto_added_end_token_for_expr(line)
             line = self.separate_line_to_token(line)
             self.body_check_tokens(line)
-            printer.logging(f"Парсинг строки: {line}", level="INFO")
+            printer.logging("Парсинг строки: %s", line, level="INFO")
 
             match line:
                 case [Tokens.docs, Tokens.left_bracket]:
                     meta_docs = self.execute_parse(DocsBlockParser, body, self.next_num_line(num))
                     self.docs_block = meta_docs
 
-                    printer.logging(f"Добавлен блок комментариев: {meta_docs}", level="INFO")
+                    printer.logging("Добавлен блок комментариев: %s", meta_docs, level="INFO")
                 case [Tokens.print_, *expr, Tokens.end_expr]:
                     self.commands.append(Print(str(), Expression(str(), expr, self.info)))
-                    printer.logging(f"Добавлена команда Print с выражением: {expr}", level="INFO")
+                    printer.logging("Добавлена команда Print с выражением: %s", expr, level="INFO")
 
                 case [Tokens.print_, *expr]:
                     res_expr = self.execute_parse(MultiExpressionParser, body, self.next_num_line(num))
@@ -209,7 +225,7 @@ class BodyParser(Parser):
                     expr.extend(res_expr.expressions)
 
                     self.commands.append(Print(str(), Expression(str(), expr, self.info)))
-                    printer.logging(f"Добавлена команда Print с выражением: {expr}", level="INFO")
+                    printer.logging("Добавлена команда Print с выражением: %s", expr, level="INFO")
 
                 case [Tokens.when, *expr, Tokens.then, Tokens.left_bracket]:
                     if not expr:
@@ -279,10 +295,10 @@ class BodyParser(Parser):
                     printer.logging("Добавлена команда Else", level="INFO")
                 case [Tokens.assign, name, Tokens.end_expr]:
                     self.parse_assign(name, [Tokens.void], line)
-                    printer.logging(f"Добавлено объявление переменной '{name}'", level="INFO")
+                    printer.logging("Добавлено объявление переменной '%s'", name, level="INFO")
                 case [Tokens.assign, name, Tokens.equal, *expr, Tokens.end_expr]:
                     self.parse_assign(name, expr, line)
-                    printer.logging(f"Добавлено объявление переменной '{name}'", level="INFO")
+                    printer.logging("Добавлено объявление переменной '%s'", name, level="INFO")
 
                 case [Tokens.assign, name, Tokens.equal, *expr]:
                     res_expr = self.execute_parse(MultiExpressionParser, body, self.next_num_line(num))
@@ -290,7 +306,7 @@ class BodyParser(Parser):
                     expr.extend(res_expr.expressions)
                     self.parse_assign(name, expr, line)
 
-                    printer.logging(f"Добавлено объявление переменной '{name}'", level="INFO")
+                    printer.logging("Добавлено объявление переменной '%s'", name, level="INFO")
 
                 case [Tokens.while_, *expr, Tokens.left_bracket]:
                     if not expr:
@@ -313,37 +329,57 @@ class BodyParser(Parser):
                     self.commands.append(loop)
                     printer.logging("Добавлена команда Loop", level="INFO")
                 case [Tokens.loop, var_name, Tokens.from_, *expr, Tokens.left_bracket]:
-                    if not is_identifier(var_name):
-                        raise InvalidSyntaxError(
-                            f"Имя переменной должно состоять только из букв и цифр! Переменная: {var_name}",
-                            line=line,
-                            info=self.info
-                        )
-
-                    if var_name in NOT_ALLOWED_TOKENS:
-                        raise InvalidSyntaxError(
-                            f"Неверный синтаксис. "
-                            f"Нельзя использовать зарезервированные слова в качестве имен переменных: '{var_name}'",
-                            info=self.info
-                        )
-
+                    self.check_loop_var_name(var_name, line)
                     loop = self.parse_loop(expr, line, body, num)
 
                     loop.name_loop_var = var_name
                     self.commands.append(loop)
                     printer.logging("Добавлена команда Loop", level="INFO")
+                case [Tokens.for_, Tokens.each, var_name, Tokens.of, *expr, Tokens.left_bracket]:
+                    self.check_loop_var_name(var_name, line)
+
+                    if not expr:
+                        raise InvalidSyntaxError(
+                            f"Не обнаружено выражение для оператора '{Tokens.of}'",
+                            info=self.info,
+                            line=line
+                        )
+
+                    for_each = ForEach(
+                        str(), var_name, Expression(str(), expr, self.info),
+                        self.execute_parse(BodyParser, body, self.next_num_line(num))
+                    )
+                    for_each.set_info(self.info)
+
+                    self.commands.append(for_each)
+                    printer.logging("Добавлена команда ForEach", level="INFO")
                 case [Tokens.return_, *expr, Tokens.end_expr]:
                     self.commands.append(Return(str(), Expression(str(), expr, self.info)))
-                    printer.logging(f"Добавлена команда Return с выражением: {expr}", level="INFO")
+                    printer.logging("Добавлена команда Return с выражением: %s", expr, level="INFO")
                 case [Tokens.return_, *expr]:
                     res_expr = self.execute_parse(MultiExpressionParser, body, self.next_num_line(num))
 
                     expr.extend(res_expr.expressions)
 
                     self.commands.append(Return(str(), Expression(str(), expr, self.info)))
+                case [Tokens.yield_, Tokens.end_expr]:
+                    raise InvalidSyntaxError(
+                        f"Не обнаружено выражение для оператора '{Tokens.yield_}'",
+                        info=self.info,
+                        line=line
+                    )
+                case [Tokens.yield_, *expr, Tokens.end_expr]:
+                    self.commands.append(YieldValue(str(), Expression(str(), expr, self.info)))
+                    printer.logging("Добавлена команда YieldValue с выражением: %s", expr, level="INFO")
+                case [Tokens.yield_, *expr]:
+                    res_expr = self.execute_parse(MultiExpressionParser, body, self.next_num_line(num))
+
+                    expr.extend(res_expr.expressions)
+
+                    self.commands.append(YieldValue(str(), Expression(str(), expr, self.info)))
                 case [Tokens.defer, *expr, Tokens.end_expr]:
                     self.commands.append(Defer(str(), Expression(str(), expr, self.info)))
-                    printer.logging(f"Добавлена команда Defer с выражением: {expr}", level="INFO")
+                    printer.logging("Добавлена команда Defer с выражением: %s", expr, level="INFO")
                 case [Tokens.defer, *expr]:
                     res_expr = self.execute_parse(MultiExpressionParser, body, self.next_num_line(num))
 
@@ -352,10 +388,10 @@ class BodyParser(Parser):
                     self.commands.append(Defer(str(), Expression(str(), expr, self.info)))
                 case [Tokens.continue_, Tokens.end_expr]:
                     self.commands.append(Continue(str(), self.info))
-                    printer.logging(f"Добавлена команда Continue", level="INFO")
+                    printer.logging("Добавлена команда Continue", level="INFO")
                 case [Tokens.break_, Tokens.end_expr]:
                     self.commands.append(Break(str(), self.info))
-                    printer.logging(f"Добавлена команда Break", level="INFO")
+                    printer.logging("Добавлена команда Break", level="INFO")
                 case [Tokens.context, Tokens.left_bracket]:
                     ctx = Context(str(), self.execute_parse(BodyParser, body, self.next_num_line(num)))
 
@@ -363,7 +399,7 @@ class BodyParser(Parser):
                     ctx.set_info(self.info)
 
                     self.commands.append(ctx)
-                    printer.logging(f"Добавлена команда Context", level="INFO")
+                    printer.logging("Добавлена команда Context", level="INFO")
                 case [Tokens.handler, str(ex_class_name), Tokens.as_, str(ex_inst_var_name), Tokens.left_bracket]:
                     err_msg = f"Перед '{Tokens.handler}' всегда должен быть блок '{Tokens.context}'"
 
@@ -382,7 +418,7 @@ class BodyParser(Parser):
                     handler.exception_inst_name = ex_inst_var_name
 
                     previous_command.handlers.append(handler)
-                    printer.logging(f"Добавлена команда Handler в Context", level="INFO")
+                    printer.logging("Добавлена команда Handler в Context", level="INFO")
                 case [Tokens.error, *expr, Tokens.end_expr]:
                     self.commands.append(ErrorThrow(str(), Expression(str(), expr, self.info)))
                     printer.logging("Парсинг тела завершен: 'ErrorThrow' найден", level="INFO")
@@ -398,14 +434,14 @@ class BodyParser(Parser):
                         continue
 
                     self.commands.append(Expression(str(), expr, self.info))
-                    printer.logging(f"Добавлена команда Expression с выражением: {expr}", level="INFO")
+                    printer.logging("Добавлена команда Expression с выражением: %s", expr, level="INFO")
                 case [Tokens.blocking, Tokens.left_bracket]:
                     block = BlockSync(str(), self.execute_parse(BodyParser, body, self.next_num_line(num)))
 
                     block.set_info(self.info)
 
                     self.commands.append(block)
-                    printer.logging(f"Добавлена команда BlockSync", level="INFO")
+                    printer.logging("Добавлена команда BlockSync", level="INFO")
                 case [*expr, Tokens.left_bracket]:
                     expr = [*expr, Tokens.left_bracket]
 
@@ -417,12 +453,12 @@ class BodyParser(Parser):
 
                     expr.extend(res_expr.expressions)
                     self.commands.append(Expression(str(), expr, self.info))
-                    printer.logging(f"Добавлена команда Expression", level="INFO")
+                    printer.logging("Добавлена команда Expression", level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг тела завершен: 'right_bracket' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=self.info)
 
         printer.logging("Парсинг тела завершен с ошибкой: неверный синтаксис", level="ERROR")
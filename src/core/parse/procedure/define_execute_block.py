@@ -20,11 +20,11 @@ class DefineExecuteBlockMetaObject(MetaObject):
         self.expressions = expressions
         self.info = info
         printer.logging(
-            f"Создано DefineExecuteBlockMetaObject с stop_num={stop_num}, name={name}, expressions={expressions}",
+            "Создано DefineExecuteBlockMetaObject с stop_num=%s, name=%s, expressions=%s", stop_num, name, expressions,
             level="INFO")
 
     def create_image(self) -> Image:
-        printer.logging(f"Создание Image для ExecuteBlock с name={self.name}", level="DEBUG")
+        printer.logging("Создание Image для ExecuteBlock с name=%s", self.name, level="DEBUG")
         return Image(
             name=self.name,
             obj=ExecuteBlock,
@@ -43,8 +43,8 @@ class DefineExecuteBlockParser(BodyParser):
 
     def create_metadata(self, stop_num: int) -> MetaObject:
         printer.logging(
-            f"Создание метаданных ExecuteBlock с stop_num={stop_num}, name={self.name}, expressions={len(self.expressions)} выражений",
-            level="INFO"
+            "Создание метаданных ExecuteBlock с stop_num=%s, name=%s, expressions=%s выражений",
+            stop_num, self.name, len(self.expressions), level="INFO"
         )
         return DefineExecuteBlockMetaObject(
             stop_num,
@@ -55,39 +55,39 @@ class DefineExecuteBlockParser(BodyParser):
 
     def parse(self, body: list[Line], jump: int) -> int:
         self.jump = jump
-        printer.logging(f"Начало парсинга ExecuteBlock с jump={jump}", level="INFO")
+        printer.logging("Начало парсинга ExecuteBlock с jump=%s", jump, level="INFO")
 
         for num, line in enumerate(body):
             if num < self.jump:
-                printer.logging(f"Пропуск строки {num} (jump={jump})", level="DEBUG")
+                printer.logging("Пропуск строки %s (jump=%s)", num, jump, level="DEBUG")
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку {num}: {line}", level="DEBUG")
+                printer.logging("Игнорируем строку %s: %s", num, line, level="DEBUG")
                 continue
 
             if self.info is None:
                 self.info = line.get_file_info()
-                printer.logging(f"Установка информации о файле: {self.info}", level="DEBUG")
+                printer.logging("Установка информации о файле: %s", self.info, level="DEBUG")
 
             line_info = line.get_file_info()
             self.auto_added_end_token_for_expr(line)
             line = self.separate_line_to_token(line)
             self.body_check_tokens(line)
-            printer.logging(f"Обработка строки {num}: {line}", level="DEBUG")
+            printer.logging("Обработка строки %s: %s", num, line, level="DEBUG")
 
             match line:
                 case [Tokens.execute, Tokens.left_bracket]:
                     self.name = uuid.uuid4().hex
-                    printer.logging(f"Начало ExecuteBlock, сгенерировано имя: {self.name}", level="INFO")
+                    printer.logging("Начало ExecuteBlock, сгенерировано имя: %s", self.name, level="INFO")
                     continue
 
                 case [*expr, Tokens.end_expr]:
                     expression = Expression(str(), expr, line_info)
                     self.expressions.append(expression)
                     printer.logging(
-                        f"Добавлено выражение в ExecuteBlock: {expression}, всего выражений: {len(self.expressions)}",
-                        level="INFO"
+                        "Добавлено выражение в ExecuteBlock: %s, всего выражений: %s",
+                        expression, len(self.expressions), level="INFO"
                     )
 
                 case [*expr, Tokens.left_bracket]:
@@ -104,19 +104,19 @@ class DefineExecuteBlockParser(BodyParser):
                     self.expressions.append(expression)
 
                     printer.logging(
-                        f"Добавлено выражение в ExecuteBlock: {expression}, всего выражений: {len(self.expressions)}",
-                        level="INFO"
+                        "Добавлено выражение в ExecuteBlock: %s, всего выражений: %s",
+                        expression, len(self.expressions), level="INFO"
                     )
 
                 case [Tokens.right_bracket]:
                     printer.logging(
-                        f"Завершение парсинга ExecuteBlock, найдено {len(self.expressions)} выражений",
+                        "Завершение парсинга ExecuteBlock, найдено %s выражений", len(self.expressions),
                         level="INFO"
                     )
                     return num
 
                 case _:
-                    printer.logging(f"Неверный синтаксис в ExecuteBlock: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис в ExecuteBlock: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=line_info)
 
         printer.logging("Ошибка парсинга ExecuteBlock: не найден закрывающий токен", level="ERROR")
@@ -13,7 +13,8 @@ from src.util.console_worker import printer
 class DefineProcedureMetaObject(MetaObject):
     def __init__(
             self, stop_num: int, name: str, body: Optional[MetaObject],
-            arguments_name: list[Optional[str]], info: Info, default_arguments: Optional[dict[str, Expression]]
+            arguments_name: list[Optional[str]], info: Info, default_arguments: Optional[dict[str, Expression]],
+            pure: bool = False
     ):
         super().__init__(stop_num)
         self.name = name
@@ -21,12 +22,13 @@ class DefineProcedureMetaObject(MetaObject):
         self.arguments_name = arguments_name
         self.default_arguments = default_arguments
         self.info = info
+        self.pure = pure
 
     def create_image(self) -> Image:
         return Image(
             name=self.name,
             obj=Procedure,
-            image_args=(self.body, self.arguments_name, self.default_arguments),
+            image_args=(self.body, self.arguments_name, self.default_arguments, self.pure),
             info=self.info
         )
 
@@ -39,42 +41,45 @@ class DefineProcedureParser(Parser):
         self.arguments_name: list[Optional[str]] = []
         self.default_arguments: Optional[dict[str, Expression]] = None
         self.body: Optional[MetaObject] = None
+        self.pure = False
         printer.logging("Инициализация DefineProcedureParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
         printer.logging(
-            f"Создание метаданных процедуры с stop_num={stop_num}, name={self.name}, body={self.body}, arguments_name={self.arguments_name}",
-            level="INFO")
+            "Создание метаданных процедуры с stop_num=%s, name=%s, body=%s, arguments_name=%s",
+            stop_num, self.name, self.body, self.arguments_name, level="INFO"
+        )
         return DefineProcedureMetaObject(
             stop_num,
             name=self.name,
             body=self.body,
             arguments_name=self.arguments_name,
             default_arguments=self.default_arguments,
-            info=self.info
+            info=self.info,
+            pure=self.pure
         )
 
     def parse_args(self, arguments, info_line: Info) -> None:
-        printer.logging(f"Начало парсинга аргументов: {arguments}", level="DEBUG")
+        printer.logging("Начало парсинга аргументов: %s", arguments, level="DEBUG")
 
         required_arguments = []
         default_arguments = []
         default_arguments_expressions = []
 
-        printer.logging(f"Исходные аргументы: {arguments}", level="DEBUG")
+        printer.logging("Исходные аргументы: %s", arguments, level="DEBUG")
 
         for offset, argument_token in enumerate(arguments):
-            printer.logging(f"Обработка токена [{offset}]: '{argument_token}'", level="DEBUG")
+            printer.logging("Обработка токена [%s]: '%s'", offset, argument_token, level="DEBUG")
 
             if argument_token == Tokens.equal and offset > 0:
-                printer.logging(f"Найден аргумент с значением по умолчанию на позиции {offset}", level="DEBUG")
+                printer.logging("Найден аргумент с значением по умолчанию на позиции %s", offset, level="DEBUG")
                 required_arguments.pop(-1)
                 default = arguments[offset - 1:]
-                printer.logging(f"Выделена часть для обработки значений по умолчанию: {default}", level="DEBUG")
+                printer.logging("Выделена часть для обработки значений по умолчанию: %s", default, level="DEBUG")
                 is_string = False
 
                 for default_offset, default_argument_token in enumerate(default):
-                    printer.logging(f"Обработка default токена [{default_offset}]: '{default_argument_token}'",
+                    printer.logging("Обработка default токена [%s]: '%s'", default_offset, default_argument_token,
                                     level="DEBUG")
 
                     if default_argument_token == Tokens.quotation:
@@ -83,12 +88,12 @@ class DefineProcedureParser(Parser):
                     if default_argument_token == Tokens.equal and default_offset > 0:
                         name = default[default_offset - 1]
                         default_arguments.append(name)
-                        printer.logging(f"Добавлен аргумент с default: {name}", level="DEBUG")
+                        printer.logging("Добавлен аргумент с default: %s", name, level="DEBUG")
 
                         if default_arguments_expressions:
                             comma_index = default_arguments_expressions[-1].rfind(Tokens.comma)
                             default_arguments_expressions[-1] = default_arguments_expressions[-1][:comma_index]
-                            printer.logging(f"Обрезано выражение после запятой: {default_arguments_expressions[-1]}",
+                            printer.logging("Обрезано выражение после запятой: %s", default_arguments_expressions[-1],
                                             level="DEBUG")
 
                         default_arguments_expressions.append("")
@@ -108,59 +113,60 @@ class DefineProcedureParser(Parser):
                             default_arguments_expressions[-1] += sep
 
                         printer.logging(
-                            f"Добавлено в выражение: '{default_argument_token}', текущее: '{default_arguments_expressions[-1]}'",
-                            level="DEBUG")
+                            "Добавлено в выражение: '%s', текущее: '%s'",
+                            default_argument_token, default_arguments_expressions[-1], level="DEBUG"
+                        )
 
                 if default_arguments_expressions:
                     for expr in default_arguments_expressions:
                         if not expr:
                             printer.logging("Пустое выражение для аргумента по умолчанию", level="ERROR")
                             raise InvalidSyntaxError("Ошибка в аргументах по умолчанию.", info=info_line)
-                    printer.logging(f"Проверка выражений завершена: {default_arguments_expressions}", level="DEBUG")
+                    printer.logging("Проверка выражений завершена: %s", default_arguments_expressions, level="DEBUG")
 
                 break
 
             if argument_token != Tokens.comma:
                 required_arguments.append(argument_token)
-                printer.logging(f"Добавлен обязательный аргумент: '{argument_token}'", level="DEBUG")
+                printer.logging("Добавлен обязательный аргумент: '%s'", argument_token, level="DEBUG")
 
         default_arguments_names_values = {}
-        printer.logging(f"Обязательные аргументы: {required_arguments}", level="INFO")
-        printer.logging(f"Аргументы с default: {default_arguments}", level="INFO")
-        printer.logging(f"Выражения для default: {default_arguments_expressions}", level="INFO")
+        printer.logging("Обязательные аргументы: %s", required_arguments, level="INFO")
+        printer.logging("Аргументы с default: %s", default_arguments, level="INFO")
+        printer.logging("Выражения для default: %s", default_arguments_expressions, level="INFO")
 
         for offset, expr in enumerate(default_arguments_expressions):
             expr += Tokens.end_expr
             default_arguments_expressions[offset] = expr
-            printer.logging(f"Добавлен end_expr к выражению [{offset}]: '{expr}'", level="DEBUG")
+            printer.logging("Добавлен end_expr к выражению [%s]: '%s'", offset, expr, level="DEBUG")
 
         if len(default_arguments_expressions) == len(default_arguments):
             for name, expression in zip(default_arguments, default_arguments_expressions):
-                printer.logging(f"Создание Expression для '{name}': '{expression}'", level="DEBUG")
+                printer.logging("Создание Expression для '%s': '%s'", name, expression, level="DEBUG")
                 expr = Expression(
                     name, self.separate_line_to_token(Line(expression, info_line.num)), info_line
                 )
                 expr.raw_operations = expr.raw_operations[:-1]
                 default_arguments_names_values[name] = expr
-                printer.logging(f"Создан Expression для аргумента '{name}'", level="DEBUG")
+                printer.logging("Создан Expression для аргумента '%s'", name, level="DEBUG")
         else:
             printer.logging(
-                f"Несоответствие количества аргументов и выражений: args={len(default_arguments)}, exprs={len(default_arguments_expressions)}",
-                level="ERROR"
+                "Несоответствие количества аргументов и выражений: args=%s, exprs=%s",
+                len(default_arguments), len(default_arguments_expressions), level="ERROR"
             )
             raise InvalidSyntaxError("Ошибка в аргументах по умолчанию", info=info_line)
 
         arguments = required_arguments + default_arguments
-        printer.logging(f"Объединенный список аргументов: {arguments}", level="INFO")
+        printer.logging("Объединенный список аргументов: %s", arguments, level="INFO")
 
         previous_arg = ""
 
         for offset, arg_name in enumerate(arguments):
             current_arg = arguments[offset]
-            printer.logging(f"Проверка уникальности аргумента [{offset}]: '{arg_name}'", level="DEBUG")
+            printer.logging("Проверка уникальности аргумента [%s]: '%s'", offset, arg_name, level="DEBUG")
 
             if current_arg == previous_arg:
-                printer.logging(f"Обнаружен дубликат аргумента: '{arg_name}'", level="ERROR")
+                printer.logging("Обнаружен дубликат аргумента: '%s'", arg_name, level="ERROR")
                 raise InvalidSyntaxError(
                     f"Неверный синтаксис. Аргументы не могут использовать одно и то же имя: '{arg_name}'",
                     info=info_line
@@ -174,18 +180,18 @@ class DefineProcedureParser(Parser):
                 printer.logging("Инициализация словаря default_arguments", level="DEBUG")
 
             if not is_identifier(name):
-                printer.logging(f"Некорректное имя аргумента: '{name}'", level="ERROR")
+                printer.logging("Некорректное имя аргумента: '%s'", name, level="ERROR")
                 raise InvalidSyntaxError(f"Неверный синтаксис. Неверное имя аргумента: {name}", info=info_line)
 
             self.default_arguments[name] = expr
-            printer.logging(f"Добавлен default аргумент: '{name}' = '{expr}'", level="DEBUG")
+            printer.logging("Добавлен default аргумент: '%s' = '%s'", name, expr, level="DEBUG")
 
         if not all(arguments):
             self.arguments_name = []
             printer.logging("Список аргументов пуст", level="DEBUG")
         else:
             self.arguments_name = arguments
-            printer.logging(f"Финальный список аргументов: {self.arguments_name}", level="INFO")
+            printer.logging("Финальный список аргументов: %s", self.arguments_name, level="INFO")
 
     def parse_define_procedure(self, body: list[Line], name: str, arguments: list[str], num, info_line: Info) -> None:
         if not is_identifier(name):
@@ -206,14 +212,14 @@ class DefineProcedureParser(Parser):
 
     def parse(self, body: list[Line], jump) -> int:
         self.jump = jump
-        printer.logging(f"Начало парсинга процедуры с jump={self.jump} {Procedure.__name__}", level="INFO")
+        printer.logging("Начало парсинга процедуры с jump=%s %s", self.jump, Procedure.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < self.jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             if self.info is None:
@@ -227,14 +233,22 @@ class DefineProcedureParser(Parser):
                     self.parse_define_procedure(body, name, arguments, num, info_line)
 
                     printer.logging(
-                        f"Добавлена процедура: name={self.name}, arguments_name={self.arguments_name}",
+                        "Добавлена процедура: name=%s, arguments_name=%s", self.name, self.arguments_name,
+                        level="INFO"
+                    )
+                case [Tokens.define, Tokens.pure, Tokens.a_procedure, name, Tokens.left_bracket, *arguments, Tokens.right_bracket, Tokens.left_bracket]:
+                    self.pure = True
+                    self.parse_define_procedure(body, name, arguments, num, info_line)
+
+                    printer.logging(
+                        "Добавлена чистая процедура: name=%s, arguments_name=%s", self.name, self.arguments_name,
                         level="INFO"
                     )
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг процедуры завершен: 'right_bracket' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=info_line)
 
         printer.logging("Парсинг процедуры завершен с ошибкой: неверный синтаксис", level="ERROR")
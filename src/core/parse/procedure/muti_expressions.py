@@ -42,7 +42,7 @@ class MultiExpressionParser(Parser):
 
     def create_metadata(self, stop_num: int) -> MultiExpressionMetaObject:
         printer.logging(
-            f"Создание метаданных выражений с stop_num={stop_num}, commands={self.expressions}", level="INFO"
+            "Создание метаданных выражений с stop_num=%s, commands=%s", stop_num, self.expressions, level="INFO"
         )
         return MultiExpressionMetaObject(
             stop_num,
@@ -69,7 +69,7 @@ class MultiExpressionParser(Parser):
 
     def parse(self, body: list[Line], jump) -> int:
         self.jump = jump
-        printer.logging(f"Начало парсинга выражений с jump={self.jump} {Body.__name__}", level="INFO")
+        printer.logging("Начало парсинга выражений с jump=%s %s", self.jump, Body.__name__, level="INFO")
 
         left_bracket, right_bracket = self.left_bracket, 0
 
@@ -78,12 +78,12 @@ class MultiExpressionParser(Parser):
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="INFO")
+                printer.logging("Игнорируем строку: %s", line, level="INFO")
                 continue
 
             self.info = line.get_file_info()
             line = self.separate_line_to_token(line)
-            printer.logging(f"Парсинг строки: {line}", level="INFO")
+            printer.logging("Парсинг строки: %s", line, level="INFO")
 
             is_string = False
 
@@ -15,10 +15,13 @@ class TypeSanctionMetaObject(MetaObject):
         self.name = name
         self.info = info
         self.args = args
-        printer.logging(f"Создано TypeSanctionMetadata: stop_num={stop_num}, name={name}, args={args}", level="INFO")
+        printer.logging(
+            "Создано TypeSanctionMetadata: stop_num=%s, name=%s, args=%s",
+            stop_num, name, args, level="INFO"
+        )
 
     def create_image(self):
-        printer.logging(f"Создание образа SanctionType: name={self.name}, args={self.args}", level="INFO")
+        printer.logging("Создание образа SanctionType: name=%s, args=%s", self.name, self.args, level="INFO")
         return Image(
             name=self.name,
             obj=SanctionType,
@@ -37,8 +40,10 @@ class TypeSanctionParser(Parser):
         printer.logging("Инициализация TypeSanctionParser", level="INFO")
 
     def create_metadata(self, stop_num: int) -> MetaObject:
-        printer.logging(f"Создание метаданных TypeSanction: stop_num={stop_num}, name={self.name}, "
-                        f"name_sanction_type={self.name_sanction_type}, article={self.article}", level="INFO")
+        printer.logging(
+            "Создание метаданных TypeSanction: stop_num=%s, name=%s, name_sanction_type=%s, article=%s",
+            stop_num, self.name, self.name_sanction_type, self.article, level="INFO"
+        )
         return TypeSanctionMetaObject(
             stop_num,
             self.name,
@@ -48,14 +53,14 @@ class TypeSanctionParser(Parser):
         )
 
     def parse(self, body: list[Line], jump: int) -> int:
-        printer.logging(f"Начало парсинга TypeSanction с jump={jump} {SanctionType.__name__}", level="INFO")
+        printer.logging("Начало парсинга TypeSanction с jump=%s %s", jump, SanctionType.__name__, level="INFO")
 
         for num, line in enumerate(body):
             if num < jump:
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорируем строку: {line}", level="DEBUG")
+                printer.logging("Игнорируем строку: %s", line, level="DEBUG")
                 continue
 
             self.info = line.get_file_info()
@@ -65,15 +70,15 @@ class TypeSanctionParser(Parser):
                 case [Tokens.define, Tokens.of_sanction, name, Tokens.left_bracket]:
                     self.name_sanction_type = name
                     self.name = name
-                    printer.logging(f"Определен тип санкции: {self.name_sanction_type}", level="INFO")
+                    printer.logging("Определен тип санкции: %s", self.name_sanction_type, level="INFO")
                 case [Tokens.article, *article, Tokens.comma]:
                     self.article = self.parse_sequence_words_to_str(article)
-                    printer.logging(f"Добавлена статья: {self.article}", level="INFO")
+                    printer.logging("Добавлена статья: %s", self.article, level="INFO")
                 case [Tokens.right_bracket]:
                     printer.logging("Парсинг типа санкции завершен: 'end_body' найден", level="INFO")
                     return num
                 case _:
-                    printer.logging(f"Неверный синтаксис: {line}", level="ERROR")
+                    printer.logging("Неверный синтаксис: %s", line, level="ERROR")
                     raise InvalidSyntaxError(line=line, info=self.info)
 
         printer.logging("Парсинг типа санкции завершен с ошибкой: неверный синтаксис", level="ERROR")
@@ -151,30 +151,30 @@ def check_correct_expr(expr: list[str]):
 
 
 def prepare_expr(expr: list[str]) -> list:
-    printer.logging(f"Начало подготовки выражения. Исходное выражение: {expr}", level="DEBUG")
+    printer.logging("Начало подготовки выражения. Исходное выражение: %s", expr, level="DEBUG")
 
     i = 0
     while i < len(expr):
         if expr[i] == Tokens.quotation:
-            printer.logging(f"Обнаружена открывающая кавычка на позиции {i}", level="DEBUG")
+            printer.logging("Обнаружена открывающая кавычка на позиции %s", i, level="DEBUG")
             start_idx = i
             i += 1
             string_parts = []
 
             while i < len(expr) and expr[i] != Tokens.quotation:
                 item = expr[i]
-                printer.logging(f"Обработка элемента строки: {item}", level="TRACE")
+                printer.logging("Обработка элемента строки: %s", item, level="TRACE")
 
                 if isinstance(item, LinkedProcedure):
                     item = item.func.name
-                    printer.logging(f"Преобразование LinkedProcedure в имя: {item}", level="TRACE")
+                    printer.logging("Преобразование LinkedProcedure в имя: %s", item, level="TRACE")
 
                 string_parts.append(item)
                 i += 1
 
             if i < len(expr) and expr[i] == Tokens.quotation:
                 string_value = ''.join(string_parts)
-                printer.logging(f"Сформирована строка: {string_value}", level="DEBUG")
+                printer.logging("Сформирована строка: %s", string_value, level="DEBUG")
                 expr[start_idx:i + 1] = [String(string_value)]
                 i = start_idx + 1
             else:
@@ -183,18 +183,18 @@ def prepare_expr(expr: list[str]) -> list:
         else:
             i += 1
 
-    printer.logging(f"Выражение после обработки строк: {expr}", level="DEBUG")
+    printer.logging("Выражение после обработки строк: %s", expr, level="DEBUG")
 
     is_string = False
     i = len(expr) - 1
 
     while i >= 0:
         op = expr[i]
-        printer.logging(f"Обработка оператора {op} на позиции {i}", level="TRACE")
+        printer.logging("Обработка оператора %s на позиции %s", op, i, level="TRACE")
 
         if op == Tokens.quotation:
             is_string = not is_string
-            printer.logging(f"Переключение флага строки: {is_string}", level="TRACE")
+            printer.logging("Переключение флага строки: %s", is_string, level="TRACE")
 
         if is_string:
             i -= 1
@@ -216,7 +216,7 @@ def prepare_expr(expr: list[str]) -> list:
                 continue
 
         if i > 0 and expr[i - 1] == Tokens.attr_access:
-            printer.logging(f"Обнаружена цепочка атрибутов на позиции {i}", level="DEBUG")
+            printer.logging("Обнаружена цепочка атрибутов на позиции %s", i, level="DEBUG")
             end_idx = i
             start_idx = end_idx - 1
 
@@ -224,23 +224,23 @@ def prepare_expr(expr: list[str]) -> list:
                 start_idx -= 2
 
             start_idx += 1
-            printer.logging(f"Начало цепочки атрибутов: {start_idx}, конец: {end_idx}", level="DEBUG")
+            printer.logging("Начало цепочки атрибутов: %s, конец: %s", start_idx, end_idx, level="DEBUG")
 
             if start_idx >= 0 and end_idx < len(expr):
                 attr_access_expr = expr[start_idx:end_idx + 1]
-                printer.logging(f"Выделенная цепочка атрибутов: {attr_access_expr}", level="DEBUG")
+                printer.logging("Выделенная цепочка атрибутов: %s", attr_access_expr, level="DEBUG")
 
                 if Tokens.left_bracket in attr_access_expr or Tokens.right_bracket in attr_access_expr:
                     printer.logging("Обнаружены скобки в цепочке атрибутов", level="ERROR")
                     raise InvalidExpression("Нельзя разрывать цепочки атрибутов скобками")
 
                 expr[start_idx:end_idx + 1] = [AttrAccess(_build_rpn(attr_access_expr), attr_access_expr)]
-                printer.logging(f"Замена цепочки на AttrAccess", level="DEBUG")
+                printer.logging("Замена цепочки на AttrAccess", level="DEBUG")
                 i = start_idx
 
         i -= 1
 
-    printer.logging(f"Финальное выражение после подготовки: {expr}", level="DEBUG")
+    printer.logging("Финальное выражение после подготовки: %s", expr, level="DEBUG")
     return expr
 
 
@@ -271,7 +271,7 @@ def build_rpn_stack(expr: list[str], meta_info: Info) -> list[Union[Operator, Ba
 
 
 def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
-    printer.logging(f"Начало построения RPN-стека из выражения: {expr}", level="INFO")
+    printer.logging("Начало построения RPN-стека из выражения: %s", expr, level="INFO")
 
     stack = []
     result_stack = []
@@ -281,7 +281,10 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
         if offset < jump:
             continue
 
-        printer.logging(f"Текущий оператор: {op}, стек: {stack}, результирующий стек: {result_stack}", level="DEBUG")
+        printer.logging(
+            "Текущий оператор: %s, стек: %s, результирующий стек: %s",
+            op, stack, result_stack, level="DEBUG"
+        )
 
         if op == Tokens.quotation:
             result_stack.append(op)
@@ -301,20 +304,19 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
 
                 if next_op == Tokens.left_bracket:
                     stack.append(ProcedureContextName(Operator(op)))
-                    printer.logging(f"Функция '{op}' добавлена в стек, так как за ней следует открывающая скобка",
+                    printer.logging("Функция '%s' добавлена в стек, так как за ней следует открывающая скобка", op,
                                     level="INFO")
                     continue
 
             result_stack.append(op)
-            printer.logging(f"Оператор '{op}' добавлен в результирующий стек", level="INFO")
+            printer.logging("Оператор '%s' добавлен в результирующий стек", op, level="INFO")
             continue
 
         if op == Tokens.left_bracket:
             if len(expr) > 2 and offset != 0 and (is_identifier(expr[offset - 1]) or isinstance(expr[offset - 1], AttrAccess)) and expr[offset - 1] not in {*ALLOW_OPERATORS, Tokens.true, Tokens.false}:
                 printer.logging(
-                    f"Перед скобкой находится идентификатор/атрибут: '{expr[offset - 1]}'. "
-                    f"Проверка аргументов функции...",
-                    level="INFO"
+                    "Перед скобкой находится идентификатор/атрибут: '%s'. Проверка аргументов функции...",
+                    expr[offset - 1], level="INFO"
                 )
 
                 dont_repeat_flag = False
@@ -323,7 +325,7 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
 
                 for offset_, token_ in enumerate(sub_expr):
                     printer.logging(
-                        f"Проверка токена '{token_}' на позиции {offset_} относительно скобки",
+                        "Проверка токена '%s' на позиции %s относительно скобки", token_, offset_,
                         level="DEBUG"
                     )
 
@@ -345,7 +347,7 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
                                 f"{target_comma}\n"
                             )
 
-                        printer.logging(f"Обнаружена закрывающая скобка, завершение проверки аргументов", level="DEBUG")
+                        printer.logging("Обнаружена закрывающая скобка, завершение проверки аргументов", level="DEBUG")
                         break
 
                     conditions = (
@@ -367,25 +369,25 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
                         previous_tok = sub_expr[offset_ - 1]
 
                         printer.logging(
-                            f"Токен '{token_}' является операндом. Предыдущий токен: '{previous_tok}'",
+                            "Токен '%s' является операндом. Предыдущий токен: '%s'", token_, previous_tok,
                             level="DEBUG"
                         )
                         if previous_tok in unary_ops:
                             printer.logging(
-                                f"Предыдущий токен '{previous_tok}' является унарным оператором, пропускаем проверку",
+                                "Предыдущий токен '%s' является унарным оператором, пропускаем проверку", previous_tok,
                                 level="DEBUG"
                             )
                             continue
 
                         if not dont_repeat_flag:
                             printer.logging(
-                                f"Установка флага dont_repeat_flag в True. Первый операнд: '{token_}'",
+                                "Установка флага dont_repeat_flag в True. Первый операнд: '%s'", token_,
                                 level="DEBUG"
                             )
                             dont_repeat_flag = True
                         else:
                             printer.logging(
-                                f"Обнаружен второй операнд '{token_}' без разделителя между предыдущим операндом",
+                                "Обнаружен второй операнд '%s' без разделителя между предыдущим операндом", token_,
                                 level="WARNING"
                             )
 
@@ -404,18 +406,18 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
                             )
                     else:
                         printer.logging(
-                            f"Токен '{token_}' не является операндом. Сбрасываем флаг dont_repeat_flag", level="DEBUG"
+                            "Токен '%s' не является операндом. Сбрасываем флаг dont_repeat_flag", token_, level="DEBUG"
                         )
                         dont_repeat_flag = False
 
                 printer.logging(
-                    f"Проверка аргументов завершена. Добавляем разделитель аргументов в результирующий стек",
+                    "Проверка аргументов завершена. Добавляем разделитель аргументов в результирующий стек",
                     level="INFO"
                 )
                 result_stack.append(ServiceTokens.arg_separator)
 
             stack.append(op)
-            printer.logging(f"Открывающая скобка '{op}' добавлена в стек", level="INFO")
+            printer.logging("Открывающая скобка '%s' добавлена в стек", op, level="INFO")
 
         elif op == Tokens.right_bracket:
             previous_op = expr[offset - 1]
@@ -433,7 +435,7 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
                 try:
                     if stack[-1] == Tokens.left_bracket:
                         stack.pop(-1)
-                        printer.logging(f"Закрывающая скобка '{op}' обнаружена. Открывающая скобка удалена из стека.",
+                        printer.logging("Закрывающая скобка '%s' обнаружена. Открывающая скобка удалена из стека.", op,
                                         level="INFO")
 
                         if not stack:
@@ -456,13 +458,13 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
                     continue
 
                 result_stack.append(op_)
-                printer.logging(f"Оператор '{op_}' добавлен в результирующий стек", level="INFO")
+                printer.logging("Оператор '%s' добавлен в результирующий стек", op_, level="INFO")
 
         elif op == Tokens.comma:
             while True:
                 if len(stack) == 0:
                     stack.append(op)
-                    printer.logging(f"Оператор '{op}' добавлен в стек (пустой стек)", level="INFO")
+                    printer.logging("Оператор '%s' добавлен в стек (пустой стек)", op, level="INFO")
                     break
 
                 if stack[-1] not in [Tokens.left_bracket, Tokens.right_bracket]:
@@ -482,7 +484,7 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
             while True:
                 if len(stack) == 0:
                     stack.append(op)
-                    printer.logging(f"Оператор '{op}' добавлен в стек (пустой стек)", level="INFO")
+                    printer.logging("Оператор '%s' добавлен в стек (пустой стек)", op, level="INFO")
                     break
 
                 if stack[-1] in [
@@ -504,7 +506,7 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
             while True:
                 if len(stack) == 0:
                     stack.append(op)
-                    printer.logging(f"Оператор '{op}' добавлен в стек (пустой стек)", level="INFO")
+                    printer.logging("Оператор '%s' добавлен в стек (пустой стек)", op, level="INFO")
                     break
 
                 if stack[-1] in [
@@ -527,15 +529,18 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
                 if len(stack) == 0:
                     if detect_unary(expr, offset, op, ServiceTokens.in_background):
                         stack.append(ServiceTokens.in_background)
-                        printer.logging(f"Оператор '{ServiceTokens.in_background}' добавлен в стек (пустой стек)", level="INFO")
+                        printer.logging(
+                            "Оператор '%s' добавлен в стек (пустой стек)",
+                            ServiceTokens.in_background, level="INFO"
+                        )
                         break
 
                     stack.append(op)
-                    printer.logging(f"Оператор '{op}' добавлен в стек (пустой стек)", level="INFO")
+                    printer.logging("Оператор '%s' добавлен в стек (пустой стек)", op, level="INFO")
                     break
                 else:
                     stack.append(op)
-                    printer.logging(f"Оператор '{op}' добавлен в стек", level="INFO")
+                    printer.logging("Оператор '%s' добавлен в стек", op, level="INFO")
                     break
 
         elif op == Tokens.wait:
@@ -543,15 +548,15 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
                 if len(stack) == 0:
                     if detect_unary(expr, offset, op, Tokens.wait):
                         stack.append(Tokens.wait)
-                        printer.logging(f"Оператор '{Tokens.wait}' добавлен в стек (пустой стек)", level="INFO")
+                        printer.logging("Оператор '%s' добавлен в стек (пустой стек)", Tokens.wait, level="INFO")
                         break
 
                     stack.append(op)
-                    printer.logging(f"Оператор '{op}' добавлен в стек (пустой стек)", level="INFO")
+                    printer.logging("Оператор '%s' добавлен в стек (пустой стек)", op, level="INFO")
                     break
                 else:
                     stack.append(op)
-                    printer.logging(f"Оператор '{op}' добавлен в стек", level="INFO")
+                    printer.logging("Оператор '%s' добавлен в стек", op, level="INFO")
                     break
 
         elif op in [Tokens.star, Tokens.div, Tokens.plus, Tokens.minus]:
@@ -559,15 +564,21 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
                 if len(stack) == 0:
                     if detect_unary(expr, offset, op, Tokens.minus):
                         stack.append(ServiceTokens.unary_minus)
-                        printer.logging(f"Оператор '{ServiceTokens.unary_minus}' добавлен в стек (пустой стек)", level="INFO")
+                        printer.logging(
+                            "Оператор '%s' добавлен в стек (пустой стек)",
+                            ServiceTokens.unary_minus, level="INFO"
+                        )
                         break
                     elif detect_unary(expr, offset, op, Tokens.plus):
                         stack.append(ServiceTokens.unary_plus)
-                        printer.logging(f"Оператор '{ServiceTokens.unary_plus}' добавлен в стек (пустой стек)", level="INFO")
+                        printer.logging(
+                            "Оператор '%s' добавлен в стек (пустой стек)",
+                            ServiceTokens.unary_plus, level="INFO"
+                        )
                         break
 
                     stack.append(op)
-                    printer.logging(f"Оператор '{op}' добавлен в стек (пустой стек)", level="INFO")
+                    printer.logging("Оператор '%s' добавлен в стек (пустой стек)", op, level="INFO")
                     break
 
                 if op in [Tokens.plus, Tokens.minus]:
@@ -620,12 +631,12 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
                 elif stack[-1].isalnum():
                     result_stack.append(stack.pop())
                     stack.append(op)
-                    printer.logging(f"Добавлен оператор '{op}' в стек, предыдущий элемент стека был '{stack[-1]}'",
+                    printer.logging("Добавлен оператор '%s' в стек, предыдущий элемент стека был '%s'", op, stack[-1],
                                     level="INFO")
                     break
                 else:
                     stack.append(op)
-                    printer.logging(f"Оператор '{op}' добавлен в стек", level="INFO")
+                    printer.logging("Оператор '%s' добавлен в стек", op, level="INFO")
                     break
 
         elif op in [
@@ -635,7 +646,7 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
             while True:
                 if len(stack) == 0:
                     stack.append(op)
-                    printer.logging(f"Оператор '{op}' добавлен в стек (пустой стек)", level="INFO")
+                    printer.logging("Оператор '%s' добавлен в стек (пустой стек)", op, level="INFO")
                     break
 
                 if op == Tokens.not_:
@@ -718,7 +729,7 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
             continue
 
         result_stack.append(op)
-        printer.logging(f"Оператор '{op}' добавлен в результирующий стек из оставшегося стека", level="INFO")
+        printer.logging("Оператор '%s' добавлен в результирующий стек из оставшегося стека", op, level="INFO")
 
     def flatten(lst):
         flat_list = []
@@ -735,17 +746,17 @@ def _build_rpn(expr: list[str]) -> list[Union[Operator, BaseAtomicType]]:
 
     result_stack = flatten(result_stack)
 
-    printer.logging(f"Завершено построение RPN-стека. Результат: {result_stack}", level="INFO")
+    printer.logging("Завершено построение RPN-стека. Результат: %s", result_stack, level="INFO")
 
     return compile_rpn(result_stack)
 
 def compile_rpn(expr):
-    printer.logging(f"\nКомпиляция RPN-выражения: {expr}", level="INFO")
+    printer.logging("\nКомпиляция RPN-выражения: %s", expr, level="INFO")
     compiled_stack = []
     jump = 0
 
     for offset, op in enumerate(expr):
-        printer.logging(f"Компиляция элемента [{offset}]: {op}", level="TRACE")
+        printer.logging("Компиляция элемента [%s]: %s", offset, op, level="TRACE")
         if offset < jump:
             continue
 
@@ -788,5 +799,5 @@ def compile_rpn(expr):
 
         compiled_stack.append(Operator(op))
 
-    printer.logging(f"Итоговый скомпилированный стек: {compiled_stack}", level="DEBUG")
+    printer.logging("Итоговый скомпилированный стек: %s", compiled_stack, level="DEBUG")
     return compiled_stack
@@ -68,6 +68,7 @@ class Tokens(StrEnum):
     data = "ДАННЫЕ"
     procedure = "ПРОЦЕДУРА"
     a_procedure = "ПРОЦЕДУРУ"
+    pure = "ЧИСТУЮ"
     assign = "ЗАДАТЬ"
     when = "ЕСЛИ"
     then = "ТО"
@@ -76,7 +77,11 @@ class Tokens(StrEnum):
     from_ = "ОТ"
     to = "ДО"
     while_ = "ПОКА"
+    for_ = "ДЛЯ"
+    each = "КАЖДОГО"
+    of = "ИЗ"
     return_ = "ВЕРНУТЬ"
+    yield_ = "ОТДАТЬ"
     true = "ИСТИНА"
     false = "ЛОЖЬ"
     continue_ = "ПРОПУСТИТЬ"
@@ -1,8 +1,20 @@
-from typing import Union, Final, Any, MutableMapping, Optional
-
-from src.core.exceptions import ErrorType, OperationError
+import array
+import operator
+from collections.abc import Iterable, Iterator, MutableSequence
+from itertools import islice
+from threading import Lock
+from typing import Union, Final, Any, MutableMapping, Optional, Callable, NamedTuple
+
+from src.core.exceptions import ErrorType, OperationError, ErrorValue, DivisionByZeroError
 from src.core.tokens import Tokens
-from src.core.types.basetype import BaseAtomicType
+from src.core.types.basetype import BaseAtomicType, CopyItem
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_MIN_INT64, _MAX_INT64 = -2 ** 63, 2 ** 63 - 1
 
 
 def convert_atomic_type_to_py_type(atomic_obj: BaseAtomicType, *, strict: bool = False) -> Any:
@@ -19,6 +31,12 @@ def convert_atomic_type_to_py_type(atomic_obj: BaseAtomicType, *, strict: bool =
     elif isinstance(atomic_obj, Void):
         return atomic_obj.value
 
+    elif isinstance(atomic_obj, NumericArray):
+        if atomic_obj.buffer.typecode == "q":
+            return atomic_obj.buffer.tolist()
+
+        return [int(value) if value.is_integer() else value for value in atomic_obj.buffer]
+
     elif isinstance(atomic_obj, Array):
         return [convert_atomic_type_to_py_type(item) for item in atomic_obj.value]
 
@@ -26,10 +44,7 @@ def convert_atomic_type_to_py_type(atomic_obj: BaseAtomicType, *, strict: bool =
         result = {}
 
         for key, value in atomic_obj.value.items():
-            if isinstance(key, String):
-                py_key = key.value
-            else:
-                py_key = str(key)
+            py_key = key if isinstance(key, str) else str(atomic_table_key(key))
             result[py_key] = convert_atomic_type_to_py_type(value)
 
         return result
@@ -65,17 +80,103 @@ def convert_py_type_to_atomic_type(py_obj: Any) -> BaseAtomicType:
         table = {}
 
         for key, value in py_obj.items():
-            table[String(str(key))] = convert_py_type_to_atomic_type(value)
+            table[str(key)] = convert_py_type_to_atomic_type(value)
 
         return Table(table)
 
     raise ErrorType(f"Тип '{type(py_obj)}' невозможно преобразовать")
 
 
+class StringRope:
+    """
+    Общий буфер частей строки для склейки через '+'.
+    Дописывать в буфер может только строка, построенная на всех его частях,
+    остальные строки на этом буфере видят только свой префикс частей.
+    """
+    __slots__ = ("parts", "lock")
+
+    def __init__(self, parts: list[str]):
+        self.parts = parts
+        self.lock = Lock()
+
+
+class RopeSlice(NamedTuple):
+    rope: StringRope
+    count: int
+
+
 class String(BaseAtomicType):
-    def __init__(self, value: str):
+    # Короткие строки склеиваются сразу: скопировать их дешевле, чем заводить буфер
+    ROPE_MIN_LENGTH: Final[int] = 256
+
+    # Значения по умолчанию для строк, загруженных из .law файлов
+    _value: str = ""
+    _rope: Optional[RopeSlice] = None
+
+    def __init__(self, value: Union[str, RopeSlice]):
         super().__init__(value)
 
+    @property
+    def value(self) -> str:
+        # Буфер читается один раз: фоновая задача в другом потоке может собрать строку между чтениями
+        rope_slice = self._rope
+
+        if rope_slice is not None:
+            rope, count = rope_slice
+            self._value = "".join(rope.parts[:count])
+            self._rope = None
+
+        return self._value
+
+    @value.setter
+    def value(self, value: Union[str, RopeSlice]):
+        if isinstance(value, RopeSlice):
+            self._rope = value
+        else:
+            self._value = value
+            self._rope = None
+
+    def add(self, other: "BaseAtomicType"):
+        """
+        Склейка в цикле 'отчёт = отчёт + часть' дописывает часть в общий буфер за O(1),
+        а сама строка собирается один раз - при первом обращении к значению.
+        """
+        if not isinstance(other, String):
+            return super().add(other)
+
+        right = other.value
+        rope_slice = self._rope
+
+        if rope_slice is None:
+            if len(self._value) + len(right) < self.ROPE_MIN_LENGTH:
+                return self._value + right
+
+            return RopeSlice(StringRope([self._value, right]), 2)
+
+        rope, count = rope_slice
+
+        with rope.lock:
+            if len(rope.parts) == count:
+                rope.parts.append(right)
+
+                return RopeSlice(rope, count + 1)
+
+        # На буфере уже построена другая строка: продолжаем на копии своих частей
+        return RopeSlice(StringRope([*rope.parts[:count], right]), count + 1)
+
+    def __getstate__(self):
+        # В .law файлы строка попадает собранной и в прежнем виде: {'value': ...}
+        value = self.value
+        state = {name: field for name, field in self.__dict__.items() if name not in ("_value", "_rope")}
+        state["value"] = value
+
+        return state
+
+    def __setstate__(self, state: dict):
+        state = dict(state)
+        self._value = state.pop("value")
+        self.__dict__.update(state)
+
     @classmethod
     def type_name(cls):
         return "Строка"
@@ -135,7 +236,6 @@ class Array(BaseAtomicType):
             value = []
 
         super().__init__(value)
-        self.visited = set()
 
     def append(self, obj: BaseAtomicType):
         self.value.append(obj)
@@ -152,6 +252,12 @@ class Array(BaseAtomicType):
     def len(self) -> Number:
         return Number(len(self.value))
 
+    def empty_copy(self) -> "Array":
+        return Array()
+
+    def copy_into(self, copied: "Array", copy_item: CopyItem):
+        copied.value = [copy_item(item) for item in self.value]
+
     def __contains__(self, idx: Number):
         return idx in self.value
 
@@ -159,26 +265,7 @@ class Array(BaseAtomicType):
         return len(self.value)
 
     def __str__(self):
-        if id(self) in self.visited:
-            return "ЦИКЛИЧЕСКАЯ ССЫЛКА"
-
-        self.visited.add(id(self))
-
-        result = ""
-
-        for value in self.value:
-            result += ", "
-
-            if isinstance(value, String):
-                result += f"\"{value}\""
-            elif value is self:
-                result += "ЦИКЛИЧЕСКАЯ ССЫЛКА"
-            else:
-                result += str(value)
-
-        self.visited.remove(id(self))
-
-        return "[" + result[2:] + "]"
+        return render(self)
 
     @classmethod
     def type_name(cls):
@@ -191,22 +278,232 @@ class Array(BaseAtomicType):
         return self.value[item]
 
 
+def _raw_number(item: Any) -> Union[int, float]:
+    if isinstance(item, Number):
+        return item.value
+
+    if isinstance(item, (int, float)) and not isinstance(item, bool):
+        return item
+
+    raise ErrorType("Числовой массив может содержать только числа!")
+
+
+def _fits_int64(value: Union[int, float]) -> bool:
+    return isinstance(value, int) and _MIN_INT64 <= value <= _MAX_INT64
+
+
+def _numeric_buffer(values: Iterable[Any]) -> array.array:
+    raw = [_raw_number(item) for item in values]
+
+    if all(_fits_int64(value) for value in raw):
+        return array.array("q", raw)
+
+    return array.array("d", raw)
+
+
+class NumericArrayView(MutableSequence):
+    """Элементы числового массива в виде списка Число: обёртки создаются только при обращении."""
+    __slots__ = ("owner",)
+
+    def __init__(self, owner: "NumericArray"):
+        self.owner = owner
+
+    def __len__(self):
+        return len(self.owner.buffer)
+
+    def __iter__(self):
+        return map(Number, self.owner.buffer)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Number(value) for value in self.owner.buffer[index]]
+
+        return Number(self.owner.buffer[index])
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            raw = _numeric_buffer(value)
+            self.owner.fit(raw)
+            self.owner.buffer[index] = array.array(self.owner.buffer.typecode, raw)
+            return
+
+        raw = _raw_number(value)
+        self.owner.fit((raw,))
+        self.owner.buffer[index] = raw
+
+    def __delitem__(self, index):
+        del self.owner.buffer[index]
+
+    def insert(self, index, value):
+        raw = _raw_number(value)
+        self.owner.fit((raw,))
+        self.owner.buffer.insert(index, raw)
+
+    def append(self, value):
+        raw = _raw_number(value)
+        self.owner.fit((raw,))
+        self.owner.buffer.append(raw)
+
+    def clear(self):
+        del self.owner.buffer[:]
+
+
+class NumericArray(Array):
+    """
+    Массив только из чисел. Значения лежат в array('q') или array('d') без обёрток Число.
+    Как только в массив попадает дробное число (или целое вне int64), все значения хранятся как дробные.
+    """
+    def __init__(self, value: Optional[Iterable[Any]] = None):
+        self.buffer = array.array("q")
+        super().__init__(value)
+
+    @property
+    def value(self) -> NumericArrayView:
+        return NumericArrayView(self)
+
+    @value.setter
+    def value(self, value: Iterable[Any]):
+        self.buffer = value if isinstance(value, array.array) else _numeric_buffer(value)
+
+    def empty_copy(self) -> "NumericArray":
+        return NumericArray()
+
+    def copy_into(self, copied: "NumericArray", copy_item: CopyItem):
+        # Числа хранятся без обёрток, копировать поэлементно нечего
+        copied.buffer = array.array(self.buffer.typecode, self.buffer)
+
+    def fit(self, raw: Iterable[Union[int, float]]):
+        """Переводит хранилище в дробные числа, если в целом нельзя сохранить новые значения."""
+        if self.buffer.typecode == "q" and not all(_fits_int64(value) for value in raw):
+            self.buffer = array.array("d", self.buffer)
+
+    def _numpy(self) -> "np.ndarray":
+        return np.frombuffer(self.buffer, dtype=self.buffer.typecode)
+
+    def _require_not_empty(self):
+        if not self.buffer:
+            raise ErrorValue("Массив пуст.")
+
+    def sum(self) -> Number:
+        return Number(sum(self.buffer))
+
+    def min(self) -> Number:
+        self._require_not_empty()
+        return Number(min(self.buffer))
+
+    def max(self) -> Number:
+        self._require_not_empty()
+        return Number(max(self.buffer))
+
+    def mean(self) -> Number:
+        self._require_not_empty()
+        return Number(sum(self.buffer) / len(self.buffer))
+
+    def sort(self, reverse: bool = False):
+        typecode = self.buffer.typecode
+
+        if np is None or not self.buffer:
+            self.buffer = array.array(typecode, sorted(self.buffer, reverse=reverse))
+            return
+
+        result = np.sort(self._numpy())
+        self.buffer = array.array(typecode, (result[::-1] if reverse else result).tobytes())
+
+    def elementwise(
+            self, operation: Callable[[Any, Any], Any], other: Union["NumericArray", Number]
+    ) -> "NumericArray":
+        """Поэлементная операция с другим числовым массивом той же длины или с числом."""
+        if isinstance(other, NumericArray):
+            if len(other.buffer) != len(self.buffer):
+                raise ErrorValue("Массивы должны быть одной длины.")
+
+            right = other.buffer
+            is_zero = 0 in right
+            is_float = other.buffer.typecode == "d"
+        else:
+            right = other.value
+            is_zero = right == 0
+            is_float = not _fits_int64(right)
+
+        if operation is operator.truediv:
+            if is_zero:
+                raise DivisionByZeroError("Деление на ноль в поэлементной операции!")
+
+            is_float = True
+
+        is_float = is_float or self.buffer.typecode == "d"
+
+        if is_float and np is not None:
+            result = operation(self._numpy(), other._numpy() if isinstance(other, NumericArray) else right)
+            return NumericArray(array.array("d", result.astype(np.float64).tobytes()))
+
+        if isinstance(other, NumericArray):
+            raw = map(operation, self.buffer, right)
+        else:
+            raw = (operation(value, right) for value in self.buffer)
+
+        if is_float:
+            return NumericArray(array.array("d", raw))
+
+        return NumericArray(_numeric_buffer(list(raw)))
+
+
+# Ключ таблицы: строки и числа хранятся как значения Python, остальные ключи - как есть
+TableKey = Union[str, int, float, BaseAtomicType]
+
+
+def table_key(key: Union[TableKey, BaseAtomicType]) -> TableKey:
+    """Ключ, под которым значение лежит внутри таблицы."""
+    key_type = type(key)
+
+    if key_type is String or key_type is Number:
+        return key.value
+
+    return key
+
+
+def atomic_table_key(key: TableKey) -> BaseAtomicType:
+    """Ключ таблицы в виде значения LawScript."""
+    if isinstance(key, str):
+        return String(key)
+
+    if isinstance(key, (int, float)) and not isinstance(key, bool):
+        return Number(key)
+
+    return key
+
+
 class Table(BaseAtomicType):
-    def __init__(self, value: Optional[dict[String, BaseAtomicType]] = None):
+    """
+    Таблица хранит строковые и числовые ключи без обёрток: поиск по ключу не создаёт String
+    и не вызывает __hash__/__eq__ на стороне Python. Обёртки создаются только при выдаче ключей наружу.
+    Логические ключи хранятся обёртками, иначе ИСТИНА совпала бы с ключом 1.
+    """
+    def __init__(self, value: Optional[dict[Union[TableKey, BaseAtomicType], BaseAtomicType]] = None):
         if value is None:
             value = {}
+        else:
+            value = {table_key(key): item for key, item in value.items()}
 
         super().__init__(value)
-        self.visited = set()
 
-    def get(self, key: String):
-        return self.value[key]
+    def get(self, key: Union[TableKey, BaseAtomicType]):
+        return self.value[table_key(key)]
 
-    def set(self, key: String, value: BaseAtomicType):
-        self.value[key] = value
+    def set(self, key: Union[TableKey, BaseAtomicType], value: BaseAtomicType):
+        self.value[table_key(key)] = value
+
+    def del_(self, key: Union[TableKey, BaseAtomicType]):
+        del self.value[table_key(key)]
+
+    def keys(self) -> list[BaseAtomicType]:
+        return [atomic_table_key(key) for key in self.value]
 
-    def del_(self, key: String):
-        del self.value[key]
+    def empty_copy(self) -> "Table":
+        return Table()
+
+    def copy_into(self, copied: "Table", copy_item: CopyItem):
+        copied.value = {key: copy_item(item) for key, item in self.value.items()}
 
     def len(self) -> Number:
         return Number(len(self.value))
@@ -215,38 +512,25 @@ class Table(BaseAtomicType):
     def type_name(cls):
         return "Таблица"
 
+    def __setstate__(self, state: dict):
+        # Таблицы из старых .law файлов хранят ключи обёртками String
+        self.__dict__.update(state)
+        self.value = {table_key(key): item for key, item in self.value.items()}
+
     def __contains__(self, key):
-        return key in self.value
+        return table_key(key) in self.value
 
-    def __getitem__(self, item: String):
-        return self.value[item]
+    def __getitem__(self, item: Union[TableKey, BaseAtomicType]):
+        return self.value[table_key(item)]
 
-    def __setitem__(self, key: String, value: BaseAtomicType):
-        self.value[key] = value
+    def __setitem__(self, key: Union[TableKey, BaseAtomicType], value: BaseAtomicType):
+        self.value[table_key(key)] = value
 
     def __len__(self):
         return len(self.value)
 
     def __str__(self):
-        if id(self) in self.visited:
-            return "ЦИКЛИЧЕСКАЯ ССЫЛКА"
-
-        self.visited.add(id(self))
-        result = ""
-
-        for key, value in self.value.items():
-            result += ", "
-
-            if isinstance(value, String):
-                result += f"\"{key}\": \"{value}\""
-            elif value is self:
-                result += f"\"{key}\": {'ЦИКЛИЧЕСКАЯ ССЫЛКА'}"
-            else:
-                result += f"\"{key}\": {value}"
-
-        self.visited.remove(id(self))
-
-        return "{" + result[2:] + "}"
+        return render(self)
 
 
 class Void(BaseAtomicType):
@@ -320,6 +604,36 @@ class CustomType(BaseAtomicType):
         return Tokens.spec_type
 
 
+class LazySequence(CustomType):
+    """
+    Ленивая последовательность: элементы вычисляются по одному во время обхода,
+    поэтому вся последовательность целиком в памяти не хранится.
+    Последовательность генераторной процедуры одноразовая, как генератор в Python.
+    """
+    def __init__(self, source: Callable[[], Iterator[BaseAtomicType]], reusable: bool = True):
+        super().__init__(source)
+        self.reusable = reusable
+        self.consumed = False
+
+    def __iter__(self) -> Iterator[BaseAtomicType]:
+        if not self.reusable:
+            if self.consumed:
+                raise ErrorValue(
+                    "Последовательность уже пройдена! Для повторного обхода сохраните её через 'в_массив'."
+                )
+
+            self.consumed = True
+
+        return self.value()
+
+    @classmethod
+    def type_name(cls):
+        return "Последовательность"
+
+    def __str__(self) -> str:
+        return "Последовательность()"
+
+
 class Yield(BaseAtomicType):
     def __init__(self):
         super().__init__(None)
@@ -327,3 +641,129 @@ class Yield(BaseAtomicType):
 
 YIELD: Final[Yield] = Yield()
 VOID: Final[Void] = Void()
+
+
+CYCLE_REFERENCE: Final[str] = "ЦИКЛИЧЕСКАЯ ССЫЛКА"
+
+
+def _quoted(string: String) -> str:
+    return f"\"{string.value}\""
+
+
+def _table_key_str(key: TableKey) -> str:
+    return f"\"{key if isinstance(key, str) else atomic_table_key(key)}\""
+
+
+# Как выводить элементы коллекций, которые не содержат других коллекций
+_LEAF_RENDERERS: Final[dict[type, Callable[[BaseAtomicType], str]]] = {
+    String: _quoted,
+    Number: Number.__str__,
+    Boolean: Boolean.__str__,
+    Void: Void.__str__,
+}
+
+
+def _render_flat(collection: Union[Array, Table], limit: Optional[int]) -> Optional[str]:
+    """Быстрый вывод коллекции из одних простых значений. None - если внутри есть что-то ещё."""
+    is_table = isinstance(collection, Table)
+    items = collection.value.items() if is_table else collection.value
+    rest = 0
+
+    if limit is not None and len(collection) > limit:
+        rest = len(collection) - limit
+        items = islice(items, limit)
+
+    try:
+        if is_table:
+            rendered = [f"{_table_key_str(key)}: {_LEAF_RENDERERS[type(value)](value)}" for key, value in items]
+        else:
+            rendered = [_LEAF_RENDERERS[type(value)](value) for value in items]
+    except KeyError:
+        return None
+
+    if rest:
+        rendered.append(f"... (ещё {rest})")
+
+    body = ", ".join(rendered)
+
+    return f"{{{body}}}" if is_table else f"[{body}]"
+
+
+def render(obj: BaseAtomicType, limit: Optional[int] = None) -> str:
+    """
+    Строковое представление значения. Вложенные массивы и таблицы обходятся явным стеком,
+    а части вывода собираются в один список и склеиваются один раз.
+    Циклы ищутся по коллекциям на текущем пути от корня, поэтому сам объект при печати не меняется.
+    limit - сколько элементов каждой коллекции выводить, остальные заменяются на '...'.
+    """
+    if not isinstance(obj, (Array, Table)):
+        return str(obj)
+
+    parts: list[str] = []
+    write = parts.append
+    path: set[int] = set()
+    # Кадр: коллекция, итератор по её элементам и сколько элементов уже выведено
+    stack: list[list] = []
+
+    def enter(collection: Union[Array, Table]):
+        flat = _render_flat(collection, limit)
+
+        if flat is not None:
+            write(flat)
+            return
+
+        path.add(id(collection))
+
+        if isinstance(collection, Table):
+            write("{")
+            stack.append([collection, iter(collection.value.items()), 0])
+        else:
+            write("[")
+            stack.append([collection, iter(collection.value), 0])
+
+    enter(obj)
+
+    while stack:
+        frame = stack[-1]
+        collection, items, count = frame
+        is_table = isinstance(collection, Table)
+        nested = None
+
+        for item in items:
+            if count:
+                write(", ")
+
+            if limit is not None and count >= limit:
+                write(f"... (ещё {len(collection) - count})")
+                break
+
+            count += 1
+
+            if is_table:
+                key, value = item
+                write(f"{_table_key_str(key)}: ")
+            else:
+                value = item
+
+            if isinstance(value, String):
+                write(_quoted(value))
+            elif isinstance(value, (Array, Table)):
+                if id(value) in path:
+                    write(CYCLE_REFERENCE)
+                else:
+                    nested = value
+                    break
+            else:
+                write(str(value))
+
+        if nested is not None:
+            # Коллекция продолжит вывод со следующего элемента после вложенной
+            frame[2] = count
+            enter(nested)
+            continue
+
+        stack.pop()
+        path.discard(id(collection))
+        write("}" if is_table else "]")
+
+    return "".join(parts)
@@ -1,4 +1,4 @@
-from typing import Any, Optional, TYPE_CHECKING, Union
+from typing import Any, Callable, Optional, TYPE_CHECKING, Union
 
 from src.core.types.line import Info
 
@@ -15,6 +15,44 @@ class BaseType:
     def set_info(self, meta_info: Info):
         self.meta_info = meta_info
 
+    def empty_copy(self) -> Optional["BaseType"]:
+        """Пустой объект для копии значения. None - значение неизменяемое, копии используют его же."""
+        return None
+
+    def copy_into(self, copied: "BaseType", copy_item: "CopyItem"):
+        """Заполняет копию значения, copy_item копирует вложенные значения."""
+
+    def copy_value(self) -> "BaseType":
+        """
+        Поверхностная копия значения LawScript: контейнер новый, вложенные значения общие.
+        Копируются только значения, определения классов и процедур остаются общими.
+        """
+        copied = self.empty_copy()
+
+        if copied is None:
+            return self
+
+        self.copy_into(copied, _same_value)
+
+        return copied
+
+    def deepcopy_value(self, memo: dict[int, "BaseType"]) -> "BaseType":
+        """Глубокая копия значения LawScript. memo - уже скопированные значения по id, для циклов и общих ссылок."""
+        copied = memo.get(id(self))
+
+        if copied is not None:
+            return copied
+
+        copied = self.empty_copy()
+
+        if copied is None:
+            return self
+
+        memo[id(self)] = copied
+        self.copy_into(copied, lambda item: item.deepcopy_value(memo))
+
+        return copied
+
     @classmethod
     def type_name(cls):
         return f"{cls.__name__}"
@@ -23,6 +61,13 @@ class BaseType:
         return f"Служебное имя: <{self.name if self.name else 'ОТСУТСТВУЕТ'}>"
 
 
+CopyItem = Callable[[BaseType], BaseType]
+
+
+def _same_value(item: BaseType) -> BaseType:
+    return item
+
+
 class BaseAtomicType(BaseType):
     def __init__(self, value: Any):
         super().__init__(str())
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import Iterator, TYPE_CHECKING
 
 from src.core.types.base_declarative_type import BaseDeclarativeType
 from src.core.types.conditions import ResultCondition
@@ -24,6 +24,12 @@ class CheckerSituation(BaseDeclarativeType):
             compiled=compiled
         )
 
+    def iter_check(self, compiled: "Compiled") -> Iterator[ResultCondition]:
+        return self.document.hypothesis.condition.iter_execute(
+            fact_data=self.fact_situation.data,
+            compiled=compiled
+        )
+
 
     def __repr__(self) -> str:
         return f"{CheckerSituation.__name__}(__документ__={self.document}, __фактическая_ситуация__={self.fact_situation})"
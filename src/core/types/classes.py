@@ -1,7 +1,7 @@
 from typing import Optional, TypeVar, Generic, Type, Union
 
 from src.core.types.atomic import VOID
-from src.core.types.basetype import BaseType, BaseAtomicType
+from src.core.types.basetype import BaseType, BaseAtomicType, CopyItem
 from src.core.types.procedure import Procedure, Body, Expression
 from src.core.exceptions import BaseError, create_define_class_wrap, EXCEPTIONS
 
@@ -40,6 +40,10 @@ class ClassField(BaseAtomicType, Generic[_T]):
         super().__init__(value)
 
 
+def copy_fields(fields: dict[str, ClassField], copy_item: CopyItem) -> dict[str, ClassField]:
+    return {name: ClassField(copy_item(field.value)) for name, field in fields.items()}
+
+
 class ClassDefinition(BaseType):
     def __init__(
             self, name, parent: Optional['ClassDefinition'] = None,
@@ -132,5 +136,18 @@ class ClassInstance(BaseAtomicType):
 
         return super().get_attribute(name)
 
+    def empty_copy(self) -> "ClassInstance":
+        # Конструктор заново создал бы экземпляр родителя, копия собирается без него
+        return type(self).__new__(type(self))
+
+    def copy_into(self, copied: "ClassInstance", copy_item: CopyItem):
+        # Определение класса (metadata) у копии общее с исходным экземпляром
+        copied.__dict__.update(self.__dict__)
+        copied.value = copied
+        copied.fields = copy_fields(self.fields, copy_item)
+
+        if self.children is not None:
+            copied.children = copy_item(self.children)
+
     def __str__(self):
         return f"Экземпляр('{self.class_name}')"
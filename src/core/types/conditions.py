@@ -1,21 +1,33 @@
 from abc import ABC, abstractmethod
-from typing import Any, TYPE_CHECKING
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, TYPE_CHECKING, Callable, Iterator, Optional, Union
 
+from config import settings
 from src.core.call_func_stack import call_func_stack_builder
 from src.core.exceptions import NameNotDefine, ErrorType
-from src.core.executors.body import STOP
-from src.core.executors.procedure import ProcedureExecutor
+from src.core.executors.body import BodyExecutor, STOP
 from src.core.types.atomic import String, Boolean, VOID
 from src.core.types.base_declarative_type import BaseDeclarativeType
 from src.core.types.basetype import BaseAtomicType
 from src.core.types.criteria import Criteria
+from src.core.types.fact_columns import FactColumns, MISSING
 from src.core.types.procedure import Procedure
 from src.core.types.variable import Variable, ScopeStack
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 if TYPE_CHECKING:
     from src.util.build_tools.compile import Compiled
 
 
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
 class Modify(ABC):
     def __init__(self, value: BaseAtomicType):
         self.value = value
@@ -23,6 +35,51 @@ class Modify(ABC):
     @abstractmethod
     def calculate(self, other: BaseAtomicType) -> bool: ...
 
+    @abstractmethod
+    def raw_predicate(self) -> Callable[[Any], bool]: ...
+
+    def numpy_mask(self, array: "np.ndarray") -> Optional["np.ndarray"]:
+        """Булева маска по числовому массиву. None - критерий нельзя посчитать через NumPy."""
+        return None
+
+    def calculate_numeric(self, array: "np.ndarray", present: Optional["np.ndarray"]) -> Optional[list[Optional[bool]]]:
+        """То же, что calculate_column, но одной операцией NumPy над числовой колонкой."""
+        mask = self.numpy_mask(array)
+
+        if mask is None:
+            return None
+
+        if present is None:
+            return mask.tolist()
+
+        return np.where(present, mask, None).tolist()
+
+    def calculate_column(self, values: list[Any]) -> list[Optional[bool]]:
+        """
+        Проверяет колонку значений без обёрток языка.
+        None в результате - значение отсутствует в записи или не сравнимо с критерием.
+        """
+        predicate = self.raw_predicate()
+
+        try:
+            return [None if value is MISSING else predicate(value) for value in values]
+        except TypeError:
+            pass
+
+        result = []
+
+        for value in values:
+            if value is MISSING:
+                result.append(None)
+                continue
+
+            try:
+                result.append(predicate(value))
+            except TypeError:
+                result.append(None)
+
+        return result
+
     def __repr__(self):
         return f"{self.__class__.__name__}"
 
@@ -31,6 +88,16 @@ class Only(Modify):
     def calculate(self, other: BaseAtomicType) -> bool:
         return self.value.value == other.value
 
+    def raw_predicate(self) -> Callable[[Any], bool]:
+        target = self.value.value
+        return lambda value: value == target
+
+    def numpy_mask(self, array: "np.ndarray") -> Optional["np.ndarray"]:
+        if not _is_number(self.value.value):
+            return None
+
+        return array == self.value.value
+
     def __repr__(self):
         return f"Равно {self.value}"
 
@@ -39,6 +106,16 @@ class LessThan(Modify):
     def calculate(self, other: BaseAtomicType) -> bool:
         return other.value < self.value.value
 
+    def raw_predicate(self) -> Callable[[Any], bool]:
+        bound = self.value.value
+        return lambda value: value < bound
+
+    def numpy_mask(self, array: "np.ndarray") -> Optional["np.ndarray"]:
+        if not _is_number(self.value.value):
+            return None
+
+        return array < self.value.value
+
     def __repr__(self):
         return f"Меньше чем {self.value}"
 
@@ -47,6 +124,16 @@ class GreaterThan(Modify):
     def calculate(self, other: BaseAtomicType) -> bool:
         return other.value > self.value.value
 
+    def raw_predicate(self) -> Callable[[Any], bool]:
+        bound = self.value.value
+        return lambda value: value > bound
+
+    def numpy_mask(self, array: "np.ndarray") -> Optional["np.ndarray"]:
+        if not _is_number(self.value.value):
+            return None
+
+        return array > self.value.value
+
     def __repr__(self):
         return f"Больше чем {self.value}"
 
@@ -60,6 +147,18 @@ class Between(Modify):
     def calculate(self, other: BaseAtomicType) -> bool:
         return self.lower_bound.value  < other.value < self.upper_bound.value
 
+    def raw_predicate(self) -> Callable[[Any], bool]:
+        lower, upper = self.lower_bound.value, self.upper_bound.value
+        return lambda value: lower < value < upper
+
+    def numpy_mask(self, array: "np.ndarray") -> Optional["np.ndarray"]:
+        lower, upper = self.lower_bound.value, self.upper_bound.value
+
+        if not (_is_number(lower) and _is_number(upper)):
+            return None
+
+        return (lower < array) & (array < upper)
+
     def __repr__(self):
         return f"{self.lower_bound} Между {self.upper_bound}"
 
@@ -68,22 +167,94 @@ class NotEqual(Modify):
     def calculate(self, other: BaseAtomicType) -> bool:
         return self.value.value != other.value
 
+    def raw_predicate(self) -> Callable[[Any], bool]:
+        target = self.value.value
+        return lambda value: value != target
+
+    def numpy_mask(self, array: "np.ndarray") -> Optional["np.ndarray"]:
+        if not _is_number(self.value.value):
+            return None
+
+        return array != self.value.value
+
     def __repr__(self):
         return f"Исключая {self.value}"
 
 
 class ProcedureModifyWrapper(Modify):
+    # Для объектов из старых .law файлов имя процедуры хранится только в nested_modify.value
+    procedure_name: Optional[str] = None
+
     def __init__(self, modify: Modify):
         super().__init__(modify)
         self.nested_modify = modify
+        self.procedure_name = modify.value
 
     def calculate(self, other: BaseAtomicType) -> bool:
         return self.nested_modify.calculate(other)
 
+    def raw_predicate(self) -> Callable[[Any], bool]:
+        return self.nested_modify.raw_predicate()
+
     def __repr__(self):
         return self.nested_modify.__repr__()
 
 
+class ProcedureCriteriaCache:
+    """
+    LRU-кэш значений, которые чистые процедуры вернули для критериев.
+    Ключ - процедура и значение факта, поэтому одинаковые факты не пересчитываются.
+    """
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple, BaseAtomicType] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, procedure: Procedure, fact: BaseAtomicType, compute: Callable[[], BaseAtomicType]) -> BaseAtomicType:
+        if self.max_size <= 0:
+            return compute()
+
+        key = (procedure, type(fact), type(fact.value), fact.value)
+
+        try:
+            hash(key)
+        except TypeError:
+            # Таблицы и массивы не хэшируются: такие значения считаем без кэша
+            return compute()
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        value = compute()
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = value
+
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def stats(self) -> tuple[int, int]:
+        with self._lock:
+            return self.hits, self.misses
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+procedure_criteria_cache = ProcedureCriteriaCache(settings.procedure_criteria_cache_size)
+
+
 class ResultCondition:
     def __init__(self, name_criteria: str, value_fact_data: BaseAtomicType, result: bool, modify: Modify):
         self.name_criteria = name_criteria
@@ -93,6 +264,9 @@ class ResultCondition:
 
 
 class Condition(BaseDeclarativeType):
+    # Сгенерированная функция критериев не попадает в .law файлы: для загруженной программы создаётся заново
+    _predicate: Optional[Callable] = None
+
     def __init__(self, name: str, description: str, criteria: Criteria):
         super().__init__(name)
         self.description = String(description)
@@ -103,52 +277,157 @@ class Condition(BaseDeclarativeType):
     def __repr__(self) -> str:
         return f"Condition(__описание__='{self.description}')"
 
-    def execute(self, fact_data: dict[str, Any], compiled: "Compiled") -> dict[str, ResultCondition]:
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop("_predicate", None)
+
+        return state
+
+    def _call_procedure(
+            self, name_fact_data: str, procedure: Procedure, value_fact_data: BaseAtomicType, compiled: "Compiled"
+    ) -> BaseAtomicType:
+        # Своя область видимости на каждый вызов: сама процедура и документ не изменяются
+        tree_variables = ScopeStack()
+        tree_variables.set(Variable(procedure.arguments_names[0], value_fact_data))
+
+        call_func_stack_builder.push(procedure.name, procedure.meta_info)
+
+        returned_value = BodyExecutor(procedure.body, tree_variables, compiled).execute()
+
+        if returned_value is STOP:
+            raise ErrorType(
+                f"При проверке документа через '{self.name}' "
+                f"процедура: '{procedure.name}' не вернула значение для выполнения сравнения по критерию: "
+                f"'{name_fact_data}'"
+            )
+
+        call_func_stack_builder.pop()
+
+        return returned_value
+
+    def _resolve_procedure_modify(
+            self, name_fact_data: str, modify: ProcedureModifyWrapper,
+            value_fact_data: BaseAtomicType, compiled: "Compiled"
+    ) -> Modify:
+        """Возвращает критерий со значением, которое вернула процедура для этого факта."""
+        name = modify.procedure_name or modify.nested_modify.value
+
+        if name not in compiled.compiled_code:
+            raise NameNotDefine(name=name)
+
+        procedure: Procedure = compiled.compiled_code[name]
+
+        if procedure.pure:
+            returned_value = procedure_criteria_cache.get(
+                procedure, value_fact_data,
+                lambda: self._call_procedure(name_fact_data, procedure, value_fact_data, compiled)
+            )
+        else:
+            returned_value = self._call_procedure(name_fact_data, procedure, value_fact_data, compiled)
+
+        return type(modify.nested_modify)(returned_value)
+
+    def execute_columns(
+            self, columns: FactColumns, compiled: "Compiled",
+            resolved_modify: Optional[dict[str, list[Optional[Modify]]]] = None
+    ) -> dict[str, list[Optional[bool]]]:
+        """
+        Проверяет пачку записей сразу по колонкам.
+        Числовые колонки считаются через NumPy, если он установлен, остальные - целой колонкой в Python.
+        Критерии с процедурой - по одному значению, вычисленные для записей критерии
+        складываются в resolved_modify, если он передан.
+        """
         result = {}
 
-        for name_fact_data, value_fact_data in fact_data.items():
-            if name_fact_data not in self.criteria.modify:
+        for name_criteria, modify in self.criteria.modify.items():
+            if name_criteria not in columns:
                 continue
 
-            modify = self.criteria.modify.get(name_fact_data)
+            if not isinstance(modify, ProcedureModifyWrapper):
+                numeric = columns.numeric_column(name_criteria)
+                column_result = None
 
-            if isinstance(self.criteria.modify[name_fact_data], ProcedureModifyWrapper):
-                name = modify.nested_modify.value
+                if numeric is not None:
+                    column_result = modify.calculate_numeric(*numeric)
 
-                if name not in compiled.compiled_code:
-                    raise NameNotDefine(name=name)
+                if column_result is None:
+                    column_result = modify.calculate_column(columns.raw_column(name_criteria))
 
-                procedure: Procedure = compiled.compiled_code[name]
+                result[name_criteria] = column_result
+                continue
 
-                arg = Variable(procedure.arguments_names[0], value_fact_data)
+            column_result = []
+            resolved_column = []
 
-                procedure.tree_variables = ScopeStack()
-                procedure.tree_variables.set(arg)
+            for value_fact_data in columns.column(name_criteria):
+                if value_fact_data is MISSING:
+                    column_result.append(None)
+                    resolved_column.append(None)
+                    continue
 
-                executor = ProcedureExecutor(procedure, compiled)
+                resolved = self._resolve_procedure_modify(name_criteria, modify, value_fact_data, compiled)
+                resolved_column.append(resolved)
 
-                call_func_stack_builder.push(executor.procedure.name, procedure.meta_info)
+                try:
+                    column_result.append(resolved.calculate(value_fact_data))
+                except TypeError:
+                    column_result.append(None)
 
-                returned_value = executor.execute()
+            result[name_criteria] = column_result
 
-                if returned_value is STOP:
-                    raise ErrorType(
-                        f"При проверке документа через '{self.name}' "
-                        f"процедура: '{procedure.name}' не вернула значение для выполнения сравнения по критерию: "
-                        f"'{name_fact_data}'"
-                    )
+            if resolved_modify is not None:
+                resolved_modify[name_criteria] = resolved_column
 
-                modify.nested_modify.value = returned_value
-                call_func_stack_builder.pop()
+        return result
 
-            try:
-                result[name_fact_data] = ResultCondition(
-                    name_criteria=name_fact_data,
-                    value_fact_data=value_fact_data,
-                    result=modify.calculate(value_fact_data),
-                    modify=modify
-                )
-            except TypeError:
-                raise TypeError(f"Произошла ошибка при проверке критерия: '{name_fact_data}'. Не верный тип!\n")
+    def execute(
+            self, fact_data: Union[dict[str, Any], FactColumns], compiled: "Compiled"
+    ) -> Union[dict[str, ResultCondition], dict[str, list[Optional[bool]]]]:
+        if isinstance(fact_data, FactColumns):
+            return self.execute_columns(fact_data, compiled)
 
-        return result
+        return {
+            result_condition.name_criteria: result_condition
+            for result_condition in self.iter_execute(fact_data, compiled)
+        }
+
+    def is_satisfied(self, fact_data: dict[str, BaseAtomicType], compiled: "Compiled") -> bool:
+        """
+        Быстрая проверка без подробностей по критериям: одна сгенерированная функция на условие.
+        Останавливается на первом нарушенном критерии.
+        """
+        if self._predicate is None:
+            from src.core.types.criteria_predicate import build_criteria_predicate
+
+            self._predicate = build_criteria_predicate(self)
+
+        return self._predicate(self, fact_data, compiled)
+
+    def iter_execute(self, fact_data: dict[str, Any], compiled: "Compiled") -> Iterator[ResultCondition]:
+        """Проверяет факты по одному критерию за раз, отдавая результат сразу после вычисления."""
+        for name_fact_data, value_fact_data in fact_data.items():
+            if name_fact_data not in self.criteria.modify:
+                continue
+
+            yield self.execute_criteria(name_fact_data, value_fact_data, compiled)
+
+    def execute_criteria(
+            self, name_fact_data: str, value_fact_data: BaseAtomicType, compiled: "Compiled"
+    ) -> ResultCondition:
+        """Проверяет одно значение факта по его критерию."""
+        modify = self.criteria.modify[name_fact_data]
+
+        if isinstance(modify, ProcedureModifyWrapper):
+            modify = self._resolve_procedure_modify(name_fact_data, modify, value_fact_data, compiled)
+
+        try:
+            result = modify.calculate(value_fact_data)
+        except TypeError:
+            raise TypeError(f"Произошла ошибка при проверке критерия: '{name_fact_data}'. Не верный тип!\n")
+
+        return ResultCondition(
+            name_criteria=name_fact_data,
+            value_fact_data=value_fact_data,
+            result=result,
+            modify=modify
+        )
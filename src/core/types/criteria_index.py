@@ -0,0 +1,241 @@
+from collections import defaultdict
+from typing import Any, NamedTuple, Optional, TYPE_CHECKING
+
+from src.core.types.basetype import BaseAtomicType, BaseType
+from src.core.types.conditions import (
+    Modify, Only, NotEqual, LessThan, GreaterThan, Between, ProcedureModifyWrapper
+)
+from src.core.types.documents import Document
+
+if TYPE_CHECKING:
+    from src.util.build_tools.compile import Compiled
+
+_INF = float("inf")
+
+
+def _is_number(value: Any) -> bool:
+    # bool сравнивается с числами так же, как в самих критериях
+    return isinstance(value, (int, float))
+
+
+class _Interval(NamedTuple):
+    # Границы не входят в интервал: все сравнения критериев строгие
+    low: float
+    high: float
+    document: str
+
+    def midpoint(self) -> float:
+        if self.low == -_INF and self.high == _INF:
+            return 0
+
+        if self.low == -_INF:
+            return self.high - 1
+
+        if self.high == _INF:
+            return self.low + 1
+
+        return self.low / 2 + self.high / 2
+
+
+class _IntervalNode:
+    """Узел центрированного дерева интервалов."""
+    def __init__(self, intervals: list[_Interval]):
+        midpoints = sorted(interval.midpoint() for interval in intervals)
+        self.center = midpoints[len(midpoints) // 2]
+
+        here, left, right = [], [], []
+
+        for interval in intervals:
+            if interval.high <= self.center:
+                left.append(interval)
+            elif interval.low >= self.center:
+                right.append(interval)
+            else:
+                here.append(interval)
+
+        # Из-за округления середины ни один интервал мог не попасть в узел
+        if not here:
+            here, left, right = intervals, [], []
+
+        self.by_low = sorted(here, key=lambda interval: interval.low)
+        self.by_high = sorted(here, key=lambda interval: interval.high, reverse=True)
+        self.left = _IntervalNode(left) if left else None
+        self.right = _IntervalNode(right) if right else None
+
+    def stab(self, point: float, result: set[str]):
+        node = self
+
+        while node is not None:
+            if point < node.center:
+                for interval in node.by_low:
+                    if interval.low >= point:
+                        break
+
+                    result.add(interval.document)
+
+                node = node.left
+            elif point > node.center:
+                for interval in node.by_high:
+                    if interval.high <= point:
+                        break
+
+                    result.add(interval.document)
+
+                node = node.right
+            else:
+                result.update(interval.document for interval in node.by_low)
+                return
+
+
+class _FieldIndex:
+    """Индекс критериев одного поля фактических данных по всем документам."""
+    def __init__(self):
+        # Критерии, которые нельзя проверить заранее (процедуры, несравнимые значения): всегда кандидаты
+        self.always: set[str] = set()
+        self.equal: dict[Any, set[str]] = defaultdict(set)
+        self.not_equal: dict[Any, set[str]] = defaultdict(set)
+        self.not_equal_documents: set[str] = set()
+        self.intervals: list[_Interval] = []
+        self.tree: Optional[_IntervalNode] = None
+
+    def add(self, document: str, modify: Modify):
+        if isinstance(modify, ProcedureModifyWrapper):
+            self.always.add(document)
+            return
+
+        try:
+            if isinstance(modify, Only):
+                self.equal[modify.value.value].add(document)
+                return
+
+            if isinstance(modify, NotEqual):
+                self.not_equal[modify.value.value].add(document)
+                self.not_equal_documents.add(document)
+                return
+        except TypeError:
+            # Нехэшируемое значение критерия
+            self.always.add(document)
+            return
+
+        if isinstance(modify, LessThan):
+            low, high = -_INF, modify.value.value
+        elif isinstance(modify, GreaterThan):
+            low, high = modify.value.value, _INF
+        elif isinstance(modify, Between):
+            low, high = modify.lower_bound.value, modify.upper_bound.value
+        else:
+            self.always.add(document)
+            return
+
+        if not (_is_number(low) and _is_number(high)):
+            self.always.add(document)
+            return
+
+        # Пустой интервал (например МЕЖДУ 5 И 1) не выполняется никогда
+        if low < high:
+            self.intervals.append(_Interval(low, high, document))
+
+    def build(self):
+        self.equal = dict(self.equal)
+        self.not_equal = dict(self.not_equal)
+        self.tree = _IntervalNode(self.intervals) if self.intervals else None
+        self.intervals = []
+
+    def passed(self, value: Any) -> set[str]:
+        result = set(self.always)
+
+        try:
+            result.update(self.equal.get(value, ()))
+            result.update(self.not_equal_documents - self.not_equal.get(value, set()))
+        except TypeError:
+            # Нехэшируемое значение факта: сравниваем с каждым значением по отдельности
+            for target, documents in self.equal.items():
+                if target == value:
+                    result.update(documents)
+
+            for target, documents in self.not_equal.items():
+                if target != value:
+                    result.update(documents)
+
+        # NaN не попадает ни в один интервал
+        if self.tree is not None and _is_number(value) and value == value:
+            self.tree.stab(value, result)
+
+        return result
+
+
+class CriteriaIndex:
+    """
+    Индекс критериев всех документов программы.
+    По фактическим данным быстро отбирает документы, которые могут им соответствовать,
+    чтобы полностью проверялись только они.
+    """
+    def __init__(self):
+        self.fields: dict[str, _FieldIndex] = {}
+        self.document_fields: dict[str, tuple[str, ...]] = {}
+        self.order: dict[str, int] = {}
+
+    @classmethod
+    def build(cls, compiled_code: dict[str, BaseType]) -> "CriteriaIndex":
+        index = cls()
+
+        for name, obj in compiled_code.items():
+            if isinstance(obj, Document):
+                index.add_document(name, obj)
+
+        for field in index.fields.values():
+            field.build()
+
+        return index
+
+    def add_document(self, name: str, document: Document):
+        modify = document.hypothesis.condition.criteria.modify
+        self.document_fields[name] = tuple(modify.keys())
+        self.order[name] = len(self.order)
+
+        for name_criteria, criteria_modify in modify.items():
+            self.fields.setdefault(name_criteria, _FieldIndex()).add(name, criteria_modify)
+
+    def candidates(self, facts: dict[str, BaseAtomicType]) -> list[str]:
+        """
+        Имена документов, у которых есть критерии по переданным фактам и ни один из них заведомо не нарушен.
+        Документы без критериев по этим фактам не возвращаются.
+        """
+        passed_count: dict[str, int] = defaultdict(int)
+
+        for name_fact, value in facts.items():
+            field = self.fields.get(name_fact)
+
+            if field is None:
+                continue
+
+            for document in field.passed(value.value):
+                passed_count[document] += 1
+
+        result = [
+            document
+            for document, count in passed_count.items()
+            if count == sum(1 for name_fact in self.document_fields[document] if name_fact in facts)
+        ]
+        result.sort(key=self.order.__getitem__)
+
+        return result
+
+    def matching(self, facts: dict[str, BaseAtomicType], compiled: "Compiled") -> list[str]:
+        """Имена документов, которым факты соответствуют: кандидаты из индекса проверяются полностью."""
+        result = []
+
+        for name in self.candidates(facts):
+            condition = compiled.compiled_code[name].hypothesis.condition
+
+            try:
+                if condition.is_satisfied(facts, compiled):
+                    result.append(name)
+            except TypeError:
+                continue
+
+        return result
+
+    def __len__(self) -> int:
+        return len(self.document_fields)
+
@@ -0,0 +1,89 @@
+from typing import Any, Callable, NoReturn, TYPE_CHECKING
+
+from src.core.types.basetype import BaseAtomicType
+from src.core.types.conditions import (
+    Condition, Modify, Only, NotEqual, LessThan, GreaterThan, Between, ProcedureModifyWrapper
+)
+from src.core.types.fact_columns import MISSING
+
+if TYPE_CHECKING:
+    from src.util.build_tools.compile import Compiled
+
+# Условие передаётся аргументом, чтобы функция не держала ссылку на него
+CriteriaPredicate = Callable[[Condition, dict[str, BaseAtomicType], "Compiled"], bool]
+
+
+def _type_error(name_criteria: str) -> NoReturn:
+    raise TypeError(f"Произошла ошибка при проверке критерия: '{name_criteria}'. Не верный тип!\n")
+
+
+def _comparison(modify: Modify, index: int, namespace: dict[str, Any]) -> str:
+    """Выражение сравнения с константами критерия, вынесенными в пространство имён функции."""
+    if isinstance(modify, Only):
+        namespace[f"c{index}"] = modify.value.value
+        return f"c{index} == fact.value"
+
+    if isinstance(modify, NotEqual):
+        namespace[f"c{index}"] = modify.value.value
+        return f"c{index} != fact.value"
+
+    if isinstance(modify, LessThan):
+        namespace[f"c{index}"] = modify.value.value
+        return f"fact.value < c{index}"
+
+    if isinstance(modify, GreaterThan):
+        namespace[f"c{index}"] = modify.value.value
+        return f"fact.value > c{index}"
+
+    if isinstance(modify, Between):
+        namespace[f"l{index}"] = modify.lower_bound.value
+        namespace[f"u{index}"] = modify.upper_bound.value
+        return f"l{index} < fact.value < u{index}"
+
+    namespace[f"m{index}"] = modify
+    return f"m{index}.calculate(fact)"
+
+
+def build_criteria_predicate(condition: Condition) -> CriteriaPredicate:
+    """
+    Генерирует одну функцию проверки всех критериев условия со встроенными сравнениями.
+    Критерии с процедурой проверяются последними: до них доходит только то, что прошло остальные.
+    """
+    namespace: dict[str, Any] = {
+        "MISSING": MISSING,
+        "_type_error": _type_error,
+        "resolve": Condition._resolve_procedure_modify,  # noqa
+    }
+    lines = ["def predicate(condition, facts, compiled):"]
+    items = list(enumerate(condition.criteria.modify.items()))
+    items.sort(key=lambda item: isinstance(item[1][1], ProcedureModifyWrapper))
+
+    for index, (name_criteria, modify) in items:
+        namespace[f"n{index}"] = name_criteria
+        lines += [
+            f"    fact = facts.get(n{index}, MISSING)",
+            f"    if fact is not MISSING:",
+        ]
+
+        if isinstance(modify, ProcedureModifyWrapper):
+            namespace[f"p{index}"] = modify
+            lines.append(f"        modify = resolve(condition, n{index}, p{index}, fact, compiled)")
+            comparison = "modify.calculate(fact)"
+        else:
+            comparison = _comparison(modify, index, namespace)
+
+        lines += [
+            f"        try:",
+            f"            passed = {comparison}",
+            f"        except TypeError:",
+            f"            _type_error(n{index})",
+            f"        if not passed:",
+            f"            return False",
+        ]
+
+    lines.append("    return True")
+
+    exec(compile("\n".join(lines), f"<критерии {condition.name}>", "exec"), namespace)
+
+    return namespace["predicate"]
+
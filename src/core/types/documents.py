@@ -1,4 +1,6 @@
-from src.core.types.atomic import Table, String
+from typing import Callable, Optional
+
+from src.core.types.atomic import Table
 from src.core.types.base_declarative_type import BaseDeclarativeType
 from src.core.types.basetype import BaseAtomicType
 from src.core.types.dispositions import Disposition
@@ -25,16 +27,109 @@ class Document(BaseDeclarativeType):
                 f")")
 
 
+# Получает имя изменённого факта и новое значение, None - факт удалён
+FactObserver = Callable[[str, Optional[BaseAtomicType]], None]
+
+
+class FactData(dict):
+    """
+    Факты ситуации. Общий словарь для FactSituation.data и таблицы __данные__,
+    поэтому любое изменение, в том числе из LawScript, доходит до подписчиков.
+    """
+    # Задаётся ситуацией. При загрузке из .law файла факты приходят раньше неё
+    on_change: Optional[FactObserver] = None
+
+    def __getstate__(self):
+        return None
+
+    def _changed(self, name: str, value: Optional[BaseAtomicType]):
+        if self.on_change is not None:
+            self.on_change(name, value)
+
+    def __setitem__(self, name: str, value: BaseAtomicType):
+        super().__setitem__(name, value)
+        self._changed(name, value)
+
+    def __delitem__(self, name: str):
+        super().__delitem__(name)
+        self._changed(name, None)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, name: str, *default):
+        exists = name in self
+        value = super().pop(name, *default)
+
+        if exists:
+            self._changed(name, None)
+
+        return value
+
+    def popitem(self):
+        name, value = super().popitem()
+        self._changed(name, None)
+        return name, value
+
+    def setdefault(self, name: str, default: Optional[BaseAtomicType] = None):
+        if name not in self:
+            self[name] = default
+
+        return self[name]
+
+    def update(self, *args, **kwargs):
+        for name, value in dict(*args, **kwargs).items():
+            self[name] = value
+
+    def clear(self):
+        for name in tuple(self):
+            del self[name]
+
+
 class FactSituation(BaseDeclarativeType):
+    # Подписчики появляются только во время работы программы, в .law файлах их нет
+    _observers: Optional[list[FactObserver]] = None
+
     def __init__(self, name: str, object_: Object, subject: Subject, data: dict[str, BaseAtomicType]):
         super().__init__(name)
         self.object_ = object_
         self.subject = subject
+        self.fields["__данные__"] = Table({})
+        self._bind_data(FactData(data))
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        # В старых .law файлах data и __данные__ - разные словари
+        self._bind_data(FactData(self.data))
+
+    def _bind_data(self, data: FactData):
+        data.on_change = self._notify
         self.data = data
+        self.fields["__данные__"].value = data
+
+    def subscribe(self, observer: FactObserver):
+        if self._observers is None:
+            self._observers = []
+
+        self._observers.append(observer)
+
+    def unsubscribe(self, observer: FactObserver):
+        if self._observers is not None and observer in self._observers:
+            self._observers.remove(observer)
+
+    def _notify(self, name: str, value: Optional[BaseAtomicType]):
+        if self._observers is None:
+            return
+
+        for observer in tuple(self._observers):
+            observer(name, value)
+
+    def set_fact(self, name: str, value: BaseAtomicType):
+        self.data[name] = value
 
-        self.fields["__данные__"] = Table(
-            {String(k): v for k, v in self.data.items()}
-        )
+    def remove_fact(self, name: str):
+        del self.data[name]
 
     def __repr__(self):
         return f"{FactSituation.__name__}(__данные__={self.data})"
@@ -0,0 +1,114 @@
+from typing import Any, Final, Iterable, Optional
+
+from src.core.types.basetype import BaseAtomicType
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# На коротких колонках создание массива NumPy дороже самого сравнения
+NUMPY_MIN_COLUMN = 64
+# Целые больше этого нельзя хранить в колонке float64 без потери точности
+MAX_EXACT_FLOAT_INT: Final[int] = 2 ** 53
+
+
+class _Missing:
+    def __repr__(self):
+        return "MISSING"
+
+
+# Отсутствующее в записи значение. None не подходит: это значение ПУСТОТА
+MISSING: Final[_Missing] = _Missing()
+
+
+class FactColumns:
+    """Пачка фактических данных в колоночном виде: для каждого поля список значений по записям."""
+    def __init__(self, columns: dict[str, list[Any]], size: int, missing: Optional[dict[str, int]] = None):
+        self.columns = columns
+        self.size = size
+        # Сколько записей не содержат поле. Без подсчёта считаем, что пропуски могут быть везде
+        self.missing = missing
+        self._numeric: dict[str, Optional[tuple["np.ndarray", Optional["np.ndarray"]]]] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, BaseAtomicType]]) -> "FactColumns":
+        columns: dict[str, list[Any]] = {}
+        missing: dict[str, int] = {}
+        size = 0
+
+        for record in records:
+            for name, value in record.items():
+                column = columns.get(name)
+
+                if column is None:
+                    column = [MISSING] * size
+                    columns[name] = column
+                    missing[name] = size
+
+                column.append(value)
+
+            size += 1
+
+            for name, column in columns.items():
+                if len(column) < size:
+                    column.append(MISSING)
+                    missing[name] += 1
+
+        return cls(columns, size, missing)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def __len__(self) -> int:
+        return self.size
+
+    def column(self, name: str) -> list[Any]:
+        return self.columns[name]
+
+    def raw_column(self, name: str) -> list[Any]:
+        """Значения без обёрток языка, подходящие для сравнения целой колонкой."""
+        return [value if value is MISSING else value.value for value in self.columns[name]]
+
+    def numeric_column(self, name: str) -> Optional[tuple["np.ndarray", Optional["np.ndarray"]]]:
+        """
+        Колонка как числовой массив NumPy и маска присутствующих значений (None - присутствуют все).
+        None вместо результата - NumPy не установлен, колонка короткая или в ней есть нечисловые значения.
+        """
+        if np is None or self.size < NUMPY_MIN_COLUMN:
+            return None
+
+        if name not in self._numeric:
+            self._numeric[name] = self._build_numeric_column(name)
+
+        return self._numeric[name]
+
+    def _build_numeric_column(self, name: str) -> Optional[tuple["np.ndarray", Optional["np.ndarray"]]]:
+        values = self.raw_column(name)
+        present = None
+
+        # NumPy приводит такие целые к float64 (пропуски - NaN, сравнение с дробным критерием),
+        # и результат мог бы разойтись с проверкой по одной записи
+        if any(type(value) is int and not -MAX_EXACT_FLOAT_INT <= value <= MAX_EXACT_FLOAT_INT for value in values):
+            return None
+
+        if self.missing is None or self.missing.get(name):
+            present = np.array([value is not MISSING for value in values], dtype=bool)
+            values = [value if value is not MISSING else np.nan for value in values]
+
+        try:
+            array = np.array(values)
+        except (ValueError, TypeError, OverflowError):
+            return None
+
+        if array.dtype.kind not in "biuf":
+            return None
+
+        return array, present
+
+    def record(self, index: int) -> dict[str, BaseAtomicType]:
+        return {
+            name: column[index]
+            for name, column in self.columns.items()
+            if column[index] is not MISSING
+        }
@@ -8,6 +8,8 @@ class Info(NamedTuple):
 
 
 class Line(str):
+    __slots__ = ("raw_data", "raw_line", "num", "file")
+
     def __new__(cls, value: str, num: int = 0, file: str = ""):
         obj = str.__new__(cls, value)
         obj.raw_data = value
@@ -12,15 +12,23 @@ from src.core.types.variable import ScopeStack
 class Procedure(CodeBlock):
     __slots__ = ('arguments_names', 'default_arguments', 'tree_variables')
 
+    # Объявлена как ОПРЕДЕЛИТЬ ЧИСТУЮ ПРОЦЕДУРУ: результат зависит только от аргументов.
+    # Не слот, чтобы процедуры из старых .law файлов загружались как нечистые
+    pure: bool = False
+    # Содержит ОТДАТЬ: вызов возвращает ленивую последовательность, а не выполняет тело сразу
+    generator: bool = False
+
     def __init__(
             self, name: str, body: Body,
-            arguments_names: list[Optional[str]], default_arguments: Optional[dict[str, 'Expression']] = None
+            arguments_names: list[Optional[str]], default_arguments: Optional[dict[str, 'Expression']] = None,
+            pure: bool = False
     ):
         super().__init__(name, body)
 
         self.arguments_names = arguments_names
         self.default_arguments = default_arguments
         self.tree_variables: Optional[ScopeStack] = None
+        self.pure = pure
 
     @classmethod
     def type_name(cls):
@@ -140,6 +148,15 @@ class When(CodeBlock):
         self.else_ = else_
 
 
+class YieldValue(BaseType):
+    __slots__ = ('expression',)
+
+    def __init__(self, name: str, expression: Expression):
+        super().__init__(name)
+
+        self.expression = expression
+
+
 class Return(BaseType):
     __slots__ = ('expression',)
 
@@ -169,6 +186,16 @@ class Loop(CodeBlock):
         self.name_loop_var = None
 
 
+class ForEach(CodeBlock):
+    __slots__ = ('expression', 'name_loop_var')
+
+    def __init__(self, name: str, name_loop_var: str, expression: Expression, body: Body):
+        super().__init__(name, body)
+
+        self.expression = expression
+        self.name_loop_var = name_loop_var
+
+
 class While(CodeBlock):
     __slots__ = ('expression',)
 
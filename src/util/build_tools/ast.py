@@ -35,7 +35,7 @@ class AbstractSyntaxTreeBuilder:
         self.jump = meta.stop_num
         self.meta_code.append(meta)
         printer.logging(
-            f"Создана мета-структура с использованием {parser.__class__.__name__} на строке {num}",
+            "Создана мета-структура с использованием %s на строке %s", parser.__class__.__name__, num,
             level="INFO"
         )
 
@@ -46,11 +46,11 @@ class AbstractSyntaxTreeBuilder:
                 continue
 
             if num <= self.jump:
-                printer.logging(f"Пропуск строки {num} (переход по jump)", level="DEBUG")
+                printer.logging("Пропуск строки %s (переход по jump)", num, level="DEBUG")
                 continue
 
             if is_ignore_line(line):
-                printer.logging(f"Игнорирование пустой или комментарий строки {num}", level="DEBUG")
+                printer.logging("Игнорирование пустой или комментарий строки %s", num, level="DEBUG")
                 continue
 
             match line.split():
@@ -58,6 +58,8 @@ class AbstractSyntaxTreeBuilder:
                     self.create_meta(TypeSanctionParser, num)
                 case [Tokens.define, Tokens.a_procedure, *_]:
                     self.create_meta(DefineProcedureParser, num)
+                case [Tokens.define, Tokens.pure, Tokens.a_procedure, *_]:
+                    self.create_meta(DefineProcedureParser, num)
                 case [Tokens.create, Tokens.document, *_]:
                     self.create_meta(CreateDocumentParser, num)
                 case [Tokens.create, Tokens.the_actual, Tokens.the_situation, *_]:
@@ -83,7 +85,7 @@ class AbstractSyntaxTreeBuilder:
                 case [Tokens.extend, Tokens.class_, *_]:
                     self.create_meta(DefineClassParser, num)
                 case _:
-                    printer.logging(f"Ошибка синтаксиса в строке {num}: {line}", level="ERROR")
+                    printer.logging("Ошибка синтаксиса в строке %s: %s", num, line, level="ERROR")
                     raise InvalidSyntaxError(line=line.split(), info=line.get_file_info())
 
         printer.logging("Построение AST завершено", level="INFO")
@@ -13,7 +13,7 @@ from src.util.build_tools.starter import Preprocessor
 def build(path: str):
     with open(path, "r", encoding="utf-8") as read_file:
         preprocessor = Preprocessor()
-        code = preprocessor.preprocess(read_file.read(), path)
+        code = preprocessor.preprocess(read_file, path)
 
         ast_builder = AbstractSyntaxTreeBuilder(code)
         ast: list[MetaObject] = ast_builder.build()
@@ -1,4 +1,4 @@
-from typing import Type, Union
+from typing import Type, Union, Optional
 
 from click import command
 
@@ -16,12 +16,13 @@ from src.core.extend.function_wrap import PyExtendWrapper
 from src.core.parse.base import MetaObject
 from src.core.parse.util.rpn import build_rpn_stack
 from src.core.tokens import Tokens, NOT_ALLOWED_TOKENS
-from src.core.types.atomic import Array, String, Table
+from src.core.types.atomic import Array, Table
 from src.core.types.basetype import BaseType
 from src.core.types.checkers import CheckerSituation
 from src.core.types.classes import Method, Constructor, ClassDefinition, ClassExceptionDefinition
 from src.core.types.conditions import Condition
 from src.core.types.criteria import Criteria
+from src.core.types.criteria_index import CriteriaIndex
 from src.core.types.dispositions import Disposition
 from src.core.types.docs import Docs
 from src.core.types.documents import FactSituation, Document
@@ -46,6 +47,8 @@ from src.core.types.procedure import (
     AssignOverrideVariable,
     When,
     While,
+    ForEach,
+    YieldValue,
     Context,
     ErrorThrow,
     Defer
@@ -55,27 +58,40 @@ from src.core.types.sanction_types import SanctionType
 from src.core.types.sanctions import Sanction
 from src.core.types.severitys import Severity
 from src.core.types.subjects import Subject
+from src.util.build_tools.parallel_compile import RPNJob, build_rpn_stacks, get_compile_workers
 from src.util.console_worker import printer
 
 
 class Compiled:
-    def __init__(self, compiled: dict[str, BaseType]):
+    # В .law файлах, собранных до появления индекса критериев, его нет: строится при первом обращении
+    _criteria_index: Optional[CriteriaIndex] = None
+
+    def __init__(self, compiled: dict[str, BaseType], criteria_index: Optional[CriteriaIndex] = None):
         self.compiled_code = compiled
+        self._criteria_index = criteria_index
+
+    @property
+    def criteria_index(self) -> CriteriaIndex:
+        if self._criteria_index is None:
+            self._criteria_index = CriteriaIndex.build(self.compiled_code)
+
+        return self._criteria_index
 
 
 class Compiler:
     def __init__(self, ast: list[MetaObject]):
         self.ast = ast
         self.compiled: dict[str, BaseType] = {}
+        self.rpn_jobs: Optional[list[RPNJob]] = None
         printer.logging("Инициализация Compiler", level="INFO")
 
     def get_obj_by_name(self, name: str) -> BaseType:
         for obj_name, obj in self.compiled.items():
             if name == obj.name:
-                printer.logging(f"Найден объект по имени: {name}", level="INFO")
+                printer.logging("Найден объект по имени: %s", name, level="INFO")
                 return obj
 
-        printer.logging(f"Объект с именем {name} не определен", level="ERROR")
+        printer.logging("Объект с именем %s не определен", name, level="ERROR")
         raise NameNotDefine(name=name)
 
     def __check_none_type(
@@ -84,7 +100,7 @@ class Compiler:
         compiled_obj = self.execute_compile(obj)
 
         if compiled_obj is None:
-            printer.logging(f"Поле {field_name} не определено для {object_name}", level="ERROR")
+            printer.logging("Поле %s не определено для %s", field_name, object_name, level="ERROR")
             raise FieldNotDefine(field_name, object_name)
 
         return compiled_obj
@@ -100,11 +116,11 @@ class Compiler:
         compiled_obj = self.get_obj_by_name(compiled_obj)
 
         if not isinstance(compiled_obj, type_check):
-            printer.logging(f"Ошибка типа: {compiled_obj.name} не является {type_check.__name__} для {field_name}",
+            printer.logging("Ошибка типа: %s не является %s для %s", compiled_obj.name, type_check.__name__, field_name,
                             level="ERROR")
             raise InvalidType(compiled_obj.name, field_name)
 
-        printer.logging(f"Поле {field_name} успешно обработано как {type_check.__name__}", level="INFO")
+        printer.logging("Поле %s успешно обработано как %s", field_name, type_check.__name__, level="INFO")
         return compiled_obj
 
     def process_object_field(
@@ -117,16 +133,16 @@ class Compiler:
         compiled_obj: BaseType = self.__check_none_type(obj, field_name, object_name)
 
         if not isinstance(compiled_obj, type_check):
-            printer.logging(f"Ошибка типа: {compiled_obj.name} не является {type_check.__name__} для {field_name}",
+            printer.logging("Ошибка типа: %s не является %s для %s", compiled_obj.name, type_check.__name__, field_name,
                             level="ERROR")
             raise InvalidType(compiled_obj.name, field_name)
 
-        printer.logging(f"Поле {field_name} успешно обработано как {type_check.__name__}", level="INFO")
+        printer.logging("Поле %s успешно обработано как %s", field_name, type_check.__name__, level="INFO")
         return compiled_obj
 
     def check_code_body(self, body: Body):
         for statement in body.commands:
-            if isinstance(statement, (Loop, While)):
+            if isinstance(statement, (Loop, While, ForEach)):
                 try:
                     self.check_code_body(statement.body)
                 except InvalidSyntaxError:
@@ -191,6 +207,8 @@ class Compiler:
         for offset, command in enumerate(compiled_obj.body.commands):
             compiled_obj.body.commands[offset] = self.execute_compile(command)
 
+        compiled_obj.generator = self.contains_yield(compiled_obj.body)
+
         uses_names = get_all_uses_names(compiled_obj)
         check_seq = set()
 
@@ -214,6 +232,29 @@ class Compiler:
 
         return compiled_obj
 
+    def contains_yield(self, body: Body) -> bool:
+        for cmd in body.commands:
+            if isinstance(cmd, YieldValue):
+                return True
+
+            if isinstance(cmd, CodeBlock):
+                if self.contains_yield(cmd.body):
+                    return True
+
+                if isinstance(cmd, Context) and any(self.contains_yield(handler.body) for handler in cmd.handlers):
+                    return True
+
+                if isinstance(cmd, When):
+                    if cmd.else_whens is not None and any(
+                            self.contains_yield(else_when.body) for else_when in cmd.else_whens
+                    ):
+                        return True
+
+                    if cmd.else_ is not None and self.contains_yield(cmd.else_.body):
+                        return True
+
+        return False
+
     def execute_compile(self, meta: Union[BaseType, MetaObject, Compiled]) -> Union[str, BaseType, Compiled]:
         if isinstance(meta, Compiled):
             return meta
@@ -223,7 +264,7 @@ class Compiler:
             return meta
 
         compiled_obj = meta.create_image().build()
-        printer.logging(f"Команда скомпилирована: {compiled_obj}", level="INFO")
+        printer.logging("Команда скомпилирована: %s", compiled_obj, level="INFO")
 
         if isinstance(compiled_obj, (SanctionType, Rule, Law, Obligation, Severity, Criteria)):
             return compiled_obj
@@ -321,7 +362,7 @@ class Compiler:
             if compiled_obj.parent is not None:
                 if compiled_obj.parent not in self.compiled:
                     printer.logging(
-                        f"Класс {compiled_obj.name} ссылается на несуществующий класс {compiled_obj.parent}",
+                        "Класс %s ссылается на несуществующий класс %s", compiled_obj.name, compiled_obj.parent,
                         level="ERROR"
                     )
                     raise NameNotDefine(
@@ -381,7 +422,7 @@ class Compiler:
                 Criteria
             )
             compiled_obj.fields["__критерии__"] = Table(
-                {String(k): v.value for k, v in compiled_obj.criteria.modify.items()}
+                {k: v.value for k, v in compiled_obj.criteria.modify.items()}
             )
 
         elif isinstance(compiled_obj, FactSituation):
@@ -418,13 +459,13 @@ class Compiler:
             compiled_obj.fields["__гипотеза__"] = compiled_obj.hypothesis # noqa
 
         else:
-            printer.logging(f"Невозможно скомпилировать: {compiled_obj}", level="ERROR")
+            printer.logging("Невозможно скомпилировать: %s", compiled_obj, level="ERROR")
             raise UnknownType(f"Невозможно скомпилировать {compiled_obj}")
 
         return compiled_obj
 
     def expr_compile(self, expr_: Expression, previous_statements: list[BaseType] = None):
-        printer.logging(f"Компиляция выражения в файле {expr_.meta_info.file}", level="INFO")
+        printer.logging("Компиляция выражения в файле %s", expr_.meta_info.file, level="INFO")
         raw = expr_.raw_operations
 
         is_str_flag = False
@@ -451,40 +492,52 @@ class Compiler:
                 continue
 
             command = self.compiled[op]
-            printer.logging(f"Обработка оператора '{op}' как команды типа {type(command).__name__}", level="DEBUG")
+            printer.logging("Обработка оператора '%s' как команды типа %s", op, type(command).__name__, level="DEBUG")
 
             if isinstance(command, (Procedure, PyExtendWrapper)):
                 if offset < len(raw) - 1:
                     if raw[offset + 1] != Tokens.left_bracket:
-                        printer.logging(f"Преобразование '{op}' в LinkedProcedure (без скобок)", level="DEBUG")
+                        printer.logging("Преобразование '%s' в LinkedProcedure (без скобок)", op, level="DEBUG")
                         raw[offset] = LinkedProcedure(name=command.name, func=command)
                     continue
 
-                printer.logging(f"Преобразование '{op}' в LinkedProcedure", level="DEBUG")
+                printer.logging("Преобразование '%s' в LinkedProcedure", op, level="DEBUG")
                 raw[offset] = LinkedProcedure(name=command.name, func=command)
 
         # Обработка предыдущих statements
         if previous_statements is not None:
             printer.logging("Проверка предыдущих statements для связывания процедур", level="DEBUG")
             for command in reversed(previous_statements):
-                if isinstance(command, AssignField) and len(command.expression.operations) == 1:
+                if (
+                        isinstance(command, AssignField)
+                        and command.expression.operations is not None
+                        and len(command.expression.operations) == 1
+                ):
                     for offset, op in enumerate(raw):
                         if op == command.name and isinstance(command.expression.operations[0], LinkedProcedure):
                             func: Procedure = command.expression.operations[0].func
-                            printer.logging(f"Связывание переменной '{op}' с процедурой '{func.name}'", level="DEBUG")
+                            printer.logging(
+                                "Связывание переменной '%s' с процедурой '%s'",
+                                op, func.name, level="DEBUG"
+                            )
                             continue
 
+        if self.rpn_jobs is not None:
+            # RPN стек будет построен пакетно, см. build_rpn_stacks
+            self.rpn_jobs.append(RPNJob(expr_, raw))
+            return
+
         # Построение RPN стека
         printer.logging("Построение RPN стека для выражения", level="DEBUG")
         expr_.operations = build_rpn_stack(raw, expr_.meta_info)
-        printer.logging(f"Выражение успешно скомпилировано. Операции: {expr_.operations}", level="INFO")
+        printer.logging("Выражение успешно скомпилировано. Операции: %s", expr_.operations, level="INFO")
 
     def body_compile(self, body: Body):
-        printer.logging(f"Компиляция тела кода (начало)", level="INFO")
+        printer.logging("Компиляция тела кода (начало)", level="INFO")
         statements = []
 
         for statement in body.commands:
-            printer.logging(f"Обработка statement типа {type(statement).__name__}", level="DEBUG")
+            printer.logging("Обработка statement типа %s", type(statement).__name__, level="DEBUG")
 
             if isinstance(statement, Expression):
                 printer.logging("Компиляция Expression", level="DEBUG")
@@ -494,6 +547,10 @@ class Compiler:
                 printer.logging("Компиляция While условия", level="DEBUG")
                 self.expr_compile(statement.expression, statements)
 
+            elif isinstance(statement, ForEach):
+                printer.logging("Компиляция ForEach выражения", level="DEBUG")
+                self.expr_compile(statement.expression, statements)
+
             elif isinstance(statement, Loop):
                 printer.logging("Компиляция Loop выражений (from/to)", level="DEBUG")
                 self.expr_compile(statement.expression_from, statements)
@@ -508,7 +565,7 @@ class Compiler:
                     )
 
                 for handler in statement.handlers:
-                    printer.logging(f"Компиляция Handler '{handler}'", level="DEBUG")
+                    printer.logging("Компиляция Handler '%s'", handler, level="DEBUG")
                     if handler.exception_class_name not in self.compiled:
                         raise NameNotDefine(
                             name=handler.exception_class_name,
@@ -556,6 +613,10 @@ class Compiler:
                 printer.logging("Компиляция Return выражения", level="DEBUG")
                 self.expr_compile(statement.expression, statements)
 
+            elif isinstance(statement, YieldValue):
+                printer.logging("Компиляция YieldValue выражения", level="DEBUG")
+                self.expr_compile(statement.expression, statements)
+
             elif isinstance(statement, Defer):
                 printer.logging("Компиляция Defer выражения", level="DEBUG")
                 self.expr_compile(statement.expression, statements)
@@ -569,9 +630,9 @@ class Compiler:
                 self.body_compile(statement.body)
 
             statements.append(statement)
-            printer.logging(f"Statement добавлен в контекст: {statement}", level="DEBUG")
+            printer.logging("Statement добавлен в контекст: %s", statement, level="DEBUG")
 
-        printer.logging(f"Компиляция тела кода завершена (всего statements: {len(statements)})", level="INFO")
+        printer.logging("Компиляция тела кода завершена (всего statements: %s)", len(statements), level="INFO")
 
     def compile_default_args(self, default_arguments: dict[str, Expression]):
         for expr in default_arguments.values():
@@ -586,6 +647,12 @@ class Compiler:
                     info=cmd.expression.meta_info
                 )
 
+            if isinstance(cmd, YieldValue):
+                raise InvalidSyntaxError(
+                    f"Конструктор класса '{class_definition_name}' не может содержать '{Tokens.yield_}'",
+                    info=cmd.expression.meta_info
+                )
+
             if isinstance(cmd, CodeBlock):
                 self.check_constructor_return(cmd.body, class_definition_name)
 
@@ -616,18 +683,23 @@ class Compiler:
                 compiled_modules = {**compiled_modules, **compiled.compiled_code}
                 continue
 
-            printer.logging(f"Команда компиляции №{idx + 1}", level="INFO")
+            printer.logging("Команда компиляции №%s", idx + 1, level="INFO")
 
             if compiled.name in self.compiled and not settings.force_overwrite_module:
-                printer.logging(f"Ошибка: {compiled.name} уже существует", level="ERROR")
+                printer.logging("Ошибка: %s уже существует", compiled.name, level="ERROR")
                 raise NameAlreadyExist(compiled.name, info=compiled.meta_info)
 
             self.compiled[compiled.name] = compiled
-            printer.logging(f"Скомпилировано: {compiled.name}", level="INFO")
+            printer.logging("Скомпилировано: %s", compiled.name, level="INFO")
 
         compiled_without_build_modules = self.compiled
         self.compiled = {**compiled_modules, **self.compiled}
 
+        workers = get_compile_workers()
+
+        if workers > 1:
+            self.rpn_jobs = []
+
         for compiled in compiled_without_build_modules.values():
             if isinstance(compiled, Procedure):
                 self.body_compile(compiled.body)
@@ -652,6 +724,13 @@ class Compiler:
                 if compiled.constructor.default_arguments is not None:
                     self.compile_default_args(compiled.constructor.default_arguments)
 
+        if self.rpn_jobs is not None:
+            build_rpn_stacks(self.rpn_jobs, workers)
+            self.rpn_jobs = None
+
+        # Проверки, которые читают operations, идут только после того, как построены все RPN стеки
+        for compiled in compiled_without_build_modules.values():
+            if isinstance(compiled, ClassDefinition):
                 self.check_constructor_return(compiled.constructor.body, compiled.name)
 
-        return Compiled(self.compiled)
+        return Compiled(self.compiled, CriteriaIndex.build(self.compiled))
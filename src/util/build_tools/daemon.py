@@ -0,0 +1,124 @@
+import json
+import os
+import signal
+import socket
+import sys
+from typing import Callable
+
+from rich.console import Console
+
+from config import settings
+from src.util.build_tools.daemon_client import STD_FDS
+from src.util.build_tools.preprocessing import Preprocessor
+from src.util.console_worker import printer
+
+_MAX_HEADER_SIZE = 1024 * 1024
+# Управляют самим сервером и не должны выполняться внутри запроса
+_SERVER_FLAGS = ("--serve", "--client")
+
+
+def is_daemon_supported() -> bool:
+    return hasattr(os, "fork") and hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+
+def _read_line(conn: socket.socket, fds: list[int]) -> bytes:
+    data = b""
+
+    while not data.endswith(b"\n"):
+        chunk, new_fds, _, _ = socket.recv_fds(conn, 65536, len(STD_FDS))
+        fds.extend(new_fds)
+
+        if not chunk:
+            break
+
+        data += chunk
+
+        if len(data) > _MAX_HEADER_SIZE:
+            raise ValueError("Слишком большой запрос к серверу")
+
+    return data
+
+
+def _preload():
+    """Загружает стандартную библиотеку заранее, чтобы дочерние процессы получали её готовой."""
+    Preprocessor().preprocess(f"ВКЛЮЧИТЬ {settings.std_name}.*", "")
+
+
+def _handle_request(conn: socket.socket, run_law: Callable[[], None]):
+    fds = []
+    request = json.loads(_read_line(conn, fds))
+
+    if len(fds) != len(STD_FDS):
+        raise ValueError("Клиент не передал стандартные потоки ввода-вывода")
+
+    for fd, std_fd in zip(fds, STD_FDS):
+        os.dup2(fd, std_fd)
+        os.close(fd)
+
+    argv = request["argv"]
+    server_flags = [arg for arg in argv[1:] if arg in _SERVER_FLAGS]
+
+    if server_flags:
+        print(f"Флаг {server_flags[0]} нельзя передать через сервер.", file=sys.stderr)
+        sys.stderr.flush()
+
+        return 1
+
+    os.chdir(request["cwd"])
+    sys.argv = argv
+    printer.console = Console()
+
+    code = 0
+
+    try:
+        run_law()
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            code = e.code
+        elif e.code is not None:
+            code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+    return code
+
+
+def serve(path: str, run_law: Callable[[], None]):
+    """
+    Держит интерпретатор прогретым и обслуживает запросы клиентов через Unix-сокет.
+    Каждый запрос выполняется в отдельном дочернем процессе, поэтому состояние запусков не пересекается.
+    """
+    if os.path.exists(path):
+        os.unlink(path)
+
+    _preload()
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(path)
+        server.listen()
+        printer.print_info(f"Сервер LawScript запущен: {path}")
+
+        try:
+            while True:
+                conn, _ = server.accept()
+
+                if os.fork() != 0:
+                    conn.close()
+                    continue
+
+                server.close()
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                code = 1
+
+                try:
+                    code = _handle_request(conn, run_law)
+                finally:
+                    try:
+                        conn.sendall(json.dumps({"code": code}).encode() + b"\n")
+                    finally:
+                        os._exit(code)
+        finally:
+            os.unlink(path)
+
@@ -0,0 +1,67 @@
+"""
+Тонкий клиент сервера LawScript.
+Модуль не импортирует ядро языка, а настройки - только если путь к сокету не задан явно,
+чтобы запуск клиента оставался быстрым.
+"""
+import json
+import os
+import socket
+import sys
+
+STD_FDS = (0, 1, 2)
+_SOCKET_PATH_KEY = "serve_socket_path"
+_ENV_FILE = "law_config.env"
+
+
+def get_socket_path() -> str:
+    """Ищет путь к сокету так же, как настройки: переменная окружения, затем law_config.env."""
+    for key, value in os.environ.items():
+        if key.lower() == _SOCKET_PATH_KEY:
+            return value
+
+    if os.path.isfile(_ENV_FILE):
+        with open(_ENV_FILE, "r", encoding="utf-8") as file:
+            for line in file:
+                key, sep, value = line.partition("=")
+
+                if sep and key.strip().lower() == _SOCKET_PATH_KEY:
+                    return value.strip()
+
+    from config import DEFAULT_SOCKET_PATH
+
+    return DEFAULT_SOCKET_PATH
+
+
+def run_client(path: str, argv: list[str]) -> int:
+    """Передаёт аргументы, рабочую директорию и стандартные потоки серверу и возвращает код завершения."""
+    request = json.dumps({"argv": argv, "cwd": os.getcwd()}).encode() + b"\n"
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(path)
+        socket.send_fds(conn, [request], list(STD_FDS))
+
+        response = b""
+
+        while not response.endswith(b"\n"):
+            chunk = conn.recv(4096)
+
+            if not chunk:
+                return 1
+
+            response += chunk
+
+    return json.loads(response)["code"]
+
+
+def main(argv: list[str]) -> int:
+    path = get_socket_path()
+
+    if not hasattr(socket, "send_fds"):
+        print("Режим клиента доступен только в системах с поддержкой Unix-сокетов.", file=sys.stderr)
+        return 1
+
+    try:
+        return run_client(path, [argv[0], *argv[2:]])
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"Сервер не запущен: '{path}'. Запустите его командой --serve.", file=sys.stderr)
+        return 1
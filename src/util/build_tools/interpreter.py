@@ -1,19 +1,81 @@
+from typing import Optional
+
 from src.core.executors.execute_block import ExecuteBlockExecutor
 from src.core.types.checkers import CheckerSituation
 from src.core.types.execute_block import ExecuteBlock
 from src.util.build_tools.compile import Compiled
 from src.core.executors.checker_execute import CheckerSituationExecutor
+from src.util.build_tools.parallel_checks import ParallelChecks, get_check_workers, is_parallel_checks_supported
+from src.util.report_writer import ReportWriter, open_report_writer
+from src.util.result_cache import close_result_cache
 
 
 class Interpreter:
     def __init__(self, compiled: Compiled):
         self.compiled = compiled
+        # Для каждой проверки: взят ли результат из кэша результатов (None - кэш не использовался)
+        self.result_cache_hits: list[Optional[bool]] = []
 
     def run(self):
+        checks = self.parallel_check_names()
+        workers = get_check_workers()
+
+        with open_report_writer() as writer:
+            if workers < 2 or len(checks) < 2 or not is_parallel_checks_supported():
+                self.run_sequential(writer)
+            else:
+                self.run_parallel(checks, workers, writer)
+
+            self.note_result_cache(writer)
+
+        close_result_cache()
+
+    def parallel_check_names(self) -> list[str]:
+        """
+        Проверки, которые можно выполнить заранее в дочерних процессах.
+        Блок ВЫПОЛНИТЬ может изменить факты, поэтому проверки после первого такого блока выполняются по порядку.
+        """
+        checks = []
+
+        for name, obj in self.compiled.compiled_code.items():
+            if isinstance(obj, ExecuteBlock):
+                break
+
+            if isinstance(obj, CheckerSituation):
+                checks.append(name)
+
+        return checks
+
+    def note_result_cache(self, writer: ReportWriter):
+        hits = self.result_cache_hits.count(True)
+        misses = self.result_cache_hits.count(False)
+
+        if hits or misses:
+            writer.note(f"Кэш результатов проверок: попаданий {hits}, вычислений {misses}")
+
+    def run_parallel(self, checks: list[str], workers: int, writer: ReportWriter):
+        with ParallelChecks(self.compiled, checks, workers) as parallel_checks:
+            for name, obj in self.compiled.compiled_code.items():
+                if isinstance(obj, CheckerSituation):
+                    executor = CheckerSituationExecutor(obj, self.compiled, writer)
+                    outcome = parallel_checks.outcome(name)
+
+                    if outcome is None:
+                        executor.execute()
+                    else:
+                        executor.report(outcome)
+
+                    self.result_cache_hits.append(executor.result_cache_hit)
+                elif isinstance(obj, ExecuteBlock):
+                    executor = ExecuteBlockExecutor(obj, self.compiled)
+                    executor.execute()
+
+    def run_sequential(self, writer: ReportWriter):
         for name, obj in self.compiled.compiled_code.items():
             if isinstance(obj, CheckerSituation):
-                executor = CheckerSituationExecutor(obj, self.compiled)
+                executor = CheckerSituationExecutor(obj, self.compiled, writer)
                 executor.execute()
+                self.result_cache_hits.append(executor.result_cache_hit)
             elif isinstance(obj, ExecuteBlock):
                 executor = ExecuteBlockExecutor(obj, self.compiled)
                 executor.execute()
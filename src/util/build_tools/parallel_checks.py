@@ -0,0 +1,74 @@
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+
+from config import settings
+from src.core.executors.checker_execute import CheckOutcome, CheckerSituationExecutor
+from src.util.build_tools.compile import Compiled
+from src.util.console_worker import printer
+
+# Программа, которую дочерние процессы получают при fork
+_compiled: Optional[Compiled] = None
+
+
+def get_check_workers() -> int:
+    if settings.check_workers == 0:
+        return os.cpu_count() or 1
+
+    return settings.check_workers
+
+
+def is_parallel_checks_supported() -> bool:
+    # Без fork пришлось бы передавать всю программу в каждый процесс
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _run_check(name: str) -> Optional[CheckOutcome]:
+    try:
+        return CheckerSituationExecutor(_compiled.compiled_code[name], _compiled).check()
+    except (Exception, SystemExit):
+        # Ошибку воспроизводит родительский процесс, чтобы она была идентична последовательному запуску
+        return None
+
+
+class ParallelChecks:
+    """
+    Запускает проверки в пуле процессов заранее, а результаты отдаёт по имени проверки.
+    Процессы создаются до выполнения блоков ВЫПОЛНИТЬ, поэтому сюда передаются только проверки,
+    которые стоят в программе раньше первого такого блока.
+    """
+    def __init__(self, compiled: Compiled, names: list[str], workers: int):
+        global _compiled
+
+        _compiled = compiled
+        workers = min(workers, len(names))
+
+        printer.logging("Параллельный запуск %s проверок, процессов: %s", len(names), workers, level="INFO")
+
+        self._pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+        self._futures: dict[str, Future] = {name: self._pool.submit(_run_check, name) for name in names}
+
+    def outcome(self, name: str) -> Optional[CheckOutcome]:
+        """Результат проверки или None, если её нужно выполнить в текущем процессе."""
+        future = self._futures.get(name)
+
+        if future is None:
+            return None
+
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def close(self):
+        global _compiled
+
+        self._pool.shutdown(cancel_futures=True)
+        _compiled = None
+
+    def __enter__(self) -> "ParallelChecks":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
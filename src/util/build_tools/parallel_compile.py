@@ -0,0 +1,98 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Union
+
+from config import settings
+from src.core.exceptions import BaseError
+from src.core.parse.util.rpn import build_rpn_stack, AttrAccess
+from src.core.types.basetype import BaseAtomicType
+from src.core.types.line import Info
+from src.core.types.operation import Operator
+from src.core.types.procedure import Expression, LinkedProcedure
+from src.util.console_worker import printer
+
+# Меньше этого числа выражений на процесс накладные расходы пула съедают выигрыш
+_MIN_JOBS_PER_WORKER = 64
+
+
+class _ProcedureRef(NamedTuple):
+    """Лёгкая замена процедуры для передачи выражения в другой процесс."""
+    name: str
+    index: int
+
+
+class RPNJob(NamedTuple):
+    expression: Expression
+    raw: list
+
+
+def get_compile_workers() -> int:
+    if settings.compile_workers == 0:
+        return os.cpu_count() or 1
+
+    return settings.compile_workers
+
+
+def _detach(raw: list, linked: list[LinkedProcedure]) -> list:
+    detached = []
+
+    for op in raw:
+        if isinstance(op, LinkedProcedure):
+            detached.append(LinkedProcedure(name=op.name, func=_ProcedureRef(op.func.name, len(linked)))) # noqa
+            linked.append(op)
+            continue
+
+        detached.append(op)
+
+    return detached
+
+
+def _attach(ops: list, linked: list[LinkedProcedure]) -> list:
+    for offset, op in enumerate(ops):
+        if isinstance(op, LinkedProcedure) and isinstance(op.func, _ProcedureRef):
+            ops[offset] = linked[op.func.index]
+
+        elif isinstance(op, AttrAccess):
+            _attach(op.expr, linked)
+
+    return ops
+
+
+def _build_rpn_job(job: tuple[list, Info]) -> tuple[Union[list[Union[Operator, BaseAtomicType]], None], list]:
+    raw, meta_info = job
+
+    try:
+        return build_rpn_stack(raw, meta_info), raw
+    except BaseError:
+        # Саму ошибку воспроизводит родительский процесс, чтобы она была идентична последовательной сборке
+        return None, raw
+
+
+def build_rpn_stacks(jobs: list[RPNJob], workers: int):
+    """
+    Строит RPN-стеки выражений в пуле процессов.
+    Результаты применяются в порядке исходного кода, первая ошибка поднимается так же, как при обычной сборке.
+    """
+    if workers < 2 or len(jobs) < _MIN_JOBS_PER_WORKER * 2:
+        for job in jobs:
+            job.expression.operations = build_rpn_stack(job.raw, job.expression.meta_info)
+
+        return
+
+    workers = min(workers, len(jobs) // _MIN_JOBS_PER_WORKER)
+    linked: list[LinkedProcedure] = []
+    payload = [(_detach(job.raw, linked), job.expression.meta_info) for job in jobs]
+    chunksize = max(1, len(payload) // (workers * 4))
+
+    printer.logging("Параллельная сборка %s выражений, процессов: %s", len(jobs), workers, level="INFO")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_build_rpn_job, payload, chunksize=chunksize))
+
+    for job, (operations, raw) in zip(jobs, results):
+        if operations is None:
+            job.expression.operations = build_rpn_stack(job.raw, job.expression.meta_info)
+            continue
+
+        job.raw[:] = _attach(raw, linked)
+        job.expression.operations = _attach(operations, linked)
@@ -1,6 +1,8 @@
 import os
 import re
-from typing import Optional, Union
+from collections.abc import Iterable, Iterator
+from threading import Lock
+from typing import Optional, Union, Callable, Any
 
 from pathlib import Path
 import dill
@@ -28,12 +30,59 @@ def _is_std(path: str) -> bool:
     return STD_NAME in path
 
 
+class ModuleCache:
+    """
+    Общий для процесса кэш загруженных модулей.
+    Ключ - реальный путь, время изменения и размер файла, поэтому изменённый файл перечитывается.
+    """
+    def __init__(self):
+        self._entries: dict[tuple[str, str], tuple[tuple[int, int], Any]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: str, path: str, loader: Callable[[str], Any]) -> Any:
+        if not settings.module_cache:
+            return loader(path)
+
+        stat = os.stat(path)
+        key = (os.path.realpath(path), kind)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] == version:
+                self.hits += 1
+                return entry[1]
+
+        value = loader(path)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (version, value)
+
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+module_cache = ModuleCache()
+
+
+def _load_compiled(path: str) -> Compiled:
+    with open(path, "rb") as file:
+        return dill.load(file)
+
+
 def import_preprocess(path, byte_mode: Optional[bool] = True) -> Union[Compiled, str]:
     try:
         if byte_mode:
-            with open(path, "rb") as file:
-                compiled = dill.load(file)
-                return compiled
+            return module_cache.get("compiled", path, _load_compiled)
 
         with open(path, "r", encoding="utf-8") as file:
             raw_code = file.read()
@@ -45,18 +94,48 @@ def import_preprocess(path, byte_mode: Optional[bool] = True) -> Union[Compiled,
         raise e
 
 
+def iter_raw_lines(raw_code: Union[str, Iterable[str]]) -> Iterator[str]:
+    """Построчно отдаёт исходный код без копирования всего текста в список."""
+    if not isinstance(raw_code, str):
+        yield from raw_code
+        return
+
+    start = 0
+
+    while True:
+        end = raw_code.find("\n", start)
+
+        if end == -1:
+            yield raw_code[start:]
+            return
+
+        yield raw_code[start:end]
+        start = end + 1
+
+
 class Preprocessor:
     def __init__(self):
         self.imports = set()
 
-    def preprocess(self, raw_code, path: str) -> list:
-        folder = os.path.dirname(path)
-
-        raw_prepared_code = [line.strip() for line in raw_code.split("\n")]
-        prepared_code = []
-        code = []
-
-        for line in raw_prepared_code:
+    def preprocess(self, raw_code: Union[str, Iterable[str]], path: str) -> list:
+        """
+        Собирает результат потокового препроцессинга в список.
+        Парсеры обращаются к строкам по номеру, поэтому список строится один раз, в самом конце.
+        """
+        return list(self.stream(raw_code, path))
+
+    def stream(self, raw_code: Union[str, Iterable[str]], path: str) -> Iterator[Union[Line, Compiled]]:
+        lines = self._strip_comments(iter_raw_lines(raw_code))
+        lines = self._split_expressions(lines, path)
+
+        for line in self._expand_includes(lines, path):
+            if line:
+                yield line
+
+    @staticmethod
+    def _strip_comments(raw_lines: Iterable[str]) -> Iterator[str]:
+        for line in raw_lines:
+            line = line.strip()
             is_string = False
             clean_line = ""
 
@@ -74,11 +153,13 @@ class Preprocessor:
 
                 if symbol == Tokens.comment:
                     clean_line = clean_line[:-1]
-                    prepared_code.append(clean_line)
+                    yield clean_line
                     break
             else:
-                prepared_code.append(clean_line)
+                yield clean_line
 
+    @staticmethod
+    def _split_expressions(prepared_code: Iterable[str], path: str) -> Iterator[Line]:
         for offset, line in enumerate(prepared_code):
             if not line:
                 continue
@@ -127,15 +208,56 @@ class Preprocessor:
 
                         line_ = Line(expr.strip() + end, num=offset+1, file=path)
                         line_.raw_line = line
-                        code.append(line_)
+                        yield line_
 
                     continue
 
-            code.append(Line(line.strip(), num=offset+1, file=path))
+            yield Line(line.strip(), num=offset+1, file=path)
+
+    def _tokenize_file(self, path: str) -> list[Line]:
+        with open(path, "r", encoding="utf-8") as file:
+            return list(self._split_expressions(self._strip_comments(file), path))
+
+    def _stream_file(self, path: str) -> Iterator[Union[Line, Compiled]]:
+        # Включения раскрываются заново для каждого препроцессора, кэшируются только строки самого файла
+        lines = module_cache.get("lines", path, self._tokenize_file)
 
-        preprocessed = []
+        for line in self._expand_includes(lines, path):
+            if line:
+                yield line
 
-        for offset, line in enumerate(code):
+    def _include_module(self, path: str, line: Line) -> Iterator[Union[Line, Compiled]]:
+        law_path = (f"{path}.{settings.compiled_postfix}", True)
+        pyl_path = (f"{path}.{settings.py_extend_postfix}", True)
+        raw_path = (f"{path}.{settings.raw_postfix}", False)
+
+        for path_data in [law_path, pyl_path, raw_path]:
+            path_, byte_mode = path_data
+
+            try:
+                if not byte_mode:
+                    if not os.path.isfile(path_):
+                        raise FileNotFoundError
+
+                    yield from self._stream_file(path_)
+                else:
+                    yield import_preprocess(path_, byte_mode=byte_mode)
+            except FileNotFoundError:
+                continue
+            except RecursionError:
+                kill_process(
+                    f"Обнаружен циклический импорт '{path}', {line}"
+                )
+            else:
+                break
+
+        else:
+            kill_process(f"Невозможно включить модуль. Модуль '{path}' не найден.")
+
+    def _expand_includes(self, code: Iterable[Line], path: str) -> Iterator[Union[Line, Compiled]]:
+        folder = os.path.dirname(path)
+
+        for line in code:
             match line.split(" "):
                 case [Tokens.include, package] if package.endswith(Tokens.star):
                     is_std_path = _is_std(package)
@@ -169,17 +291,15 @@ class Preprocessor:
 
                             if filename.endswith(f".{settings.compiled_postfix}"):  # Проверка на нужное расширение
                                 file_path = os.path.join(dir_path, filename)
-                                preprocessed.append(import_preprocess(file_path))
+                                yield import_preprocess(file_path)
                                 checked_files.append(file_without_ext)
                             elif filename.endswith(f".{settings.py_extend_postfix}"):  # Проверка на нужное расширение
                                 file_path = os.path.join(dir_path, filename)
-                                preprocessed.append(import_preprocess(file_path))
+                                yield import_preprocess(file_path)
                                 checked_files.append(file_without_ext)
                             elif filename.endswith(f".{settings.raw_postfix}"):  # Проверка на нужное расширение
                                 file_path = os.path.join(dir_path, filename)
-                                preprocessed.extend(self.preprocess(
-                                    import_preprocess(file_path, byte_mode=False), file_path)
-                                )
+                                yield from self._stream_file(file_path)
                                 checked_files.append(file_without_ext)
 
                     except RecursionError:
@@ -202,31 +322,7 @@ class Preprocessor:
                     if not is_std_path:
                         path = os.path.join(os.getcwd(), f"{folder}/{module}")
 
-                    law_path = (f"{path}.{settings.compiled_postfix}", True)
-                    pyl_path = (f"{path}.{settings.py_extend_postfix}", True)
-                    raw_path = (f"{path}.{settings.raw_postfix}", False)
-
-                    for path_data in [law_path, pyl_path, raw_path]:
-                        path_, byte_mode = path_data
-
-                        try:
-                            if not byte_mode:
-                                preprocessed.extend(
-                                    self.preprocess(import_preprocess(path_, byte_mode=byte_mode), path_)
-                                )
-                            else:
-                                preprocessed.append(import_preprocess(path_, byte_mode=byte_mode))
-                        except FileNotFoundError:
-                            continue
-                        except RecursionError:
-                            kill_process(
-                                f"Обнаружен циклический импорт '{path}', {line}"
-                            )
-                        else:
-                            break
-
-                    else:
-                        kill_process(f"Невозможно включить модуль. Модуль '{path}' не найден.")
+                    yield from self._include_module(path, line)
 
                 case [Tokens.include, module]:
                     if module in self.imports:
@@ -237,35 +333,9 @@ class Preprocessor:
                     module = module.replace(Tokens.dot, "/")
                     path = os.path.join(os.getcwd(), f"{folder}/{module}")
 
-                    law_path = (f"{path}.{settings.compiled_postfix}", True)
-                    pyl_path = (f"{path}.{settings.py_extend_postfix}", True)
-                    raw_path = (f"{path}.{settings.raw_postfix}", False)
-
-                    for path_data in [law_path, pyl_path, raw_path]:
-                        path_, byte_mode = path_data
-
-                        try:
-                            if not byte_mode:
-                                preprocessed.extend(
-                                    self.preprocess(import_preprocess(path_, byte_mode=byte_mode), path_)
-                                )
-                            else:
-                                preprocessed.append(import_preprocess(path_, byte_mode=byte_mode))
-                        except FileNotFoundError:
-                            continue
-                        except RecursionError:
-                            kill_process(
-                                f"Обнаружен циклический импорт '{path}', {line}"
-                            )
-                        else:
-                            break
-
-                    else:
-                        kill_process(f"Невозможно включить модуль. Модуль '{path}' не найден.")
+                    yield from self._include_module(path, line)
 
                 case _:
-                    preprocessed.append(line)
+                    yield line
 
                     self.imports.add(path)
-
-        return [line for line in preprocessed if line]
@@ -1,12 +1,24 @@
+from collections.abc import Iterable, Iterator
+from typing import Union, Optional
+
 import dill
 
 from config import settings
+from src.core.exceptions import NameNotDefine
+from src.core.executors.batch_checker import BatchChecker, BatchRecordResult
 from src.core.parse.base import MetaObject
+from src.core.types.conditions import procedure_criteria_cache
+from src.core.types.documents import Document
 from src.core.util import kill_process
 from src.util.build_tools.ast import AbstractSyntaxTreeBuilder
 from src.util.build_tools.compile import Compiler, Compiled
 from src.util.build_tools.interpreter import Interpreter
 from src.util.build_tools.preprocessing import Preprocessor
+from src.util.console_worker import printer
+from src.util.fact_sources import read_facts
+from src.util.fact_store import FactStore, convert_csv_to_store, is_fact_store
+from src.util.report_writer import ReportRow, create_report_writer, report_format_by_path
+from src.util.result_cache import close_result_cache, get_result_cache
 
 
 def compile_string(raw_code: str) -> Compiled:
@@ -25,7 +37,7 @@ def run_compiled_code(compiled: Compiled):
     interpreter.run()
 
 
-def run(raw_code: str, path: str):
+def run(raw_code: Union[str, Iterable[str]], path: str):
     preprocessor = Preprocessor()
     code = preprocessor.preprocess(raw_code, path)
 
@@ -52,8 +64,92 @@ def run_file(path: str):
                 run_compiled_code(compiled)
         elif path.endswith(f'.{settings.raw_postfix}'):
             with open(path, "r", encoding="utf-8") as file:
-                run(file.read(), path)
+                run(file, path)
         else:
             raise FileNotFoundError
     except FileNotFoundError:
         kill_process(f"Файл '{path}' не найден.")
+
+
+def load_compiled(path: str) -> Compiled:
+    """Загружает собранный модуль или собирает исходный файл, не выполняя его."""
+    try:
+        if path.endswith((f'.{settings.compiled_postfix}', f'.{settings.py_extend_postfix}')):
+            with open(path, "rb") as file:
+                return dill.load(file)
+
+        if path.endswith(f'.{settings.raw_postfix}'):
+            with open(path, "r", encoding="utf-8") as file:
+                code = Preprocessor().preprocess(file, path)
+
+            ast: list[MetaObject] = AbstractSyntaxTreeBuilder(code).build()
+            return Compiler(ast).compile()
+
+        raise FileNotFoundError
+    except FileNotFoundError:
+        kill_process(f"Файл '{path}' не найден.")
+
+
+def _check_facts(checker: BatchChecker, facts_path: str) -> Iterator[BatchRecordResult]:
+    if not is_fact_store(facts_path):
+        yield from checker.check(read_facts(facts_path))
+        return
+
+    with FactStore(facts_path) as store:
+        yield from checker.check_store(store)
+
+
+def run_batch_check(path: str, document_name: str, facts_path: str, output_path: Optional[str] = None):
+    compiled = load_compiled(path)
+    document = compiled.compiled_code.get(document_name)
+
+    if not isinstance(document, Document):
+        raise NameNotDefine(f"Документ '{document_name}' не найден в '{path}'")
+
+    if output_path is None:
+        # Отчёт пишется в stdout, остальной вывод не должен в него попасть
+        printer.use_stderr()
+
+    checker = BatchChecker(document, compiled)
+    modify_names = {name: repr(modify) for name, modify in checker.condition.criteria.modify.items()}
+    hits, misses = procedure_criteria_cache.stats()
+    total = passed = 0
+
+    with create_report_writer(report_format_by_path(output_path), output_path) as writer:
+        for record_result in _check_facts(checker, facts_path):
+            total += 1
+            passed += record_result.passed
+            resolved_modify = record_result.modify or {}
+
+            for name, result in record_result.criteria.items():
+                writer.write(ReportRow(
+                    check=record_result.index,
+                    criteria=name,
+                    fact_value=record_result.facts[name],
+                    modify=repr(resolved_modify[name]) if name in resolved_modify else modify_names[name],
+                    result=result,
+                ))
+
+            writer.summary(record_result.index, record_result.passed)
+
+        writer.note(
+            f"Проверка документа '{document_name}': записей {total}, выполнено {passed}, нарушено {total - passed}"
+        )
+
+        new_hits, new_misses = procedure_criteria_cache.stats()
+
+        if new_hits + new_misses > hits + misses:
+            writer.note(f"Кэш чистых процедур: попаданий {new_hits - hits}, вычислений {new_misses - misses}")
+
+        result_cache = get_result_cache()
+
+        if result_cache is not None:
+            cache_hits, cache_misses = result_cache.stats()
+            writer.note(f"Кэш результатов проверок: попаданий {cache_hits}, вычислений {cache_misses}")
+
+    close_result_cache()
+
+
+def run_convert_facts(csv_path: str, store_path: str):
+    size = convert_csv_to_store(csv_path, store_path)
+    printer.print_info(f"Записей сохранено в хранилище фактов '{store_path}': {size}")
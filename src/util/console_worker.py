@@ -8,11 +8,25 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from config import settings
 
+LOG_LEVELS = {
+    "TRACE": 0,
+    "DEBUG": 10,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+}
+
 
 class Printer:
     def __init__(self):
         self.console = Console()
         self.__debug = settings.debug
+        self.__log_level = LOG_LEVELS[settings.log_level]
+
+    def use_stderr(self):
+        """Служебные сообщения идут в stderr, когда stdout занят данными, например отчётом --check."""
+        self.console = Console(stderr=True)
 
     @property
     def debug(self) -> bool:
@@ -69,21 +83,36 @@ class Printer:
     def raw_print(*args, sep=' ', end='\n', file=None):
         print(*args, sep=sep, end=end, file=file)
 
-    def logging(self, message: str, level: str = "INFO"):
-        if self.debug:
-            timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            log_message = Text(f"[{timestamp}] [{level}] {message}")
-
-            if level == "ERROR":
-                log_message.stylize("bold red")
-            elif level == "WARNING":
-                log_message.stylize("bold magenta")
-            elif level == "SUCCESS":
-                log_message.stylize("bold green")
-            elif level == "INFO":
-                log_message.stylize("bold blue")
-
-            self.console.print(log_message)
+    def is_logging_enabled(self, level: str = "INFO") -> bool:
+        return self.__debug and LOG_LEVELS.get(level, LOG_LEVELS["INFO"]) >= self.__log_level
+
+    def logging(self, message: str, *args, level: str = "INFO"):
+        """
+        Аргументы подставляются в message через '%' только если сообщение будет выведено,
+        поэтому вызов с выключенной отладкой не строит строк.
+        """
+        if not self.__debug:
+            return
+
+        if LOG_LEVELS.get(level, LOG_LEVELS["INFO"]) < self.__log_level:
+            return
+
+        if args:
+            message = message % args
+
+        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        log_message = Text(f"[{timestamp}] [{level}] {message}")
+
+        if level == "ERROR":
+            log_message.stylize("bold red")
+        elif level == "WARNING":
+            log_message.stylize("bold magenta")
+        elif level == "SUCCESS":
+            log_message.stylize("bold green")
+        elif level == "INFO":
+            log_message.stylize("bold blue")
+
+        self.console.print(log_message)
 
     @staticmethod
     def create_red_text(message: str) -> Text:
@@ -0,0 +1,82 @@
+import csv
+import json
+import os
+from typing import Iterator, Union
+
+from src.core.exceptions import ErrorValue, FileError
+from src.core.parse.base import is_integer, is_float
+from src.core.types.atomic import Number, String, convert_py_type_to_atomic_type
+from src.core.types.basetype import BaseAtomicType
+
+JSONL_POSTFIXES = (".jsonl", ".ndjson")
+CSV_POSTFIXES = (".csv",)
+
+
+def parse_csv_raw(value: str) -> Union[int, float, str]:
+    # Так же, как значения в блоке ДАННЫЕ фактической ситуации
+    if is_integer(value):
+        return int(value)
+
+    if is_float(value):
+        return float(value)
+
+    return value
+
+
+def _parse_csv_value(value: str) -> BaseAtomicType:
+    value = parse_csv_raw(value)
+
+    if isinstance(value, str):
+        return String(value)
+
+    return Number(value)
+
+
+def read_jsonl_facts(path: str) -> Iterator[dict[str, BaseAtomicType]]:
+    with open(path, "r", encoding="utf-8") as file:
+        for num, line in enumerate(file, 1):
+            line = line.strip()
+
+            if not line:
+                continue
+
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ErrorValue(f"Некорректная запись в '{path}', строка {num}: {e}")
+
+            if not isinstance(record, dict):
+                raise ErrorValue(f"Запись в '{path}', строка {num} должна быть объектом")
+
+            yield {
+                str(name): convert_py_type_to_atomic_type(value)
+                for name, value in record.items()
+                if value is not None
+            }
+
+
+def read_csv_facts(path: str) -> Iterator[dict[str, BaseAtomicType]]:
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        for record in csv.DictReader(file):
+            yield {
+                name: _parse_csv_value(value.strip())
+                for name, value in record.items()
+                if name is not None and value is not None and value.strip()
+            }
+
+
+def read_facts(path: str) -> Iterator[dict[str, BaseAtomicType]]:
+    """Построчно читает записи фактических данных из JSONL или CSV файла."""
+    if not os.path.isfile(path):
+        raise FileError(path)
+
+    if path.endswith(JSONL_POSTFIXES):
+        return read_jsonl_facts(path)
+
+    if path.endswith(CSV_POSTFIXES):
+        return read_csv_facts(path)
+
+    raise ErrorValue(
+        f"Неизвестный формат файла с фактами: '{path}'. "
+        f"Поддерживаются: {', '.join(JSONL_POSTFIXES + CSV_POSTFIXES)}"
+    )
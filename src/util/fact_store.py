@@ -0,0 +1,383 @@
+import csv
+import json
+import mmap
+import os
+import sys
+from array import array
+from typing import Any, Iterator, Optional, Union
+
+from src.core.exceptions import ErrorValue, FileError
+from src.core.types.atomic import Number, String
+from src.core.types.basetype import BaseAtomicType
+from src.core.types.fact_columns import FactColumns, MAX_EXACT_FLOAT_INT, MISSING
+from src.util.fact_sources import parse_csv_raw
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MANIFEST_NAME = "manifest.json"
+_STORE_VERSION = 1
+# Сколько записей копится в памяти перед записью в файлы колонок
+_WRITE_CHUNK = 65_536
+_MIN_INT64, _MAX_INT64 = -2 ** 63, 2 ** 63 - 1
+
+# Метки значений: есть ли значение в записи и каким типом его вернуть
+TAG_MISSING, TAG_INT, TAG_FLOAT, TAG_TEXT = 0, 1, 2, 3
+
+KIND_INT, KIND_FLOAT, KIND_TEXT = "int", "float", "text"
+_ARRAY_TYPECODES = {KIND_INT: "q", KIND_FLOAT: "d"}
+
+
+def is_fact_store(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, MANIFEST_NAME))
+
+
+def _value_tag(value: Union[int, float, str]) -> int:
+    if isinstance(value, int):
+        return TAG_INT
+
+    if isinstance(value, float):
+        return TAG_FLOAT
+
+    return TAG_TEXT
+
+
+def _join_kind(kind: Optional[str], value: Union[int, float, str], largest_int: int = 0) -> str:
+    """
+    Тип колонки, в которой поместятся уже виденные значения и новое.
+    largest_int - наибольший модуль целых, уже виденных в колонке.
+    """
+    if kind == KIND_TEXT or isinstance(value, str):
+        return KIND_TEXT
+
+    if isinstance(value, int):
+        if kind == KIND_FLOAT:
+            return KIND_FLOAT if abs(value) <= MAX_EXACT_FLOAT_INT else KIND_TEXT
+
+        return KIND_INT if _MIN_INT64 <= value <= _MAX_INT64 else KIND_TEXT
+
+    if kind is None or kind == KIND_FLOAT:
+        return KIND_FLOAT
+
+    # Целая колонка становится дробной, если все её целые точно хранятся во float64
+    return KIND_FLOAT if largest_int <= MAX_EXACT_FLOAT_INT else KIND_TEXT
+
+
+class _ColumnWriter:
+    def __init__(self, path: str, index: int, kind: str):
+        self.kind = kind
+        self.tags_name = f"{index}.tags"
+        self.values_name = f"{index}.values"
+        self.offsets_name = f"{index}.offsets" if kind == KIND_TEXT else None
+
+        self._tags_file = open(os.path.join(path, self.tags_name), "wb")
+        self._values_file = open(os.path.join(path, self.values_name), "wb")
+        self._offsets_file = None
+        self._tags = array("B")
+
+        if kind == KIND_TEXT:
+            self._offsets_file = open(os.path.join(path, self.offsets_name), "wb")
+            self._values = bytearray()
+            self._offsets = array("q", [0])
+            self._text_size = 0
+        else:
+            self._values = array(_ARRAY_TYPECODES[kind])
+
+    def append(self, value: Any):
+        if value is MISSING:
+            self._tags.append(TAG_MISSING)
+
+            if self.kind == KIND_TEXT:
+                self._offsets.append(self._text_size)
+            else:
+                self._values.append(0)
+
+            return
+
+        self._tags.append(_value_tag(value))
+
+        if self.kind == KIND_TEXT:
+            encoded = str(value).encode("utf-8")
+            self._values += encoded
+            self._text_size += len(encoded)
+            self._offsets.append(self._text_size)
+        else:
+            self._values.append(value)
+
+    def flush(self):
+        self._tags.tofile(self._tags_file)
+        self._tags = array("B")
+
+        if self.kind == KIND_TEXT:
+            self._values_file.write(self._values)
+            self._values = bytearray()
+            self._offsets.tofile(self._offsets_file)
+            self._offsets = array("q")
+        else:
+            self._values.tofile(self._values_file)
+            self._values = array(self._values.typecode)
+
+    def close(self):
+        self.flush()
+
+        for file in (self._tags_file, self._values_file, self._offsets_file):
+            if file is not None:
+                file.close()
+
+    def manifest(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "tags": self.tags_name,
+            "values": self.values_name,
+            "offsets": self.offsets_name,
+        }
+
+
+def _iter_csv_rows(csv_path: str) -> Iterator[dict[str, Union[int, float, str]]]:
+    with open(csv_path, "r", encoding="utf-8", newline="") as file:
+        for record in csv.DictReader(file):
+            yield {
+                name: parse_csv_raw(value.strip())
+                for name, value in record.items()
+                if name is not None and value is not None and value.strip()
+            }
+
+
+def convert_csv_to_store(csv_path: str, store_path: str) -> int:
+    """
+    Переводит CSV с фактическими данными в колоночное хранилище для --check.
+    Файл читается дважды: сначала определяются типы колонок, затем пишутся сами колонки.
+    Возвращает количество записей.
+    """
+    if not os.path.isfile(csv_path):
+        raise FileError(csv_path)
+
+    kinds: dict[str, Optional[str]] = {}
+    largest_ints: dict[str, int] = {}
+    size = 0
+
+    for row in _iter_csv_rows(csv_path):
+        for name, value in row.items():
+            kinds[name] = _join_kind(kinds.get(name), value, largest_ints.get(name, 0))
+
+            if isinstance(value, int):
+                largest_ints[name] = max(largest_ints.get(name, 0), abs(value))
+
+        size += 1
+
+    os.makedirs(store_path, exist_ok=True)
+    writers = {name: _ColumnWriter(store_path, index, kind) for index, (name, kind) in enumerate(kinds.items())}
+
+    try:
+        for num, row in enumerate(_iter_csv_rows(csv_path), 1):
+            for name, writer in writers.items():
+                writer.append(row.get(name, MISSING))
+
+            if num % _WRITE_CHUNK == 0:
+                for writer in writers.values():
+                    writer.flush()
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    manifest = {
+        "version": _STORE_VERSION,
+        "byteorder": sys.byteorder,
+        "size": size,
+        "columns": {name: writer.manifest() for name, writer in writers.items()},
+    }
+
+    # Манифест пишется последним: без него незаконченное хранилище не откроется
+    with open(os.path.join(store_path, MANIFEST_NAME), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+
+    return size
+
+
+def _map_file(path: str) -> Optional[mmap.mmap]:
+    with open(path, "rb") as file:
+        # Пустой файл отобразить в память нельзя
+        if os.fstat(file.fileno()).st_size == 0:
+            return None
+
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class _MappedColumn:
+    def __init__(self, path: str, description: dict[str, Any]):
+        self.kind = description["kind"]
+        self._maps: list[mmap.mmap] = []
+        self._views: list[memoryview] = []
+        self._numpy: Optional[tuple["np.ndarray", "np.ndarray"]] = None
+        self.tags = self._view(os.path.join(path, description["tags"]), "B")
+        self.values = self._view(os.path.join(path, description["values"]), _ARRAY_TYPECODES.get(self.kind, "B"))
+        self.offsets = None
+
+        if self.kind == KIND_TEXT:
+            self.offsets = self._view(os.path.join(path, description["offsets"]), "q")
+
+    def _view(self, path: str, typecode: str) -> memoryview:
+        mapped = _map_file(path)
+
+        if mapped is None:
+            return memoryview(array(typecode))
+
+        base = memoryview(mapped)
+        view = base.cast(typecode)
+        self._maps.append(mapped)
+        self._views += [view, base]
+
+        return view
+
+    def raw(self, start: int, stop: int) -> list[Any]:
+        tags = self.tags[start:stop]
+
+        if self.kind != KIND_TEXT:
+            values = self.values[start:stop].tolist()
+
+            return [
+                MISSING if tag == TAG_MISSING else int(value) if tag == TAG_INT else value
+                for tag, value in zip(tags, values)
+            ]
+
+        offsets = self.offsets[start:stop + 1].tolist()
+        text = self.values[offsets[0]:offsets[-1]].tobytes()
+        base = offsets[0]
+        result = []
+
+        for index, tag in enumerate(tags):
+            if tag == TAG_MISSING:
+                result.append(MISSING)
+                continue
+
+            value = text[offsets[index] - base:offsets[index + 1] - base].decode("utf-8")
+
+            if tag == TAG_INT:
+                result.append(int(value))
+            elif tag == TAG_FLOAT:
+                result.append(float(value))
+            else:
+                result.append(value)
+
+        return result
+
+    def numeric(self, start: int, stop: int) -> Optional[tuple["np.ndarray", Optional["np.ndarray"]]]:
+        if np is None or self.kind == KIND_TEXT:
+            return None
+
+        if self._numpy is None:
+            # Без копирования: массивы смотрят прямо в отображённые файлы
+            self._numpy = np.frombuffer(self.values, dtype=self.values.format), np.frombuffer(self.tags, dtype=np.uint8)
+
+        values, tags = self._numpy
+        values = values[start:stop]
+        present = tags[start:stop] != TAG_MISSING
+
+        if present.all():
+            present = None
+
+        return values, present
+
+    def close(self):
+        self.tags = self.values = self.offsets = self._numpy = None
+
+        for view in self._views:
+            view.release()
+
+        for mapped in self._maps:
+            try:
+                mapped.close()
+            except BufferError:
+                # На файл ещё смотрят массивы пачки: отображение закроется вместе с ними
+                pass
+
+        self._maps = []
+        self._views = []
+
+
+def _wrap(value: Any) -> Any:
+    if value is MISSING:
+        return MISSING
+
+    if isinstance(value, str):
+        return String(value)
+
+    return Number(value)
+
+
+class MappedFactColumns(FactColumns):
+    """Пачка записей хранилища фактов. Обёртки языка создаются, только если их кто-то попросил."""
+    def __init__(self, store: "FactStore", start: int, stop: int):
+        super().__init__({}, stop - start)
+        self.store = store
+        self.start = start
+        self.stop = stop
+        self._raw: dict[str, list[Any]] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.store.columns
+
+    def column(self, name: str) -> list[Any]:
+        if name not in self.columns:
+            self.columns[name] = [_wrap(value) for value in self.raw_column(name)]
+
+        return self.columns[name]
+
+    def raw_column(self, name: str) -> list[Any]:
+        if name not in self._raw:
+            self._raw[name] = self.store.columns[name].raw(self.start, self.stop)
+
+        return self._raw[name]
+
+    def numeric_column(self, name: str) -> Optional[tuple["np.ndarray", Optional["np.ndarray"]]]:
+        return self.store.columns[name].numeric(self.start, self.stop)
+
+    def record(self, index: int) -> dict[str, BaseAtomicType]:
+        return {
+            name: value
+            for name in self.store.columns
+            if (value := self.column(name)[index]) is not MISSING
+        }
+
+
+class FactStore:
+    """Колоночное хранилище фактов, созданное convert_csv_to_store. Колонки читаются через mmap."""
+    def __init__(self, path: str):
+        if not is_fact_store(path):
+            raise FileError(os.path.join(path, MANIFEST_NAME))
+
+        with open(os.path.join(path, MANIFEST_NAME), "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+
+        if manifest.get("version") != _STORE_VERSION:
+            raise ErrorValue(f"Неподдерживаемая версия хранилища фактов '{path}': {manifest.get('version')}")
+
+        if manifest["byteorder"] != sys.byteorder:
+            raise ErrorValue(f"Хранилище фактов '{path}' создано на машине с другим порядком байт")
+
+        self.path = path
+        self.size: int = manifest["size"]
+        self.columns = {
+            name: _MappedColumn(path, description)
+            for name, description in manifest["columns"].items()
+        }
+
+    def __len__(self) -> int:
+        return self.size
+
+    def batches(self, batch_size: int) -> Iterator[tuple[int, MappedFactColumns]]:
+        """Пачки записей вместе с номером первой записи пачки."""
+        for start in range(0, self.size, batch_size):
+            yield start, MappedFactColumns(self, start, min(start + batch_size, self.size))
+
+    def close(self):
+        for column in self.columns.values():
+            column.close()
+
+    def __enter__(self) -> "FactStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,157 @@
+import csv
+import json
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, NamedTuple, Optional, TextIO, Union
+
+from config import settings
+from src.core.types.basetype import BaseAtomicType
+from src.util.console_worker import printer
+
+CHECK_RESULT_MAP = {
+    True: "Выполнено",
+    False: "Нарушено",
+    None: "Ошибка типа",
+}
+
+# Тип проверки в строке итога записи CSV отчёта
+SUMMARY_MODIFY = "итог"
+
+
+class ReportRow(NamedTuple):
+    # Имя проверки или номер записи при пакетной проверке
+    check: Union[str, int]
+    criteria: str
+    fact_value: Any
+    modify: str
+    result: Optional[bool]
+
+
+def _plain_value(value: Any) -> Any:
+    if isinstance(value, BaseAtomicType) and isinstance(value.value, (int, float, str, bool)):
+        return value.value
+
+    return str(value)
+
+
+class ReportWriter(ABC):
+    """Получает результаты критериев по одному, сразу по мере проверки."""
+    def begin(self, title: str, description: str): ...
+
+    @abstractmethod
+    def write(self, row: ReportRow): ...
+
+    def summary(self, check: Union[str, int], passed: bool):
+        """Итог проверки одной записи, после строк её критериев."""
+
+    def end(self): ...
+
+    def note(self, text: str):
+        printer.print_info(text)
+
+    def close(self): ...
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class RichReportWriter(ReportWriter):
+    """Таблица rich для интерактивной работы: строки копятся до конца проверки."""
+    def __init__(self):
+        self.title = ""
+        self.description = ""
+        self.table_data: dict[str, list] = {}
+
+    def begin(self, title: str, description: str):
+        self.title = title
+        self.description = description
+        self.table_data = {
+            "Название критерия": [],
+            "Фактические данные": [],
+            "Результат": [],
+            "Тип проверки": [],
+        }
+
+    def write(self, row: ReportRow):
+        self.table_data["Название критерия"].append(row.criteria)
+        self.table_data["Фактические данные"].append(row.fact_value)
+        self.table_data["Результат"].append(CHECK_RESULT_MAP[row.result])
+        self.table_data["Тип проверки"].append(row.modify)
+
+    def end(self):
+        printer.print_info(self.description)
+        printer.print_table(self.table_data, title=self.title)
+
+
+class _StreamReportWriter(ReportWriter, ABC):
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.stream: TextIO = sys.stdout if path is None else open(path, "w", encoding="utf-8", newline="")
+
+    def note(self, text: str):
+        # В stdout идут только строки отчёта, иначе его нельзя будет разобрать
+        if self.stream is not sys.stdout or printer.console.stderr:
+            super().note(text)
+
+    def close(self):
+        if self.stream is sys.stdout:
+            self.stream.flush()
+        else:
+            self.stream.close()
+
+
+class JsonlReportWriter(_StreamReportWriter):
+    def write(self, row: ReportRow):
+        self.stream.write(json.dumps({
+            "проверка": row.check,
+            "критерий": row.criteria,
+            "значение": _plain_value(row.fact_value),
+            "тип_проверки": row.modify,
+            "результат": CHECK_RESULT_MAP[row.result],
+        }, ensure_ascii=False) + "\n")
+
+    def summary(self, check: Union[str, int], passed: bool):
+        self.stream.write(json.dumps({"проверка": check, "итог": CHECK_RESULT_MAP[passed]}, ensure_ascii=False) + "\n")
+
+
+class CsvReportWriter(_StreamReportWriter):
+    def __init__(self, path: Optional[str] = None):
+        super().__init__(path)
+        self.writer = csv.writer(self.stream)
+        self.writer.writerow(("проверка", "критерий", "значение", "тип_проверки", "результат"))
+
+    def write(self, row: ReportRow):
+        self.writer.writerow((
+            row.check, row.criteria, _plain_value(row.fact_value), row.modify, CHECK_RESULT_MAP[row.result]
+        ))
+
+    def summary(self, check: Union[str, int], passed: bool):
+        # Строка итога: без критерия и значения, в колонке типа проверки - 'итог'
+        self.writer.writerow((check, "", "", SUMMARY_MODIFY, CHECK_RESULT_MAP[passed]))
+
+
+def create_report_writer(report_format: str, path: Optional[str] = None) -> ReportWriter:
+    """Писатель отчёта в формате rich, jsonl или csv. Без пути jsonl и csv пишутся в stdout."""
+    if report_format == "jsonl":
+        return JsonlReportWriter(path)
+
+    if report_format == "csv":
+        return CsvReportWriter(path)
+
+    return RichReportWriter()
+
+
+def open_report_writer() -> ReportWriter:
+    """Писатель отчётов ПРОВЕРКА по настройкам check_report_format и check_report_path."""
+    return create_report_writer(settings.check_report_format, settings.check_report_path)
+
+
+def report_format_by_path(path: Optional[str]) -> str:
+    """Формат для пакетной проверки: таблицы rich для тысяч записей не годятся."""
+    if path is not None and path.endswith(".csv"):
+        return "csv"
+
+    return "jsonl"
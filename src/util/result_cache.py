@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from threading import Lock
+from typing import Any, Iterable, Optional
+
+from config import settings
+from src.core.types.basetype import BaseAtomicType
+from src.core.types.conditions import Condition, Modify, Only, NotEqual, LessThan, GreaterThan, Between
+from src.util.console_worker import printer
+
+# Меняется, если меняется смысл сохранённых результатов, чтобы старые записи не использовались
+_CACHE_VERSION = "1"
+_PLAIN_TYPES = (int, float, str, bool, type(None))
+# Ограничение SQLite на число параметров в одном запросе
+_MAX_QUERY_KEYS = 500
+
+CachedResults = dict[str, Optional[bool]]
+
+
+def _plain(value: Any) -> Optional[str]:
+    if not isinstance(value, _PLAIN_TYPES):
+        return None
+
+    return f"{type(value).__name__}:{value!r}"
+
+
+def _criterion_fingerprint(name_criteria: str, modify: Modify) -> Optional[str]:
+    if isinstance(modify, (Only, NotEqual, LessThan, GreaterThan)):
+        constants = (_plain(modify.value.value),)
+    elif isinstance(modify, Between):
+        constants = (_plain(modify.lower_bound.value), _plain(modify.upper_bound.value))
+    else:
+        # Процедуры и неизвестные критерии: результат зависит не только от значения факта
+        return None
+
+    if None in constants:
+        return None
+
+    return f"{name_criteria}\x00{type(modify).__name__}\x00" + "\x00".join(constants)
+
+
+def criteria_fingerprint(condition: Condition) -> tuple[str, frozenset[str]]:
+    """
+    Структурный отпечаток критериев условия: тип сравнения и константы каждого критерия.
+    Вторым значением - критерии, при наличии фактов по которым результат проверки не кэшируется.
+    """
+    parts = [_CACHE_VERSION]
+    uncached = set()
+
+    for name_criteria, modify in sorted(condition.criteria.modify.items()):
+        fingerprint = _criterion_fingerprint(name_criteria, modify)
+
+        if fingerprint is None:
+            uncached.add(name_criteria)
+            fingerprint = f"{name_criteria}\x00?"
+
+        parts.append(fingerprint)
+
+    return "\x01".join(parts), frozenset(uncached)
+
+
+def check_key(
+        fingerprint: str, uncached: frozenset[str], condition: Condition, facts: dict[str, BaseAtomicType]
+) -> Optional[str]:
+    """Ключ результата проверки фактов или None, если её результат нельзя кэшировать."""
+    parts = [fingerprint]
+
+    for name_fact, value in facts.items():
+        if name_fact not in condition.criteria.modify:
+            continue
+
+        if name_fact in uncached:
+            return None
+
+        plain = _plain(value.value)
+
+        if plain is None:
+            return None
+
+        parts.append(f"{name_fact}\x00{type(value).__name__}\x00{plain}")
+
+    return hashlib.sha256("\x01".join(parts).encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Кэш результатов проверок на диске (SQLite).
+    Ключ включает отпечаток критериев документа, поэтому после изменения документа старые записи
+    просто перестают находиться и со временем вытесняются.
+    """
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, results TEXT NOT NULL, used REAL NOT NULL)"
+        )
+        self._connection.commit()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, CachedResults]:
+        keys = list(dict.fromkeys(keys))
+        found: dict[str, CachedResults] = {}
+
+        with self._lock:
+            for start in range(0, len(keys), _MAX_QUERY_KEYS):
+                chunk = keys[start:start + _MAX_QUERY_KEYS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, results FROM results WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+
+                found.update((key, json.loads(results)) for key, results in rows)
+
+            if found:
+                now = time.time()
+                self._connection.executemany(
+                    "UPDATE results SET used = ? WHERE key = ?", [(now, key) for key in found]
+                )
+                self._connection.commit()
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+
+        return found
+
+    def get(self, key: str) -> Optional[CachedResults]:
+        return self.get_many((key,)).get(key)
+
+    def put_many(self, items: Iterable[tuple[str, CachedResults]]):
+        now = time.time()
+        rows = [(key, json.dumps(results, ensure_ascii=False), now) for key, results in items]
+
+        if not rows:
+            return
+
+        with self._lock:
+            self._connection.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?)", rows)
+            self._connection.commit()
+
+    def put(self, key: str, results: CachedResults):
+        self.put_many(((key, results),))
+
+    def stats(self) -> tuple[int, int]:
+        with self._lock:
+            return self.hits, self.misses
+
+    def prune(self):
+        """Оставляет max_entries записей, которые использовались последними."""
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM results WHERE key NOT IN (SELECT key FROM results ORDER BY used DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+            self._connection.commit()
+
+    def close(self):
+        self.prune()
+
+        with self._lock:
+            self._connection.close()
+
+
+_result_cache: Optional[ResultCache] = None
+_result_cache_pid: Optional[int] = None
+# Кэши, унаследованные через fork: их соединения нельзя закрывать в дочернем процессе
+_inherited_caches: list[ResultCache] = []
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Кэш результатов по настройке result_cache_path или None, если он выключен."""
+    global _result_cache, _result_cache_pid
+
+    if settings.result_cache_path is None:
+        return None
+
+    # Соединение SQLite нельзя использовать после fork: у дочернего процесса оно своё
+    if _result_cache is None or _result_cache_pid != os.getpid():
+        if _result_cache is not None:
+            _inherited_caches.append(_result_cache)
+
+        try:
+            _result_cache = ResultCache(settings.result_cache_path, settings.result_cache_max_entries)
+        except sqlite3.Error as e:
+            printer.logging("Кэш результатов недоступен: %s", e, level="WARNING")
+            return None
+
+        _result_cache_pid = os.getpid()
+
+    return _result_cache
+
+
+def close_result_cache():
+    global _result_cache
+
+    if _result_cache is not None and _result_cache_pid == os.getpid():
+        _result_cache.close()
+
+    _result_cache = None
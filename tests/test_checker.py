@@ -0,0 +1,694 @@
+import random
+import pytest
+
+from src.core.executors.batch_checker import BatchChecker
+from src.core.types.atomic import Number, String
+from src.util.build_tools.starter import compile_string
+
+document_code = """
+ОПРЕДЕЛИТЬ САНКЦИЮ штраф (
+    СТАТЬЯ Статья 8.4 КоАП,
+)
+ОПРЕДЕЛИТЬ ПРАВО право (
+    ОПИСАНИЕ Описание права,
+)
+ОПРЕДЕЛИТЬ ОБЯЗАННОСТЬ обязанность (
+    ОПИСАНИЕ Описание обязанности,
+)
+ОПРЕДЕЛИТЬ ПРАВИЛО правило (
+    ОПИСАНИЕ Описание правила,
+)
+ОПРЕДЕЛИТЬ СУБЪЕКТ субъект (
+    ИМЯ Предприятие,
+)
+ОПРЕДЕЛИТЬ ОБЪЕКТ объект (
+    ИМЯ Водоём,
+)
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ порог(значение) (
+    ВЕРНУТЬ 10;
+)
+
+ОПРЕДЕЛИТЬ УСЛОВИЕ условие (
+    ОПИСАНИЕ Условие проверки,
+    КРИТЕРИИ (
+        ЕДИНИЦА ТОЛЬКО мг/л,
+        ДОПУСТИМОЕ_ЗНАЧЕНИЕ МЕНЬШЕ 0.5,
+        МИНИМАЛЬНОЕ_ЗНАЧЕНИЕ БОЛЬШЕ 0.3,
+        СРЕДНЕЕ_ЗНАЧЕНИЕ МЕЖДУ 1 И 2,
+        КОД НЕ МОЖЕТ БЫТЬ 7,
+        ОБЪЁМ ПРОЦЕДУРА порог МЕНЬШЕ,
+    )
+)
+
+СОЗДАТЬ ДОКУМЕНТ документ (
+    ДИСПОЗИЦИЯ (
+        ПРАВО право,
+        ОБЯЗАННОСТЬ обязанность,
+        ПРАВИЛО правило,
+    )
+    САНКЦИЯ (
+        ТИПЫ [штраф],
+        СТЕПЕНЬ СТРОГОСТИ ВЫСОКАЯ,
+        ПРОЦЕССУАЛЬНЫЙ АСПЕКТ Экспертиза,
+    )
+    ГИПОТЕЗА (
+        СУБЪЕКТ субъект,
+        ОБЪЕКТ объект,
+        УСЛОВИЕ условие,
+    )
+)
+"""
+
+records = [
+    {
+        "ЕДИНИЦА": String("мг / л"), "ДОПУСТИМОЕ_ЗНАЧЕНИЕ": Number(0.4), "МИНИМАЛЬНОЕ_ЗНАЧЕНИЕ": Number(1),
+        "СРЕДНЕЕ_ЗНАЧЕНИЕ": Number(1.5), "КОД": Number(3), "ОБЪЁМ": Number(5),
+    },
+    {"ДОПУСТИМОЕ_ЗНАЧЕНИЕ": Number(0.5), "КОД": Number(7), "ОБЪЁМ": Number(50)},
+    {"СРЕДНЕЕ_ЗНАЧЕНИЕ": Number(2), "ЛИШНЕЕ": Number(1)},
+    {"ДОПУСТИМОЕ_ЗНАЧЕНИЕ": String("много")},
+]
+
+
+def test_batch_check_matches_single_check():
+    compiled = compile_string(document_code)
+    document = compiled.compiled_code.get("документ")
+    condition = document.hypothesis.condition
+
+    results = list(BatchChecker(document, compiled, batch_size=3).check(records))
+
+    assert [result.index for result in results] == [0, 1, 2, 3]
+
+    for record, result in zip(records[:3], results):
+        expected = {name: item.result for name, item in condition.execute(record, compiled).items()}
+        assert result.criteria == expected
+
+    assert repr(results[0].modify["ОБЪЁМ"]) == "Меньше чем 10"
+    assert results[0].passed
+    assert not results[1].passed
+    assert results[3].criteria == {"ДОПУСТИМОЕ_ЗНАЧЕНИЕ": None}
+    assert not results[3].passed
+
+
+def test_numpy_columns_match_python(monkeypatch):
+    pytest.importorskip("numpy")
+
+    from src.core.types import fact_columns
+    from src.core.types.fact_columns import FactColumns
+
+    compiled = compile_string(document_code)
+    condition = compiled.compiled_code.get("документ").hypothesis.condition
+
+    numeric_records = [
+        {"ДОПУСТИМОЕ_ЗНАЧЕНИЕ": Number(i / 100), "КОД": Number(i % 9), "СРЕДНЕЕ_ЗНАЧЕНИЕ": Number(i % 4)}
+        if i % 5 else {"КОД": Number(7), "ЕДИНИЦА": String("мг/л")}
+        for i in range(200)
+    ]
+    mixed_records = numeric_records + [{"ДОПУСТИМОЕ_ЗНАЧЕНИЕ": String("много"), "КОД": Number(True)}]
+
+    for batch in (numeric_records, mixed_records):
+        vectorized = condition.execute(FactColumns.from_records(batch), compiled)
+
+        monkeypatch.setattr(fact_columns, "np", None)
+        expected = condition.execute(FactColumns.from_records(batch), compiled)
+        monkeypatch.undo()
+
+        assert vectorized == expected
+
+
+def test_numpy_columns_keep_large_ints_exact():
+    pytest.importorskip("numpy")
+
+    from src.core.types.conditions import GreaterThan
+    from src.core.types.fact_columns import FactColumns, MAX_EXACT_FLOAT_INT
+
+    modify = GreaterThan(Number(MAX_EXACT_FLOAT_INT))
+    records = [{"КОД": Number(MAX_EXACT_FLOAT_INT + 1)} if i % 2 else {} for i in range(100)]
+    columns = FactColumns.from_records(records)
+
+    # Через float64 значение 2^53 + 1 стало бы равно 2^53, и критерий не выполнился бы
+    assert columns.numeric_column("КОД") is None
+    assert modify.calculate_column(columns.raw_column("КОД")) == [True if i % 2 else None for i in range(100)]
+
+    small = FactColumns.from_records([{"КОД": Number(i)} if i % 2 else {} for i in range(100)])
+    assert small.numeric_column("КОД") is not None
+
+
+def test_criteria_index_matches_full_check():
+    rnd = random.Random(33)
+    fields = ["А", "Б", "В", "Г"]
+    criteria_variants = [
+        lambda: f"ТОЛЬКО {rnd.randint(0, 5)}",
+        lambda: f"НЕ МОЖЕТ БЫТЬ {rnd.randint(0, 5)}",
+        lambda: f"МЕНЬШЕ {rnd.randint(0, 5)}",
+        lambda: f"БОЛЬШЕ {rnd.randint(0, 5)}",
+        lambda: f"МЕЖДУ {rnd.randint(0, 3)} И {rnd.randint(2, 6)}",
+        lambda: "ПРОЦЕДУРА порог МЕНЬШЕ",
+    ]
+
+    code = document_code
+    documents = []
+
+    for i in range(40):
+        criteria = ",\n".join(
+            f"{field} {rnd.choice(criteria_variants)()}"
+            for field in rnd.sample(fields, rnd.randint(1, len(fields)))
+        )
+        documents.append(f"документ_{i}")
+        code += f"""
+ОПРЕДЕЛИТЬ УСЛОВИЕ условие_{i} (
+    ОПИСАНИЕ Условие проверки,
+    КРИТЕРИИ (
+        {criteria},
+    )
+)
+
+СОЗДАТЬ ДОКУМЕНТ документ_{i} (
+    ДИСПОЗИЦИЯ (
+        ПРАВО право,
+        ОБЯЗАННОСТЬ обязанность,
+        ПРАВИЛО правило,
+    )
+    САНКЦИЯ (
+        ТИПЫ [штраф],
+        СТЕПЕНЬ СТРОГОСТИ ВЫСОКАЯ,
+        ПРОЦЕССУАЛЬНЫЙ АСПЕКТ Экспертиза,
+    )
+    ГИПОТЕЗА (
+        СУБЪЕКТ субъект,
+        ОБЪЕКТ объект,
+        УСЛОВИЕ условие_{i},
+    )
+)
+"""
+
+    compiled = compile_string(code)
+    index = compiled.criteria_index
+
+    assert len(index) == len(documents) + 1
+
+    for _ in range(200):
+        facts = {
+            field: Number(rnd.choice([rnd.randint(-1, 7), rnd.uniform(-1, 7)]))
+            for field in rnd.sample(fields, rnd.randint(1, len(fields)))
+        }
+
+        expected = []
+
+        for name in documents:
+            check_result = compiled.compiled_code[name].hypothesis.condition.execute(facts, compiled)
+
+            if check_result and all(result_condition.result for result_condition in check_result.values()):
+                expected.append(name)
+
+        assert index.matching(facts, compiled) == expected
+
+
+def test_pure_procedure_criteria_are_memoized_without_mutation():
+    from src.core.types.conditions import ProcedureModifyWrapper, procedure_criteria_cache
+
+    compiled = compile_string(document_code.replace("ОПРЕДЕЛИТЬ ПРОЦЕДУРУ порог", "ОПРЕДЕЛИТЬ ЧИСТУЮ ПРОЦЕДУРУ порог"))
+    document = compiled.compiled_code.get("документ")
+    modify = document.hypothesis.condition.criteria.modify["ОБЪЁМ"]
+
+    assert isinstance(modify, ProcedureModifyWrapper)
+    assert compiled.compiled_code.get("порог").pure
+
+    procedure_criteria_cache.clear()
+    volumes = [5, 50, 5, 5, 50, 7]
+    results = list(BatchChecker(document, compiled).check({"ОБЪЁМ": Number(value)} for value in volumes))
+
+    assert [result.criteria["ОБЪЁМ"] for result in results] == [value < 10 for value in volumes]
+    assert procedure_criteria_cache.stats() == (3, 3)
+    assert modify.nested_modify.value == "порог"
+
+    check_result = document.hypothesis.condition.execute({"ОБЪЁМ": Number(5)}, compiled)
+
+    assert check_result["ОБЪЁМ"].result
+    assert repr(check_result["ОБЪЁМ"].modify) == "Меньше чем 10"
+    assert procedure_criteria_cache.stats() == (4, 3)
+
+
+def test_parallel_checks_report_in_source_order(monkeypatch, capsys):
+    from io import StringIO
+
+    from rich.console import Console
+
+    from config import settings
+    from src.util.build_tools.interpreter import Interpreter
+    from src.util.build_tools.parallel_checks import is_parallel_checks_supported
+    from src.util.console_worker import printer
+
+    if not is_parallel_checks_supported():
+        pytest.skip("Параллельные проверки доступны только с fork")
+
+    code = document_code + """
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ печать_блока(номер) (
+    НАПЕЧАТАТЬ номер;
+)
+"""
+
+    for i in range(6):
+        code += f"""
+СОЗДАТЬ ФАКТИЧЕСКУЮ СИТУАЦИЮ ситуация_{i} (
+    ОБЪЕКТ объект,
+    СУБЪЕКТ субъект,
+    ДАННЫЕ (
+        ДОПУСТИМОЕ_ЗНАЧЕНИЕ {i / 10},
+        ОБЪЁМ {i * 3},
+    )
+)
+
+ПРОВЕРКА проверка_{i} (
+    ФАКТИЧЕСКАЯ СИТУАЦИЯ ситуация_{i},
+    ДОКУМЕНТ документ,
+)
+"""
+
+    # Проверки после блока ВЫПОЛНИТЬ выполняются последовательно, поэтому блоки в конце
+    for i in range(6):
+        code += f"""
+ВЫПОЛНИТЬ (
+    печать_блока({i});
+)
+"""
+
+    def run(workers: int) -> str:
+        monkeypatch.setattr(settings, "check_workers", workers)
+        monkeypatch.setattr(printer, "console", Console(file=StringIO(), width=120))
+
+        interpreter = Interpreter(compile_string(code))
+        assert len(interpreter.parallel_check_names()) == 6
+        interpreter.run()
+
+        return printer.console.file.getvalue() + capsys.readouterr().out
+
+    sequential = run(1)
+
+    assert sequential.count("Отчет проверки") == 6
+    assert run(3) == sequential
+
+
+def test_parallel_checks_after_execute_block_see_its_changes(monkeypatch, tmp_path):
+    import json
+
+    from config import settings
+    from src.util.build_tools.interpreter import Interpreter
+    from src.util.build_tools.parallel_checks import is_parallel_checks_supported
+
+    if not is_parallel_checks_supported():
+        pytest.skip("Параллельные проверки доступны только с fork")
+
+    code = "ВКЛЮЧИТЬ стандартная_библиотека.*\n" + document_code
+
+    for i in range(2):
+        code += f"""
+СОЗДАТЬ ФАКТИЧЕСКУЮ СИТУАЦИЮ ситуация_{i} (
+    ОБЪЕКТ объект,
+    СУБЪЕКТ субъект,
+    ДАННЫЕ (
+        КОД 3,
+    )
+)
+
+ПРОВЕРКА проверка_{i} (
+    ФАКТИЧЕСКАЯ СИТУАЦИЯ ситуация_{i},
+    ДОКУМЕНТ документ,
+)
+"""
+
+    code += """
+ВЫПОЛНИТЬ (
+    добавить_в_таблицу(ситуация_0:__данные__, "КОД", 7);
+)
+
+ПРОВЕРКА проверка_после_блока (
+    ФАКТИЧЕСКАЯ СИТУАЦИЯ ситуация_0,
+    ДОКУМЕНТ документ,
+)
+"""
+    monkeypatch.setattr(settings, "check_report_format", "jsonl")
+
+    def run(workers: int) -> list[dict]:
+        report_path = tmp_path / f"report_{workers}.jsonl"
+        monkeypatch.setattr(settings, "check_workers", workers)
+        monkeypatch.setattr(settings, "check_report_path", str(report_path))
+
+        interpreter = Interpreter(compile_string(code))
+        assert interpreter.parallel_check_names() == ["проверка_0", "проверка_1"]
+        interpreter.run()
+
+        return [json.loads(line) for line in report_path.read_text(encoding="utf-8").splitlines()]
+
+    sequential = run(1)
+
+    assert [row["результат"] for row in sequential] == ["Выполнено", "Выполнено", "Нарушено"]
+    assert run(2) == sequential
+
+
+def test_check_reports_stream_to_jsonl_and_csv(monkeypatch, tmp_path):
+    import csv
+    import json
+
+    from config import settings
+    from src.util.build_tools.interpreter import Interpreter
+
+    code = document_code + """
+СОЗДАТЬ ФАКТИЧЕСКУЮ СИТУАЦИЮ ситуация (
+    ОБЪЕКТ объект,
+    СУБЪЕКТ субъект,
+    ДАННЫЕ (
+        ДОПУСТИМОЕ_ЗНАЧЕНИЕ 0.7,
+        ОБЪЁМ 3,
+    )
+)
+
+ПРОВЕРКА проверка (
+    ФАКТИЧЕСКАЯ СИТУАЦИЯ ситуация,
+    ДОКУМЕНТ документ,
+)
+"""
+    compiled = compile_string(code)
+    monkeypatch.setattr(settings, "check_workers", 1)
+
+    jsonl_path = tmp_path / "report.jsonl"
+    monkeypatch.setattr(settings, "check_report_format", "jsonl")
+    monkeypatch.setattr(settings, "check_report_path", str(jsonl_path))
+    Interpreter(compiled).run()
+
+    rows = [json.loads(line) for line in jsonl_path.read_text(encoding="utf-8").splitlines()]
+
+    assert rows == [
+        {
+            "проверка": "проверка", "критерий": "ДОПУСТИМОЕ_ЗНАЧЕНИЕ", "значение": 0.7,
+            "тип_проверки": "Меньше чем 0.5", "результат": "Нарушено",
+        },
+        {
+            "проверка": "проверка", "критерий": "ОБЪЁМ", "значение": 3,
+            "тип_проверки": "Меньше чем 10", "результат": "Выполнено",
+        },
+    ]
+
+    csv_path = tmp_path / "report.csv"
+    monkeypatch.setattr(settings, "check_report_format", "csv")
+    monkeypatch.setattr(settings, "check_report_path", str(csv_path))
+    Interpreter(compiled).run()
+
+    with open(csv_path, encoding="utf-8", newline="") as file:
+        csv_rows = list(csv.DictReader(file))
+
+    assert [row["результат"] for row in csv_rows] == ["Нарушено", "Выполнено"]
+    assert csv_rows[1]["значение"] == "3"
+
+
+def test_generated_predicate_matches_execute():
+    compiled = compile_string(document_code)
+    condition = compiled.compiled_code.get("документ").hypothesis.condition
+    rnd = random.Random(37)
+    values = [Number(0.4), Number(1), Number(1.5), Number(7), Number(12), String("мг/л"), String("много")]
+
+    for _ in range(300):
+        facts = {
+            name: rnd.choice(values)
+            for name in rnd.sample(list(condition.criteria.modify), rnd.randint(0, len(condition.criteria.modify)))
+        }
+
+        try:
+            expected = all(result.result for result in condition.execute(facts, compiled).values())
+        except TypeError:
+            # Быстрая проверка может остановиться на нарушенном критерии раньше, чем дойдёт до ошибки типа
+            try:
+                assert not condition.is_satisfied(facts, compiled)
+            except TypeError:
+                pass
+
+            continue
+
+        assert condition.is_satisfied(facts, compiled) == expected
+
+
+def test_generated_predicate_does_not_keep_condition_alive():
+    import gc
+    import pickle
+    import weakref
+
+    compiled = compile_string(document_code)
+    condition = compiled.compiled_code.get("документ").hypothesis.condition
+
+    assert condition.is_satisfied({"ОБЪЁМ": Number(5)}, compiled)
+    assert "_predicate" not in pickle.loads(pickle.dumps(condition)).__dict__
+
+    condition_ref = weakref.ref(condition)
+    del compiled, condition
+    gc.collect()
+
+    assert condition_ref() is None
+
+
+def test_live_check_recomputes_only_changed_facts(monkeypatch):
+    from src.core.executors.live_checker import LiveCheck
+    from src.core.types.conditions import Condition
+
+    code = document_code + """
+СОЗДАТЬ ФАКТИЧЕСКУЮ СИТУАЦИЮ ситуация (
+    ОБЪЕКТ объект,
+    СУБЪЕКТ субъект,
+    ДАННЫЕ (
+        ДОПУСТИМОЕ_ЗНАЧЕНИЕ 0.2,
+        КОД 3,
+        ОБЪЁМ 3,
+    )
+)
+
+ПРОВЕРКА проверка (
+    ФАКТИЧЕСКАЯ СИТУАЦИЯ ситуация,
+    ДОКУМЕНТ документ,
+)
+"""
+    compiled = compile_string(code)
+    checker = compiled.compiled_code.get("проверка")
+    situation = checker.fact_situation
+    verdicts = []
+
+    live = LiveCheck.from_checker(checker, compiled, lambda check: verdicts.append(check.passed))
+
+    assert live.passed
+
+    calls = []
+    execute_criteria = Condition.execute_criteria
+
+    def counting_execute_criteria(self, name, value, compiled_):
+        calls.append(name)
+        return execute_criteria(self, name, value, compiled_)
+
+    monkeypatch.setattr(Condition, "execute_criteria", counting_execute_criteria)
+
+    situation.set_fact("КОД", Number(7))
+    assert calls == ["КОД"]
+    assert not live.passed
+
+    situation.set_fact("ОБЪЁМ", Number(30))
+    situation.set_fact("ЛИШНЕЕ", Number(1))
+    situation.set_fact("КОД", Number(1))
+    assert calls == ["КОД", "ОБЪЁМ", "КОД"]
+    assert live.violations == 1
+
+    situation.remove_fact("ОБЪЁМ")
+    assert live.passed
+    assert verdicts == [False, True]
+
+    situation.set_fact("ДОПУСТИМОЕ_ЗНАЧЕНИЕ", String("много"))
+    assert live.type_errors == 1 and not live.passed
+
+    situation.set_fact("ДОПУСТИМОЕ_ЗНАЧЕНИЕ", Number(0.1))
+    expected = {name: result.result for name, result in checker.check(compiled).items()}
+    assert {name: result.result for name, result in live.results.items()} == expected
+    assert situation.fields["__данные__"].get(String("КОД")).value == 1
+
+    live.close()
+    calls.clear()
+    situation.set_fact("КОД", Number(7))
+    assert calls == []
+
+
+def test_live_check_sees_facts_changed_outside_set_fact():
+    from src.core.executors.live_checker import LiveCheck
+    from src.core.executors.procedure import ProcedureExecutor
+    from src.core.types.variable import ScopeStack, Variable
+
+    code = "ВКЛЮЧИТЬ стандартная_библиотека.*\n" + document_code + """
+СОЗДАТЬ ФАКТИЧЕСКУЮ СИТУАЦИЮ ситуация (
+    ОБЪЕКТ объект,
+    СУБЪЕКТ субъект,
+    ДАННЫЕ (
+        КОД 3,
+    )
+)
+
+ПРОВЕРКА проверка (
+    ФАКТИЧЕСКАЯ СИТУАЦИЯ ситуация,
+    ДОКУМЕНТ документ,
+)
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test (данные) (
+    добавить_в_таблицу(данные, "КОД", 3);
+)
+"""
+    compiled = compile_string(code)
+    checker = compiled.compiled_code.get("проверка")
+    situation = checker.fact_situation
+    verdicts = []
+
+    live = LiveCheck.from_checker(checker, compiled, lambda check: verdicts.append(check.passed))
+
+    situation.data["КОД"] = Number(7)
+    assert not live.passed
+    assert situation.fields["__данные__"].get(String("КОД")).value == 7
+
+    procedure = compiled.compiled_code.get("test")
+    procedure.tree_variables = ScopeStack()
+    procedure.tree_variables.set(Variable("данные", situation.fields["__данные__"]))
+    ProcedureExecutor(procedure, compiled).execute()
+
+    assert live.passed
+    assert situation.data["КОД"].value == 3
+    assert verdicts == [False, True]
+
+    situation.data.pop("КОД")
+    assert live.results == {}
+
+
+def test_result_cache_reuses_results_by_criteria_and_facts(monkeypatch, tmp_path):
+    from config import settings
+    from src.core.executors.checker_execute import CheckerSituationExecutor
+    from src.util.result_cache import close_result_cache, get_result_cache
+
+    monkeypatch.setattr(settings, "result_cache_path", str(tmp_path / "results.sqlite3"))
+
+    def check_records(code):
+        compiled = compile_string(code)
+        document = compiled.compiled_code.get("документ")
+        results = [result.criteria for result in BatchChecker(document, compiled).check(records)]
+        return results, get_result_cache().stats()
+
+    try:
+        first, first_stats = check_records(document_code)
+        second, second_stats = check_records(document_code)
+
+        # Записи с фактом для критерия-процедуры не кэшируются
+        assert first_stats == (0, 2)
+        assert second_stats == (2, 2)
+        assert second == first
+
+        changed, changed_stats = check_records(document_code.replace("МЕНЬШЕ 0.5", "МЕНЬШЕ 0.6"))
+        assert changed_stats == (2, 4)
+        assert changed[1] == {**first[1], "ДОПУСТИМОЕ_ЗНАЧЕНИЕ": True}
+
+        compiled = compile_string(document_code + """
+СОЗДАТЬ ФАКТИЧЕСКУЮ СИТУАЦИЮ ситуация (
+    ОБЪЕКТ объект,
+    СУБЪЕКТ субъект,
+    ДАННЫЕ (
+        ДОПУСТИМОЕ_ЗНАЧЕНИЕ 0.7,
+        КОД 3,
+    )
+)
+
+ПРОВЕРКА проверка (
+    ФАКТИЧЕСКАЯ СИТУАЦИЯ ситуация,
+    ДОКУМЕНТ документ,
+)
+""")
+        checker = compiled.compiled_code.get("проверка")
+        outcomes = [CheckerSituationExecutor(checker, compiled).check() for _ in range(2)]
+
+        assert [outcome.result_cache_hit for outcome in outcomes] == [False, True]
+        assert {name: result.result for name, result in outcomes[1].result.items()} == {
+            "ДОПУСТИМОЕ_ЗНАЧЕНИЕ": False, "КОД": True
+        }
+    finally:
+        close_result_cache()
+
+
+def test_fact_store_matches_csv(monkeypatch, tmp_path):
+    from src.util import fact_store
+    from src.util.fact_sources import read_facts
+    from src.util.fact_store import FactStore, convert_csv_to_store
+
+    csv_path = tmp_path / "facts.csv"
+    rows = ["ДОПУСТИМОЕ_ЗНАЧЕНИЕ,КОД,ЕДИНИЦА,СРЕДНЕЕ_ЗНАЧЕНИЕ,ОБЪЁМ"]
+
+    for i in range(150):
+        rows.append(",".join((
+            "" if i % 7 == 0 else str(i / 100) if i % 3 else str(i % 2),
+            str(i % 9),
+            "мг/л" if i % 2 else "мг / л",
+            "много" if i == 50 else str(i % 4),
+            "" if i % 4 else str(i),
+        )))
+
+    csv_path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    assert convert_csv_to_store(str(csv_path), str(tmp_path / "store")) == 150
+
+    compiled = compile_string(document_code)
+    checker = BatchChecker(compiled.compiled_code.get("документ"), compiled, batch_size=64)
+    expected = list(checker.check(read_facts(str(csv_path))))
+
+    for numpy_module in (fact_store.np, None):
+        monkeypatch.setattr(fact_store, "np", numpy_module)
+
+        with FactStore(str(tmp_path / "store")) as store:
+            results = list(checker.check_store(store))
+
+        assert [result.criteria for result in results] == [result.criteria for result in expected]
+        assert [
+            {name: (type(value), value.value) for name, value in result.facts.items()} for result in results
+        ] == [
+            {name: (type(value), value.value) for name, value in result.facts.items()} for result in expected
+        ]
+
+
+def test_fact_store_mixed_int_float_column(tmp_path):
+    from src.util.fact_store import FactStore, KIND_FLOAT, KIND_TEXT, convert_csv_to_store
+
+    csv_path = tmp_path / "facts.csv"
+    csv_path.write_text("СУММА,КОД\n100,1\n250,9007199254740993\n99.5,2.5\n", encoding="utf-8")
+    convert_csv_to_store(str(csv_path), str(tmp_path / "store"))
+
+    with FactStore(str(tmp_path / "store")) as store:
+        assert store.columns["СУММА"].kind == KIND_FLOAT
+        assert store.columns["СУММА"].raw(0, 3) == [100, 250, 99.5]
+        assert [type(value) for value in store.columns["СУММА"].raw(0, 3)] == [int, int, float]
+        # Целое больше 2^53 во float64 не поместится точно
+        assert store.columns["КОД"].kind == KIND_TEXT
+
+
+def test_batch_check_stdout_is_jsonl(tmp_path):
+    import json
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    program = tmp_path / "программа.raw"
+    program.write_text(document_code, encoding="utf-8")
+    facts = tmp_path / "facts.jsonl"
+    facts.write_text(
+        '{"ДОПУСТИМОЕ_ЗНАЧЕНИЕ": 0.4, "ОБЪЁМ": 3}\n{"ДОПУСТИМОЕ_ЗНАЧЕНИЕ": 0.7, "ОБЪЁМ": 3}\n', encoding="utf-8"
+    )
+
+    process = subprocess.run(
+        [sys.executable, "law.py", "--check", str(program), "документ", str(facts)],
+        cwd=Path(__file__).resolve().parent.parent, capture_output=True, text=True, encoding="utf-8", timeout=120,
+    )
+
+    assert process.returncode == 0, process.stderr
+    rows = [json.loads(line) for line in process.stdout.splitlines()]
+
+    assert [row for row in rows if "итог" in row] == [
+        {"проверка": 0, "итог": "Выполнено"},
+        {"проверка": 1, "итог": "Нарушено"},
+    ]
+    # Критерий с процедурой показан с вычисленным значением, как в отчёте ПРОВЕРКА
+    assert {row["тип_проверки"] for row in rows if row.get("критерий") == "ОБЪЁМ"} == {"Меньше чем 10"}
+    assert "Затрачено времени" in process.stderr
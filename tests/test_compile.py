@@ -8,12 +8,14 @@ from src.core.types.procedure import (
     When,
     Else,
     Loop,
+    ForEach,
     While,
     Context,
     Procedure,
     AssignField,
     ExceptionHandler,
-    ProcedureContextName
+    ProcedureContextName,
+    YieldValue
 )
 from src.util.build_tools.starter import compile_string
 
@@ -344,6 +346,48 @@ def test_compile_loop():
     assert len(loop_2.body.commands) == 3
 
 
+def test_compile_for_each():
+    code = """
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test () (
+        ДЛЯ КАЖДОГО элемент ИЗ test (
+            test;
+            test;
+            test;
+        )
+    )
+    """
+    compiled_proc = compile_string(code)
+
+    proc_obj = compiled_proc.compiled_code.get("test")
+    assert isinstance(proc_obj, Procedure)
+    for_each = proc_obj.body.commands[0]
+
+    assert isinstance(for_each, ForEach)
+    assert for_each.name_loop_var == "элемент"
+    assert len(for_each.expression.operations) == 1
+    assert len(for_each.body.commands) == 3
+
+
+def test_compile_generator_procedure():
+    code = """
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test () (
+        ЕСЛИ ИСТИНА ТО (
+            ОТДАТЬ 1;
+        )
+    )
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ plain () (
+        ВЕРНУТЬ 1;
+    )
+    """
+    compiled_proc = compile_string(code)
+
+    proc_obj = compiled_proc.compiled_code.get("test")
+    assert isinstance(proc_obj, Procedure)
+    assert proc_obj.generator
+    assert isinstance(proc_obj.body.commands[0].body.commands[0], YieldValue)
+    assert not compiled_proc.compiled_code.get("plain").generator
+
+
 def test_compile_while():
     code = """
     ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test () (
@@ -401,3 +445,137 @@ def test_compile_context():
         assert len(handler.body.commands) == 3
         assert handler.exception_class_name == "БазоваяОшибка"
         assert handler.exception_inst_name == "err"
+
+
+# Параллельная сборка выражений должна давать тот же результат, что и последовательная
+def test_compile_parallel_matches_sequential(monkeypatch):
+    from config import settings
+    from src.util.build_tools import parallel_compile
+
+    code = """
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ first (a) (
+        ВЕРНУТЬ a * 2;
+    )
+
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test (a, b) (
+        ЗАДАТЬ var = (a + b) * 3 - first(a) ^ 2;
+        ЗАДАТЬ text = "строка";
+        ЕСЛИ var БОЛЬШЕ 10 И НЕ b РАВНО 0 ТО (
+            ВЕРНУТЬ var;
+        )
+        ВЕРНУТЬ first;
+    )
+    """
+
+    def operations(compiled):
+        proc_obj = compiled.compiled_code.get("test")
+        result = []
+
+        for cmd in proc_obj.body.commands:
+            for op in cmd.expression.operations:
+                result.append((type(op).__name__, getattr(op, "value", None), op.name))
+
+        return result
+
+    sequential = operations(compile_string(code))
+
+    monkeypatch.setattr(settings, "compile_workers", 2)
+    monkeypatch.setattr(parallel_compile, "_MIN_JOBS_PER_WORKER", 1)
+    parallel = compile_string(code)
+
+    assert operations(parallel) == sequential
+
+    linked = parallel.compiled_code.get("test").body.commands[-1].expression.operations[0]
+    assert linked.func is parallel.compiled_code.get("first")
+
+
+# Проверка конструктора ждёт построенных RPN стеков и в параллельной компиляции
+def test_compile_parallel_checks_constructor_return(monkeypatch):
+    from config import settings
+    from src.core.exceptions import InvalidSyntaxError
+    from src.util.build_tools import parallel_compile
+
+    code = """
+    ОПРЕДЕЛИТЬ КЛАСС Точка (
+        ОПРЕДЕЛИТЬ КОНСТРУКТОР (ссылка)() (
+            ВЕРНУТЬ 1;
+        )
+    )
+    """
+
+    with pytest.raises(InvalidSyntaxError) as sequential:
+        compile_string(code)
+
+    monkeypatch.setattr(settings, "compile_workers", 2)
+    monkeypatch.setattr(parallel_compile, "_MIN_JOBS_PER_WORKER", 1)
+
+    with pytest.raises(InvalidSyntaxError) as parallel:
+        compile_string(code)
+
+    assert parallel.value.msg == sequential.value.msg
+    assert parallel.value.info == sequential.value.info
+
+
+# Кэш модулей переиспользует разобранные включения и перечитывает изменённые файлы
+def test_module_cache_reuses_and_invalidates(tmp_path):
+    import os
+
+    from src.util.build_tools.preprocessing import Preprocessor, module_cache
+
+    module_path = tmp_path / "модуль.raw"
+    module_path.write_text("ОПРЕДЕЛИТЬ ПРОЦЕДУРУ из_модуля () (\n    ВЕРНУТЬ 1;\n)\n", encoding="utf-8")
+    main_path = str(tmp_path / "главный.raw")
+
+    first = Preprocessor().preprocess("ВКЛЮЧИТЬ модуль", main_path)
+    second = Preprocessor().preprocess("ВКЛЮЧИТЬ модуль", main_path)
+
+    assert [str.__str__(line) for line in first] == [str.__str__(line) for line in second]
+    assert all(a is b for a, b in zip(first, second))
+
+    module_path.write_text("ОПРЕДЕЛИТЬ ПРОЦЕДУРУ из_модуля_2 () (\n    ВЕРНУТЬ 2;\n)\n", encoding="utf-8")
+    stat = module_path.stat()
+    os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    third = Preprocessor().preprocess("ВКЛЮЧИТЬ модуль", main_path)
+
+    assert "из_модуля_2" in third[0]
+    assert module_cache.misses >= 2
+
+
+# Потоковый препроцессор одинаково читает файл и строку
+def test_preprocess_file_matches_string(tmp_path):
+    from src.util.build_tools.preprocessing import Preprocessor
+
+    (tmp_path / "модуль.raw").write_text(
+        "! Модуль\nОПРЕДЕЛИТЬ ПРОЦЕДУРУ из_модуля () ( ! тело\n    ВЕРНУТЬ 1;\n)\n", encoding="utf-8"
+    )
+    main_path = tmp_path / "главный.raw"
+    main_path.write_text(
+        "ВКЛЮЧИТЬ модуль\n"
+        "! Комментарий на всю строку\n"
+        "ОПРЕДЕЛИТЬ ПРОЦЕДУРУ главная () ( ! тело\n"
+        '    ЗАДАТЬ а = "!не комментарий;"; ЗАДАТЬ б = 2; ВЕРНУТЬ а;\n'
+        ")\n",
+        encoding="utf-8"
+    )
+
+    def lines(code) -> list[tuple[str, int, str]]:
+        return [(str.__str__(line), line.num, line.file) for line in Preprocessor().preprocess(code, str(main_path))]
+
+    from_string = lines(main_path.read_text(encoding="utf-8"))
+
+    with open(main_path, "r", encoding="utf-8") as file:
+        assert lines(file) == from_string
+
+    assert [line for line, _, _ in from_string] == [
+        "ОПРЕДЕЛИТЬ ПРОЦЕДУРУ из_модуля () (",
+        "ВЕРНУТЬ 1;",
+        ")",
+        "ОПРЕДЕЛИТЬ ПРОЦЕДУРУ главная () (",
+        'ЗАДАТЬ а = "!не комментарий;";',
+        "ЗАДАТЬ б = 2;",
+        "ВЕРНУТЬ а;",
+        ")",
+    ]
+    assert from_string[1][2].endswith("модуль.raw")
+    assert [num for _, num, _ in from_string[4:7]] == [3, 3, 3]
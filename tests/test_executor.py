@@ -9,6 +9,7 @@ from src.core.types.atomic import (
     String,
     Table,
     convert_py_type_to_atomic_type,
+    render,
 )
 from tests.conftest import run_procedure_for_test
 
@@ -329,3 +330,211 @@ def test_compound_procedure(arg, expected_value):
     })
 
     assert convert_atomic_type_to_py_type(result) == expected_value
+
+
+@pytest.mark.parametrize("iterable,expected_value", [
+    ("массив(1, 2, 3, 4)", [1, 3, 4]),
+    ("числовой_массив(1, 5, 6)", [1]),
+    ('таблица(массив("а", "б"), массив(1, 2))', ["а", "б"]),
+    ("массив()", []),
+])
+def test_for_each_execution(iterable, expected_value):
+    code = f"""
+    ВКЛЮЧИТЬ стандартная_библиотека.*
+
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test () (
+        ЗАДАТЬ результат = массив();
+
+        ДЛЯ КАЖДОГО элемент ИЗ {iterable} (
+            ЕСЛИ элемент РАВНО 2 ТО (
+                ПРОПУСТИТЬ;
+            )
+            ЕСЛИ элемент РАВНО 5 ТО (
+                ПРЕРВАТЬ;
+            )
+
+            ЗАДАТЬ значение = элемент;
+            добавить_в_массив(результат, значение);
+        )
+
+        ВЕРНУТЬ результат;
+    )
+    """
+
+    result = run_procedure_for_test(code, "test")
+
+    assert convert_atomic_type_to_py_type(result) == expected_value
+
+
+@pytest.mark.parametrize("value,expected_value", [
+    ("в_массив(квадраты(4))", [1, 4, 9, 16]),
+    ("в_массив(квадраты(0))", []),
+    ("найти(квадраты(1000000000), больше_десяти)", 16),
+    ("свернуть(квадраты(3), сложить, 0)", 14),
+    ("в_массив(отобразить(квадраты(3), сложить_с_собой))", [2, 8, 18]),
+])
+def test_generator_procedure_execution(value, expected_value):
+    code = f"""
+    ВКЛЮЧИТЬ стандартная_библиотека.*
+
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ квадраты (н) (
+        ЦИКЛ к ОТ 1 ДО н (
+            ОТДАТЬ к * к;
+        )
+    )
+
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ больше_десяти (х) (
+        ВЕРНУТЬ х БОЛЬШЕ 10;
+    )
+
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ сложить (а, б) (
+        ВЕРНУТЬ а + б;
+    )
+
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ сложить_с_собой (х) (
+        ВЕРНУТЬ х + х;
+    )
+
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test () (
+        ВЕРНУТЬ {value};
+    )
+    """
+
+    result = run_procedure_for_test(code, "test")
+
+    assert convert_atomic_type_to_py_type(result) == expected_value
+
+
+def test_generator_procedure_is_single_pass():
+    code = """
+    ВКЛЮЧИТЬ стандартная_библиотека.*
+
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ числа () (
+        ОТДАТЬ 1;
+        ОТДАТЬ 2;
+    )
+
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test () (
+        ЗАДАТЬ посл = числа();
+        ЗАДАТЬ сумма = 0;
+
+        ДЛЯ КАЖДОГО ч ИЗ посл (
+            сумма = сумма + ч;
+        )
+
+        КОНТЕКСТ (
+            в_массив(посл);
+        )
+        ОБРАБОТЧИК ОшибкаЗначения КАК ош (
+            ВЕРНУТЬ сумма;
+        )
+    )
+    """
+
+    result = run_procedure_for_test(code, "test")
+
+    assert convert_atomic_type_to_py_type(result) == 3
+
+
+def test_string_concatenation_in_loop():
+    code = """
+    ВКЛЮЧИТЬ стандартная_библиотека.*
+
+    ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test () (
+        ЗАДАТЬ отчёт = "";
+
+        ЦИКЛ к ОТ 1 ДО 300 (
+            отчёт = отчёт + в_строку(к) + ";";
+        )
+
+        ЗАДАТЬ первая = отчёт + "а";
+        ЗАДАТЬ вторая = отчёт + "б";
+
+        ВЕРНУТЬ массив(длина_строки(отчёт), подстрока(первая, 0, 4), первая + вторая РАВНО отчёт + "а" + отчёт + "б");
+    )
+    """
+
+    result = run_procedure_for_test(code, "test")
+    expected = "".join(f"{i};" for i in range(1, 301))
+
+    assert convert_atomic_type_to_py_type(result) == [len(expected), expected[:4], True]
+
+
+def test_render_collections():
+    cyclic = Array([String("а"), Number(1)])
+    cyclic.append(cyclic)
+    table = Table({String("ключ"): cyclic, String("имя"): String("значение")})
+    cyclic.append(table)
+
+    assert str(cyclic) == '["а", 1, ЦИКЛИЧЕСКАЯ ССЫЛКА, {"ключ": ЦИКЛИЧЕСКАЯ ССЫЛКА, "имя": "значение"}]'
+    assert str(Array([cyclic, cyclic])).count("ЦИКЛИЧЕСКАЯ ССЫЛКА") == 4
+
+    numbers = Array([Number(i) for i in range(10)])
+
+    assert render(numbers, 3) == "[0, 1, 2, ... (ещё 7)]"
+    assert render(Table({String("а"): numbers, String("б"): Boolean(True)}), 1) == '{"а": [0, ... (ещё 9)], ... (ещё 1)}'
+    assert render(String("строка")) == "строка"
+
+    # Глубина вложенности не ограничена глубиной рекурсии Python
+    deep = Array([])
+    for _ in range(50_000):
+        deep = Array([deep])
+
+    assert render(deep) == "[" * 50_001 + "]" * 50_001
+
+
+def test_daemon_client_runs_program(monkeypatch, tmp_path, capfd):
+    import os
+    import subprocess
+    import sys
+    import time
+    from pathlib import Path
+
+    from src.util.build_tools.daemon import is_daemon_supported
+    from src.util.build_tools.daemon_client import main
+
+    if not is_daemon_supported():
+        pytest.skip("Сервер требует fork и передачи дескрипторов через Unix-сокет")
+
+    socket_path = str(tmp_path / "law.sock")
+    program = tmp_path / "программа.raw"
+    program.write_text(
+        'ОПРЕДЕЛИТЬ ПРОЦЕДУРУ главная () (\n    НАПЕЧАТАТЬ "привет от сервера";\n)\n\n'
+        "ВЫПОЛНИТЬ (\n    главная();\n)\n",
+        encoding="utf-8"
+    )
+    failing = tmp_path / "ошибка.raw"
+    failing.write_text("ВЫПОЛНИТЬ (\n    неизвестная();\n)\n", encoding="utf-8")
+
+    monkeypatch.setenv("SERVE_SOCKET_PATH", socket_path)
+    server = subprocess.Popen(
+        [sys.executable, "law.py", "--serve"], cwd=Path(__file__).resolve().parent.parent,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        deadline = time.monotonic() + 60
+
+        while not os.path.exists(socket_path):
+            assert server.poll() is None and time.monotonic() < deadline
+            time.sleep(0.05)
+
+        capfd.readouterr()
+
+        assert main(["law.py", "--client", "--run", str(program)]) == 0
+        assert "привет от сервера" in capfd.readouterr().out
+
+        assert main(["law.py", "--client", "--run", str(failing)]) == 1
+        assert "неизвестная" in capfd.readouterr().out
+
+        assert main(["law.py", "--client", "--serve"]) == 1
+        assert "--serve" in capfd.readouterr().err
+        assert main(["law.py", "--client", "--client", "--run", str(program)]) == 1
+        assert "--client" in capfd.readouterr().err
+
+        # Сервер продолжает обслуживать запросы на своём сокете
+        assert main(["law.py", "--client", "--run", str(program)]) == 0
+        assert "привет от сервера" in capfd.readouterr().out
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
@@ -69,3 +69,367 @@ def test_cast_to_bool(value, expected_type, expected_value):
 
     assert result_py == expected_py, \
         f"Expected value {expected_py!r}, got {result_py!r}"
+
+
+numeric_array_template = """
+ВКЛЮЧИТЬ стандартная_библиотека.*
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test () (
+    ЗАДАТЬ числа = числовой_массив(3, 1, 2);
+
+    ВЕРНУТЬ {value};
+)
+"""
+
+numeric_array_data = [
+    ("числа", [3, 1, 2]),
+    ("сумма_массива(числа)", 6),
+    ("сортировать_массив(числа)", [1, 2, 3]),
+    ("сортировать_массив(числа, ИСТИНА)", [3, 2, 1]),
+    ("минимум_массива(числа)", 1),
+    ("максимум_массива(числа)", 3),
+    ("среднее_массива(числа)", 2),
+    ("минимум_массива(массив(5, 4))", 4),
+    ("достать_из_массива(числа, 1)", 1),
+    ("длина_массива(числовой_массив(массив(1, 2)))", 2),
+    ("сложить_массивы(числа, числовой_массив(1, 1, 1))", [4, 2, 3]),
+    ("вычесть_массивы(числа, 1)", [2, 0, 1]),
+    ("умножить_массивы(числа, 0.5)", [1.5, 0.5, 1]),
+    ("разделить_массивы(числа, массив(3, 2, 4))", [1, 0.5, 0.5]),
+]
+
+
+@pytest.mark.parametrize("value,expected", numeric_array_data)
+def test_numeric_array(value, expected):
+    result = run_procedure_for_test(numeric_array_template.format(value=value), "test")
+
+    assert convert_atomic_type_to_py_type(result) == expected
+
+
+def test_numeric_array_stores_raw_numbers():
+    from src.core.exceptions import ErrorType
+    from src.core.types.atomic import NumericArray, Number, String
+
+    numbers = NumericArray([Number(1), Number(2)])
+    assert numbers.buffer.typecode == "q"
+
+    numbers.append(Number(2.5))
+    assert numbers.buffer.typecode == "d"
+    assert numbers.buffer.tolist() == [1.0, 2.0, 2.5]
+    assert isinstance(numbers[2], Number)
+
+    with pytest.raises(ErrorType):
+        numbers.append(String("три"))
+
+
+structures_template = """
+ВКЛЮЧИТЬ стандартная_библиотека.*
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ удвоить (х) (
+    ВЕРНУТЬ х * 2;
+)
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test () (
+    ЗАДАТЬ список = Список(массив(3, 1, 2));
+    ЗАДАТЬ словарь = Словарь(массив("а"), массив(1));
+    ЗАДАТЬ очередь = Очередь(2);
+    ЗАДАТЬ множество = Множество(массив("а", "б", "а", 1));
+
+    {value}
+)
+"""
+
+structures_data = [
+    ("ВЕРНУТЬ список:длина();", 3),
+    ("ВЕРНУТЬ список:сортировать();", [1, 2, 3]),
+    ("ВЕРНУТЬ список:достать();", 3),
+    ("ВЕРНУТЬ список:достать(-1);", 2),
+    ("список:добавить(4); ВЕРНУТЬ список:в_массив();", [3, 1, 2, 4]),
+    ("список:удалить(0); ВЕРНУТЬ список:в_массив();", [1, 2]),
+    ("список:для_каждого(удвоить); ВЕРНУТЬ список:в_массив();", [6, 2, 4]),
+    ("ВЕРНУТЬ получить_тип(список);", "Список"),
+    ('словарь:добавить("б", 2); ВЕРНУТЬ словарь:длина();', 2),
+    ('ВЕРНУТЬ словарь:достать("а");', 1),
+    ('словарь:удалить("а"); ВЕРНУТЬ словарь:длина();', 0),
+    ("очередь:положить(1); очередь:положить(2); ВЕРНУТЬ очередь:переполнена();", True),
+    ("очередь:положить(1); очередь:положить(2); ВЕРНУТЬ очередь:взять();", 1),
+    ("ВЕРНУТЬ очередь:пуста();", True),
+    ("ВЕРНУТЬ множество:в_массив();", ["а", "б", 1]),
+    ('ВЕРНУТЬ множество:содержит("б");', True),
+    ("ВЕРНУТЬ множество:содержит(2);", False),
+    ('множество:добавить("б"); множество:добавить(2); ВЕРНУТЬ множество:длина();', 4),
+    ('множество:удалить("а"); множество:удалить("я"); ВЕРНУТЬ множество:в_массив();', ["б", 1]),
+    ('ЗАДАТЬ р = множество:объединение(Множество(массив(1, "в"))); ВЕРНУТЬ р:в_массив();', ["а", "б", 1, "в"]),
+    ('ЗАДАТЬ р = множество:пересечение(Множество(массив(1, "в", "а"))); ВЕРНУТЬ р:в_массив();', ["а", 1]),
+    ('ЗАДАТЬ р = множество:разность(Множество(массив(1))); ВЕРНУТЬ р:в_массив();', ["а", "б"]),
+    ("ЗАДАТЬ р = Множество(диапазон_чисел(1, 3)); ВЕРНУТЬ р:длина();", 3),
+]
+
+
+@pytest.mark.parametrize("value,expected", structures_data)
+def test_native_structures(value, expected):
+    result = run_procedure_for_test(structures_template.format(value=value), "test")
+
+    assert convert_atomic_type_to_py_type(result) == expected
+
+
+@pytest.mark.parametrize("value,error", [
+    ("очередь:положить(1); очередь:положить(2); очередь:положить(3);", "ОчередьПолна"),
+    ("очередь:взять();", "ОчередьПуста"),
+    ("список:достать(1, 2);", "ОшибкаАргумента"),
+    ("множество:добавить(массив());", "ОшибкаТипа"),
+    ("множество:объединение(массив());", "ОшибкаТипа"),
+])
+def test_native_structures_errors(value, error):
+    from src.core.exceptions import BaseError
+
+    with pytest.raises(BaseError) as exc:
+        run_procedure_for_test(structures_template.format(value=value), "test")
+
+    assert exc.value.exc_name == error
+
+
+higher_order_template = """
+ВКЛЮЧИТЬ стандартная_библиотека.*
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ удвоить (х) (
+    ЗАДАТЬ результат = х * 2;
+
+    ВЕРНУТЬ результат;
+)
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ больше_двух (х) (
+    ВЕРНУТЬ х БОЛЬШЕ 2;
+)
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ сложить (а, б) (
+    ВЕРНУТЬ а + б;
+)
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test () (
+    ЗАДАТЬ числа = массив(1, 2, 3, 4);
+
+    ВЕРНУТЬ {value};
+)
+"""
+
+higher_order_data = [
+    ("отобразить(числа, удвоить)", [2, 4, 6, 8]),
+    ("отобразить(числовой_массив(1, 2), удвоить)", [2, 4]),
+    ("отобразить(числа, в_строку)", ["1", "2", "3", "4"]),
+    ("отфильтровать(числа, больше_двух)", [3, 4]),
+    ("свернуть(числа, сложить, 10)", 20),
+    ("свернуть(массив(), сложить, 10)", 10),
+    ("найти(числа, больше_двух)", 3),
+    ("найти(массив(1), больше_двух)", None),
+    ("любой(числа, больше_двух)", True),
+    ("все(числа, больше_двух)", False),
+    ("все(массив(), больше_двух)", True),
+]
+
+
+@pytest.mark.parametrize("value,expected", higher_order_data)
+def test_higher_order_procedures(value, expected):
+    result = run_procedure_for_test(higher_order_template.format(value=value), "test")
+
+    assert convert_atomic_type_to_py_type(result) == expected
+
+
+lazy_sequence_data = [
+    ("в_массив(диапазон_чисел(1, 5))", [1, 2, 3, 4, 5]),
+    ("в_массив(диапазон_чисел(1, 10, 4))", [1, 5, 9]),
+    ("в_массив(диапазон_чисел(5, 1, -2))", [5, 3, 1]),
+    ("в_массив(диапазон_чисел(5, 1))", []),
+    ("в_массив(отобразить(диапазон_чисел(1, 3), удвоить))", [2, 4, 6]),
+    ("в_массив(отфильтровать(диапазон_чисел(1, 5), больше_двух))", [3, 4, 5]),
+    ("свернуть(диапазон_чисел(1, 100), сложить, 0)", 5050),
+    ("найти(отобразить(диапазон_чисел(1, 1000000000), удвоить), больше_двух)", 4),
+    ("любой(диапазон_чисел(1, 1000000000), больше_двух)", True),
+    ("в_массив(числа)", [1, 2, 3, 4]),
+]
+
+
+@pytest.mark.parametrize("value,expected", lazy_sequence_data)
+def test_lazy_sequences(value, expected):
+    result = run_procedure_for_test(higher_order_template.format(value=value), "test")
+
+    assert convert_atomic_type_to_py_type(result) == expected
+
+
+@pytest.mark.parametrize("value,error", [
+    ("диапазон_чисел(1, 5, 0)", "ОшибкаЗначения"),
+    ("диапазон_чисел(1, 2.5)", "ОшибкаЗначения"),
+    ("в_массив(5)", "ОшибкаЗначения"),
+    ("строки_файла(\"несуществующий_файл.txt\")", "ОшибкаФайла"),
+])
+def test_lazy_sequences_errors(value, error):
+    from src.core.exceptions import BaseError
+
+    with pytest.raises(BaseError) as exc:
+        run_procedure_for_test(higher_order_template.format(value=value), "test")
+
+    assert exc.value.exc_name == error
+
+
+def test_file_lines(tmp_path):
+    path = tmp_path / "строки.txt"
+    path.write_text("первая\nвторая\n", encoding="utf-8")
+
+    result = run_procedure_for_test(higher_order_template.format(value=f'в_массив(строки_файла("{path}"))'), "test")
+
+    assert convert_atomic_type_to_py_type(result) == ["первая", "вторая"]
+
+
+string_builder_template = """
+ВКЛЮЧИТЬ стандартная_библиотека.*
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test () (
+    ЗАДАТЬ буфер = СтроковыйБуфер("отчёт:");
+
+    буфер:добавить(" строка");
+    буфер:добавить(1);
+
+    ВЕРНУТЬ {value};
+)
+"""
+
+string_builder_data = [
+    ("буфер:в_строку()", "отчёт: строка1"),
+    ("буфер:длина()", 14),
+    ("длина_строки(буфер:в_строку())", 14),
+    ("получить_тип(буфер)", "СтроковыйБуфер"),
+]
+
+
+@pytest.mark.parametrize("value,expected", string_builder_data)
+def test_string_builder(value, expected):
+    result = run_procedure_for_test(string_builder_template.format(value=value), "test")
+
+    assert convert_atomic_type_to_py_type(result) == expected
+
+
+
+table_template = """
+ВКЛЮЧИТЬ стандартная_библиотека.*
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test () (
+    ЗАДАТЬ тбл = таблица(массив("а", "б"), массив(1, 2));
+
+    {value}
+)
+"""
+
+table_data = [
+    ('ВЕРНУТЬ извлечь_из_таблицы(тбл, "б");', 2),
+    ('добавить_в_таблицу(тбл, "в", 3); ВЕРНУТЬ извлечь_из_таблицы(тбл, "в");', 3),
+    ('ВЕРНУТЬ есть_ключ_в_таблице(тбл, "а");', True),
+    ('ВЕРНУТЬ есть_ключ_в_таблице(тбл, "я");', False),
+    ('удалить_из_таблицы(тбл, "а"); удалить_из_таблицы(тбл, "я"); ВЕРНУТЬ тбл;', {"б": 2}),
+]
+
+
+@pytest.mark.parametrize("value,expected", table_data)
+def test_table(value, expected):
+    result = run_procedure_for_test(table_template.format(value=value), "test")
+
+    assert convert_atomic_type_to_py_type(result) == expected
+
+
+def test_table_stores_raw_keys():
+    import pickle
+
+    from src.core.types.atomic import Number, String, Table
+
+    table = Table({String("а"): Number(1), Number(2): Number(3)})
+
+    assert list(table.value) == ["а", 2]
+    assert table[String("а")] is table["а"]
+    assert [type(key) for key in table.keys()] == [String, Number]
+    assert str(table) == '{"а": 1, "2": 3}'
+
+    # Таблицы из старых .law файлов хранят ключи обёртками String
+    legacy = Table()
+    legacy.value = {String("а"): Number(1)}
+    restored = pickle.loads(pickle.dumps(legacy))
+
+    assert list(restored.value) == ["а"]
+
+
+copy_template = """
+ВКЛЮЧИТЬ стандартная_библиотека.*
+
+
+ОПРЕДЕЛИТЬ КЛАСС Точка (
+    ОПРЕДЕЛИТЬ КОНСТРУКТОР (ссылка)(координаты) (
+        ссылка:координаты = координаты;
+    )
+)
+
+
+ОПРЕДЕЛИТЬ ПРОЦЕДУРУ test () (
+    ЗАДАТЬ тбл = таблица(массив("а"), массив(массив(1)));
+    ЗАДАТЬ точка = Точка(массив(2));
+    ЗАДАТЬ список = Список(массив(3));
+    ЗАДАТЬ копия = копировать(массив(тбл, точка, список));
+
+    ЗАДАТЬ копия_тбл = достать_из_массива(копия, 0);
+    ЗАДАТЬ копия_точки = достать_из_массива(копия, 1);
+    ЗАДАТЬ копия_списка = достать_из_массива(копия, 2);
+
+    добавить_в_массив(извлечь_из_таблицы(копия_тбл, "а"), 10);
+    добавить_в_массив(копия_точки:координаты, 20);
+    копия_списка:добавить(30);
+
+    ВЕРНУТЬ {value};
+)
+"""
+
+copy_data = [
+    ('извлечь_из_таблицы(тбл, "а")', [1]),
+    ("точка:координаты", [2]),
+    ("список:в_массив()", [3]),
+    ('извлечь_из_таблицы(копия_тбл, "а")', [1, 10]),
+    ("копия_точки:координаты", [2, 20]),
+    ("копия_списка:в_массив()", [3, 30]),
+    ("получить_тип(копия_точки)", "Точка"),
+]
+
+
+@pytest.mark.parametrize("value,expected", copy_data)
+def test_deep_copy(value, expected):
+    result = run_procedure_for_test(copy_template.format(value=value), "test")
+
+    assert convert_atomic_type_to_py_type(result) == expected
+
+
+def test_copy_protocol():
+    from src.core.types.atomic import Array, NumericArray, Number, String, Table
+
+    inner = Array([Number(1)])
+    outer = Array([inner, inner, String("строка")])
+    outer.append(outer)
+
+    shallow = outer.copy_value()
+    assert shallow.value is not outer.value and shallow[0] is inner
+
+    deep = outer.deepcopy_value({})
+    assert deep[0] is not inner and deep[0] is deep[1]
+    assert deep[2] is outer[2]
+    assert deep[3] is deep
+
+    numbers = NumericArray([Number(1), Number(2)])
+    numbers_copy = numbers.copy_value()
+    numbers_copy.append(Number(3))
+    assert numbers.buffer.tolist() == [1, 2]
+
+    table = Table({String("ключ"): inner})
+    assert table.deepcopy_value({})["ключ"] is not inner